@@ -0,0 +1,143 @@
+"""Resource-script runner for unattended Kotosploit sessions"""
+
+import contextvars
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from colorama import Fore, Style
+from core.console import KotosploitConsole
+from core.jobs import JobOutput, capture_output
+from core.output import get_writer
+
+BLOCK_SEPARATOR = "---"
+
+def parse_script(text: str) -> List[List[str]]:
+    """Split a resource script into blocks of commands.
+    
+    Lines starting with '#' are comments. A line containing only '---' ends the current
+    block; blocks share no state and may run in parallel.
+    """
+    blocks = [[]]
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line == BLOCK_SEPARATOR:
+            blocks.append([])
+        else:
+            blocks[-1].append(line)
+    return [block for block in blocks if block]
+
+
+class BatchRunner:
+    def __init__(self, blocks: List[List[str]], workers: int = 4):
+        self.blocks = blocks
+        self.workers = max(1, min(workers, len(blocks) or 1))
+    
+    def run(self) -> Dict[str, Any]:
+        started = time.time()
+        if self.workers == 1:
+            results = [self._run_block(index, block) for index, block in enumerate(self.blocks, 1)]
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(self._run_captured, index, block)
+                           for index, block in enumerate(self.blocks, 1)]
+                results = []
+                # Captured output is written out in block order so parallel blocks never interleave
+                for future in futures:
+                    result, output = future.result()
+                    sys.stdout.write(f"{Fore.WHITE}{'='*20} block {result['block']} {'='*20}{Style.RESET_ALL}\n")
+                    sys.stdout.write(output)
+                    sys.stdout.flush()
+                    results.append(result)
+        
+        modules = [module for result in results for module in result["modules"]]
+        return {
+            "success": all(result["success"] for result in results),
+            "blocks": results,
+            "modules_run": len(modules),
+            "modules_failed": sum(1 for module in modules if not module["success"]),
+            "elapsed": round(time.time() - started, 3)
+        }
+    
+    def _run_captured(self, index: int, block: List[str]):
+        output = JobOutput()
+        
+        def target():
+            capture_output(output)
+            return self._run_block(index, block)
+        
+        result = contextvars.Context().run(target)
+        return result, output.text()
+    
+    def _run_block(self, index: int, block: List[str]) -> Dict[str, Any]:
+        console = KotosploitConsole()
+        started = time.time()
+        executed = 0
+        errors = []
+        
+        for command in block:
+            print(f"{Fore.RED}kotosploit{Style.RESET_ALL} > {command}")
+            executed += 1
+            try:
+                # Unknown commands and use/set/run that did nothing (no such module, missing option)
+                if not console.process_command(command):
+                    errors.append(f"Failed: {command}")
+            except SystemExit:
+                break
+            except Exception as e:
+                errors.append(f"{command}: {e}")
+        
+        # Background jobs started with 'run -j' record their result in console.results when they
+        # finish; what they printed was captured by the job and belongs in the block's output
+        console.jobs.wait()
+        for job in console.jobs.list_jobs():
+            print(f"{Fore.WHITE}{'-'*20} job {job.id} ({job.module_path}) {'-'*20}{Style.RESET_ALL}")
+            sys.stdout.write(job.output.text())
+        modules = list(console.results)
+        
+        return {
+            "block": index,
+            "commands": executed,
+            "success": not errors and all(module["success"] for module in modules),
+            "errors": errors,
+            "modules": modules,
+            "elapsed": round(time.time() - started, 3)
+        }
+
+
+def run_script(path: str, workers: int = 4) -> int:
+    """Run a resource script ('-' reads stdin) and print a JSON summary; returns the exit code.
+    
+    Module output goes to stderr so stdout carries only the summary. In JSON Lines mode the
+    summary is written as the last record instead.
+    """
+    try:
+        if path == '-':
+            text = sys.stdin.read()
+        else:
+            with open(path, 'r') as f:
+                text = f.read()
+    except OSError as e:
+        print(f"{Fore.RED}[!] Cannot read resource script: {e}{Style.RESET_ALL}", file=sys.stderr)
+        return 2
+    
+    writer = get_writer()
+    summary_stream = sys.stdout
+    if not writer:
+        # JSON Lines mode has already moved human output to stderr
+        sys.stdout = sys.stderr
+    try:
+        summary = BatchRunner(parse_script(text), workers).run()
+    finally:
+        sys.stdout = summary_stream
+    
+    summary["script"] = path
+    if writer:
+        writer.write({"event": "summary", **summary})
+    else:
+        summary_stream.write(json.dumps(summary, indent=2, default=str) + "\n")
+        summary_stream.flush()
+    return 0 if summary["success"] else 1
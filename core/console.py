@@ -1,11 +1,22 @@
 """Main console framework for Kotosploit"""
 
+import json
 import os
 import sys
+import time
 from colorama import Fore, Style, init
 from core.banner import display_banner
+from core.jobs import JobManager
 from core.module_loader import ModuleLoader
+from core.output import OUTPUT_MODES, disable_jsonl, enable_jsonl, get_writer
 from modules.base import BaseModule
+from modules.events import Finding
+from utils.advanced_reporter import AdvancedReporter
+from utils.checkpoint import CheckpointManager
+from utils.config import Config
+from utils.findings import FindingsStore
+from utils.progress import ProgressRenderer
+from utils.session import SessionManager, session_filename
 
 init(autoreset=True)
 
@@ -13,9 +24,17 @@ class KotosploitConsole:
     def __init__(self):
         self.loader = ModuleLoader()
         self.current_module = None
+        self.current_module_path = None
+        self.jobs = JobManager()
+        self.results = []
+        self.session = SessionManager()
+        self.reporter = AdvancedReporter()
+        self.findings = FindingsStore(Config().get("findings.database", "./sessions/findings.db"))
+        self.metrics_exporter = None
+        self._start_metrics_export()
         self.prompt = f"{Fore.RED}kotosploit{Style.RESET_ALL} > "
         self.running = True
-        
+    
     def run(self):
         display_banner()
         while self.running:
@@ -36,7 +55,7 @@ class KotosploitConsole:
                 self.running = False
                 print("\nExiting...")
     
-    def process_command(self, cmd: str):
+    def process_command(self, cmd: str) -> bool:
         parts = cmd.split(maxsplit=1)
         command = parts[0].lower()
         args = parts[1] if len(parts) > 1 else ""
@@ -47,10 +66,19 @@ class KotosploitConsole:
             "use": self.cmd_use,
             "back": self.cmd_back,
             "info": self.cmd_info,
+            "search": self.cmd_search,
             "set": self.cmd_set,
             "options": self.cmd_options,
             "run": self.cmd_run,
             "exploit": self.cmd_run,
+            "resume": self.cmd_resume,
+            "jobs": self.cmd_jobs,
+            "startup": self.cmd_startup,
+            "session": self.cmd_session,
+            "findings": self.cmd_findings,
+            "diff": self.cmd_diff,
+            "stats": self.cmd_stats,
+            "report": self.cmd_report,
             "exit": self.cmd_exit,
             "quit": self.cmd_exit,
             "banner": self.cmd_banner,
@@ -58,9 +86,10 @@ class KotosploitConsole:
         }
         
         if command in commands:
-            commands[command](args)
-        else:
-            print(f"{Fore.RED}[!] Unknown command: {command}{Style.RESET_ALL}")
+            # Commands that can fail (use, set, run) return False; the rest return nothing
+            return commands[command](args) is not False
+        print(f"{Fore.RED}[!] Unknown command: {command}{Style.RESET_ALL}")
+        return False
     
     def cmd_help(self, args):
         help_text = f"""
@@ -68,12 +97,43 @@ class KotosploitConsole:
 {Fore.WHITE}{'='*60}{Style.RESET_ALL}
   help              Display this help menu
   show modules      List all available modules
+  search <term>     Search modules by name or description
   use <module>      Select a module to use
   back              Deselect current module
-  info              Show module information
+  info [module]     Show module information
   set <opt> <val>   Set module option
+  set OUTPUT jsonl [file]
+                    Emit findings and module results as JSON Lines
+  set OUTPUT text   Back to colored text output
   options           Show module options
   run/exploit       Execute the current module
+  run -j            Execute the current module as a background job
+  jobs              List background jobs
+  jobs -k <id>      Kill a background job
+  jobs -o <id>      Show a background job's output
+  resume [id]       List checkpoints or resume an interrupted scan
+  session           Show the current session
+  session save [name]
+                    Compact the session journal (optionally under a new name)
+  session load <name>
+                    Continue a saved session
+  session convert <name>
+                    Convert a legacy .kts (pickle) session to the journal format
+  session list      List saved sessions
+  findings [-t type] [-h host] [-m module] [-p param] [-s since] [-l limit]
+                    Query recorded findings (e.g. findings -t sqli -h example.com)
+  diff <baseline> [current] [-o file]
+                    Compare findings of two sessions/reports (default current: this session)
+  report [name] [-z]
+                    Write JSON/CSV/XML/HTML reports for this session (-z: gzip)
+  stats             Requests, errors, bytes, latency and findings per module and host
+  stats reset       Start counting from zero
+  stats export <file> [interval]
+                    Keep a Prometheus text file up to date (default every 15s)
+  stats serve [port]
+                    Serve Prometheus metrics on 127.0.0.1:<port>/metrics
+  stats stop        Stop exporting metrics
+  startup [module]  Report console (or module) cold-start import time
   banner            Display banner again
   clear             Clear screen
   exit/quit         Exit Kotosploit
@@ -111,63 +171,117 @@ class KotosploitConsole:
     
     def cmd_show(self, args):
         if args == "modules":
-            modules = self.loader.list_modules()
             print(f"\n{Fore.YELLOW}Available Modules{Style.RESET_ALL}")
             print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
-            for path in sorted(modules.keys()):
-                print(f"  {Fore.GREEN}{path}{Style.RESET_ALL}")
-            print()
+            self._print_module_list(sorted(self.loader.list_modules()))
         else:
             print(f"{Fore.RED}[!] Usage: show modules{Style.RESET_ALL}")
     
     def cmd_use(self, args):
         if not args:
             print(f"{Fore.RED}[!] Usage: use <module_path>{Style.RESET_ALL}")
-            return
+            return False
         
         module = self.loader.get_module(args)
         if module:
             self.current_module = module
+            self.current_module_path = args
             print(f"{Fore.GREEN}[+] Loaded module: {args}{Style.RESET_ALL}")
-        else:
-            print(f"{Fore.RED}[!] Module not found: {args}{Style.RESET_ALL}")
+            return True
+        print(f"{Fore.RED}[!] Module not found: {args}{Style.RESET_ALL}")
+        return False
     
     def cmd_back(self, args):
         if self.current_module:
             self.current_module = None
+            self.current_module_path = None
             print(f"{Fore.GREEN}[+] Deselected module{Style.RESET_ALL}")
         else:
             print(f"{Fore.YELLOW}[*] No module selected{Style.RESET_ALL}")
     
+    def cmd_search(self, args):
+        if not args:
+            print(f"{Fore.RED}[!] Usage: search <term>{Style.RESET_ALL}")
+            return
+        
+        matches = self.loader.search(args)
+        if not matches:
+            print(f"{Fore.YELLOW}[*] No modules matching: {args}{Style.RESET_ALL}")
+            return
+        print(f"\n{Fore.YELLOW}Matching Modules{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        self._print_module_list(matches)
+    
+    def _print_module_list(self, paths):
+        for path in paths:
+            description = self.loader.get_metadata(path)["description"]
+            print(f"  {Fore.GREEN}{path:<28}{Style.RESET_ALL} {description}")
+        print()
+    
     def cmd_info(self, args):
-        if not self.current_module:
+        if args:
+            # Answered from the metadata index, so the module is not imported
+            metadata = self.loader.get_metadata(args)
+            if not metadata:
+                print(f"{Fore.RED}[!] Module not found: {args}{Style.RESET_ALL}")
+                return
+            info = metadata
+        elif self.current_module:
+            info = self.current_module.get_info()
+        else:
             print(f"{Fore.RED}[!] No module selected{Style.RESET_ALL}")
             return
         
-        info = self.current_module.get_info()
         print(f"\n{Fore.YELLOW}Module Information{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         print(f"  Name:        {Fore.CYAN}{info['name']}{Style.RESET_ALL}")
         print(f"  Type:        {Fore.CYAN}{info['type']}{Style.RESET_ALL}")
         print(f"  Description: {Fore.CYAN}{info['description']}{Style.RESET_ALL}")
         print(f"  Author:      {Fore.CYAN}{info['author']}{Style.RESET_ALL}")
+        print(f"  Version:     {Fore.CYAN}{info.get('version', '1.0')}{Style.RESET_ALL}")
+        if args:
+            print(f"\n  {Fore.CYAN}{'Name':<15} {'Default':<25} {'Required'}{Style.RESET_ALL}")
+            print(f"  {'-'*15} {'-'*25} {'-'*8}")
+            for name, value in info["options"].items():
+                required = "yes" if name in info["required"] else "no"
+                print(f"  {name:<15} {'' if value is None else str(value):<25} {required}")
         print()
     
     def cmd_set(self, args):
+        parts = args.split()
+        # OUTPUT jsonl/text is a console setting; other OUTPUT values belong to the module
+        if len(parts) >= 2 and parts[0].upper() == "OUTPUT" and parts[1].lower() in OUTPUT_MODES:
+            return self._set_output(parts[1].lower(), parts[2] if len(parts) > 2 else None)
+        
         if not self.current_module:
             print(f"{Fore.RED}[!] No module selected{Style.RESET_ALL}")
-            return
+            return False
         
         parts = args.split(maxsplit=1)
         if len(parts) != 2:
             print(f"{Fore.RED}[!] Usage: set <option> <value>{Style.RESET_ALL}")
-            return
+            return False
         
         option, value = parts
         if self.current_module.set_option(option, value):
             print(f"{Fore.GREEN}[+] {option.upper()} => {value}{Style.RESET_ALL}")
-        else:
-            print(f"{Fore.RED}[!] Invalid option: {option}{Style.RESET_ALL}")
+            return True
+        print(f"{Fore.RED}[!] Invalid option: {option}{Style.RESET_ALL}")
+        return False
+    
+    def _set_output(self, mode, path):
+        if mode == "text":
+            disable_jsonl()
+            print(f"{Fore.GREEN}[+] OUTPUT => text{Style.RESET_ALL}")
+            return True
+        
+        try:
+            enable_jsonl(path)
+        except OSError as e:
+            print(f"{Fore.RED}[!] Cannot open {path}: {e}{Style.RESET_ALL}")
+            return False
+        print(f"{Fore.GREEN}[+] OUTPUT => jsonl ({path or 'stdout'}){Style.RESET_ALL}")
+        return True
     
     def cmd_options(self, args):
         if not self.current_module:
@@ -184,22 +298,162 @@ class KotosploitConsole:
         print()
     
     def cmd_run(self, args):
+        """False when nothing ran; a module that ran and failed is reported in its result instead"""
         if not self.current_module:
             print(f"{Fore.RED}[!] No module selected{Style.RESET_ALL}")
-            return
+            return False
         
         valid, msg = self.current_module.validate_options()
         if not valid:
             print(f"{Fore.RED}[!] {msg}{Style.RESET_ALL}")
-            return
+            return False
+        
+        if args.strip() == "-j":
+            return self._run_job()
         
         print(f"{Fore.YELLOW}[*] Running module...{Style.RESET_ALL}\n")
+        module_path = self.current_module_path
+        renderer = ProgressRenderer()
         try:
-            result = self.current_module.run()
+            result = self.current_module.collect(self._event_handler(module_path, renderer))
+            renderer.close()
             if result:
                 self._display_results(result)
+            self._record_result(module_path, self.current_module, result or {})
         except Exception as e:
+            renderer.close()
             print(f"{Fore.RED}[!] Error: {e}{Style.RESET_ALL}")
+            self._record_result(module_path, self.current_module, {"success": False, "message": f"Error: {e}"})
+        return True
+    
+    def cmd_resume(self, args):
+        manager = CheckpointManager()
+        
+        if not args:
+            checkpoints = manager.list_checkpoints()
+            if not checkpoints:
+                print(f"{Fore.YELLOW}[*] No checkpoints found{Style.RESET_ALL}")
+                return
+            print(f"\n{Fore.YELLOW}Checkpoints{Style.RESET_ALL}")
+            print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+            for checkpoint in checkpoints:
+                print(f"  {Fore.GREEN}{checkpoint['id']:<35}{Style.RESET_ALL} {checkpoint['updated']}")
+            print()
+            return
+        
+        checkpoint = manager.load(args)
+        if not checkpoint:
+            print(f"{Fore.RED}[!] Checkpoint not found: {args}{Style.RESET_ALL}")
+            return
+        
+        module_path = next((key for key, path in self.loader.list_modules().items()
+                            if path == checkpoint["module"]), None)
+        module = self.loader.get_module(module_path) if module_path else None
+        if not module:
+            print(f"{Fore.RED}[!] Module not found: {checkpoint['module']}{Style.RESET_ALL}")
+            return
+        
+        for option, value in checkpoint["options"].items():
+            module.set_option(option, value)
+        module.resume_state = checkpoint
+        self.current_module = module
+        self.current_module_path = module_path
+        print(f"{Fore.GREEN}[+] Resuming {module_path} from checkpoint {checkpoint['id']}{Style.RESET_ALL}")
+        self.cmd_run("")
+    
+    def _event_handler(self, module_path, renderer):
+        """Findings go to the session and reporter the moment a module yields them"""
+        def handle(event):
+            if isinstance(event, Finding):
+                event.module = event.module or module_path
+                self.session.add_finding(event.to_dict())
+                self.findings.add(event.to_dict(), self.session.session_id)
+                self.reporter.add_vulnerability(event.to_dict())
+                writer = get_writer()
+                if writer:
+                    writer.finding(event)
+            renderer.handle(event)
+        return handle
+    
+    def _record_result(self, module_path, module, result):
+        target = next((module.get_option(name) for name in ("URL", "TARGET", "DOMAIN")
+                       if module.get_option(name)), "")
+        if target:
+            self.session.add_target(target)
+            self.reporter.add_target(target)
+        self.session.add_module_usage(module_path, dict(module.options))
+        self.session.add_result(module_path, result)
+        self.reporter.add_module_execution(module_path, target, result)
+        self.results.append({
+            "module": module_path,
+            "success": bool(result.get("success")),
+            "message": result.get("message", "")
+        })
+        writer = get_writer()
+        if writer:
+            writer.completion(module_path, target, result)
+    
+    def _run_job(self):
+        # Jobs get their own instance so the selected module can be reconfigured while they run
+        module = self.loader.get_module(self.current_module_path)
+        if not module:
+            print(f"{Fore.RED}[!] Module not found: {self.current_module_path}{Style.RESET_ALL}")
+            return False
+        module.options = dict(self.current_module.options)
+        module.resume_state = self.current_module.resume_state
+        self.current_module.resume_state = None
+        
+        module_path = self.current_module_path
+        renderer = ProgressRenderer()
+        
+        def on_finish(result):
+            renderer.close()
+            self._record_result(module_path, module, result)
+        
+        job = self.jobs.start(module_path, module, on_event=self._event_handler(module_path, renderer),
+                              on_finish=on_finish)
+        print(f"{Fore.GREEN}[+] Started job {job.id}: {self.current_module_path}{Style.RESET_ALL}")
+        return True
+    
+    def cmd_jobs(self, args):
+        parts = args.split()
+        if not parts:
+            jobs = self.jobs.list_jobs()
+            if not jobs:
+                print(f"{Fore.YELLOW}[*] No background jobs{Style.RESET_ALL}")
+                return
+            print(f"\n{Fore.YELLOW}Jobs{Style.RESET_ALL}")
+            print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+            print(f"  {Fore.CYAN}{'Id':<5} {'Module':<28} {'Status':<11} {'Elapsed'}{Style.RESET_ALL}")
+            print(f"  {'-'*5} {'-'*28} {'-'*11} {'-'*7}")
+            for job in jobs:
+                status = "killing" if job.status == "running" and job.cancel_event.is_set() else job.status
+                print(f"  {job.id:<5} {job.module_path:<28} {status:<11} {job.elapsed:.1f}s")
+            print()
+            return
+        
+        if len(parts) != 2 or parts[0] not in ("-k", "-o") or not parts[1].isdigit():
+            print(f"{Fore.RED}[!] Usage: jobs [-k <id> | -o <id>]{Style.RESET_ALL}")
+            return
+        
+        job = self.jobs.get(int(parts[1]))
+        if not job:
+            print(f"{Fore.RED}[!] Job not found: {parts[1]}{Style.RESET_ALL}")
+            return
+        
+        if parts[0] == "-k":
+            if self.jobs.kill(job.id):
+                print(f"{Fore.YELLOW}[*] Stopping job {job.id}...{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.YELLOW}[*] Job {job.id} is not running ({job.status}){Style.RESET_ALL}")
+        else:
+            print(f"\n{Fore.YELLOW}Output of job {job.id} ({job.module_path}, {job.status}){Style.RESET_ALL}")
+            print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+            print(job.output.text())
+            if job.result:
+                self._display_results(job.result)
+            elif job.error:
+                print(f"{Fore.RED}[!] Error: {job.error}{Style.RESET_ALL}")
     
     def _display_results(self, result):
         if result.get("success"):
@@ -210,7 +464,237 @@ class KotosploitConsole:
         if result.get("message"):
             print(f"{Fore.CYAN}{result['message']}{Style.RESET_ALL}")
     
+    def cmd_session(self, args):
+        parts = args.split()
+        if not parts:
+            self.session.show_session_info()
+        elif parts[0] == "save" and len(parts) <= 2:
+            self.session.save_session(parts[1] if len(parts) == 2 else None)
+        elif parts[0] == "load" and len(parts) == 2:
+            self.session.load_session(parts[1])
+        elif parts[0] == "convert" and len(parts) == 2:
+            self.session.convert_session(parts[1])
+        elif parts == ["list"]:
+            sessions = self.session.list_sessions()
+            if not sessions:
+                print(f"{Fore.YELLOW}[*] No saved sessions{Style.RESET_ALL}")
+                return
+            print(f"\n{Fore.YELLOW}Sessions{Style.RESET_ALL}")
+            print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+            for session in sessions:
+                print(f"  {Fore.GREEN}{session['name']:<40}{Style.RESET_ALL} {session['size']:>8} bytes  {session['modified']}")
+                if session["legacy"]:
+                    print(f"  {Fore.YELLOW}  legacy format, convert with 'session convert {session['name']}'{Style.RESET_ALL}")
+            print()
+        else:
+            print(f"{Fore.RED}[!] Usage: session [save [name] | load <name> | convert <name> | list]{Style.RESET_ALL}")
+    
+    def cmd_findings(self, args):
+        flags = {"-t": "vuln_type", "-h": "host", "-m": "module", "-p": "parameter", "-s": "since"}
+        parts = args.split()
+        filters = {}
+        limit = 50
+        if len(parts) % 2:
+            parts.append("")
+        for flag, value in zip(parts[::2], parts[1::2]):
+            if flag in flags and value:
+                filters[flags[flag]] = value
+            elif flag == "-l" and value.isdigit():
+                limit = int(value)
+            else:
+                print(f"{Fore.RED}[!] Usage: findings [-t type] [-h host] [-m module] [-p param] "
+                      f"[-s since] [-l limit]{Style.RESET_ALL}")
+                return
+        
+        total = self.findings.count(**filters)
+        if not total:
+            print(f"{Fore.YELLOW}[*] No findings{Style.RESET_ALL}")
+            return
+        rows = self.findings.query(limit=limit, **filters)
+        print(f"\n{Fore.YELLOW}Findings ({len(rows)} of {total}){Style.RESET_ALL}")
+        print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        print(f"  {Fore.CYAN}{'Id':<6} {'Type':<22} {'Target':<40} {'Parameter':<12} {'Hits':>5} {'Discovered'}{Style.RESET_ALL}")
+        print(f"  {'-'*6} {'-'*22} {'-'*40} {'-'*12} {'-'*5} {'-'*19}")
+        for finding in rows:
+            print(f"  {finding['id']:<6} {str(finding.get('type'))[:22]:<22} {str(finding.get('target'))[:40]:<40} "
+                  f"{str(finding.get('parameter') or '')[:12]:<12} {finding.get('occurrences', 1):>5} "
+                  f"{str(finding.get('discovered_at'))[:19]}")
+        print()
+    
+    def cmd_diff(self, args):
+        parts = args.split()
+        output = None
+        if "-o" in parts and parts.index("-o") + 1 < len(parts):
+            index = parts.index("-o")
+            output = parts[index + 1]
+            del parts[index:index + 2]
+        if not parts or len(parts) > 2 or "-o" in parts:
+            print(f"{Fore.RED}[!] Usage: diff <baseline> [current] [-o file]{Style.RESET_ALL}")
+            return
+        
+        from utils.diff import diff_findings, load_findings
+        sources = []
+        for name in parts:
+            # Saved sessions can be named without their .ktj extension
+            candidates = [name, os.path.join(self.session.session_dir, name),
+                          os.path.join(self.session.session_dir, session_filename(name))]
+            path = next((candidate for candidate in candidates if os.path.exists(candidate)), None)
+            if not path:
+                print(f"{Fore.RED}[!] Not found: {name}{Style.RESET_ALL}")
+                return
+            sources.append(path)
+        try:
+            baseline = load_findings(sources[0])
+            current = load_findings(sources[1]) if len(sources) == 2 else self.session.current_session["findings"]
+        except (OSError, ValueError) as e:
+            print(f"{Fore.RED}[!] Cannot read findings: {e}{Style.RESET_ALL}")
+            return
+        result = diff_findings(baseline, current)
+        
+        print(f"\n{Fore.YELLOW}Diff: {parts[0]} -> {parts[1] if len(parts) == 2 else 'current session'}{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        for label, color, marker in (("new", Fore.RED, "+"), ("fixed", Fore.GREEN, "-")):
+            for finding in result[label]:
+                parameter = f" [{finding['parameter']}]" if finding.get("parameter") else ""
+                print(f"  {color}{marker} {finding.get('type')}: {finding.get('target')}{parameter}{Style.RESET_ALL}")
+        print(f"\n  {Fore.RED}{len(result['new'])} new{Style.RESET_ALL}, "
+              f"{Fore.GREEN}{len(result['fixed'])} fixed{Style.RESET_ALL}, "
+              f"{len(result['unchanged'])} unchanged\n")
+        
+        if output:
+            try:
+                with open(output, 'w') as f:
+                    json.dump(result, f, indent=2, default=str)
+                print(f"{Fore.GREEN}[+] Diff saved: {output}{Style.RESET_ALL}")
+            except OSError as e:
+                print(f"{Fore.RED}[!] Error saving diff: {e}{Style.RESET_ALL}")
+    
+    def cmd_report(self, args):
+        parts = args.split()
+        compress = "-z" in parts
+        names = [part for part in parts if part != "-z"]
+        if len(names) > 1:
+            print(f"{Fore.RED}[!] Usage: report [name] [-z]{Style.RESET_ALL}")
+            return
+        reports = self.reporter.generate_all_reports(names[0] if names else None, compress=compress)
+        if not reports:
+            print(f"{Fore.RED}[!] No reports were written{Style.RESET_ALL}")
+    
+    def cmd_startup(self, args):
+        if args and not self.loader.get_metadata(args):
+            print(f"{Fore.RED}[!] Module not found: {args}{Style.RESET_ALL}")
+            return
+        
+        from utils.startup import measure_startup
+        report = measure_startup(args or None)
+        if not report["success"]:
+            print(f"{Fore.RED}[!] Startup measurement failed: {report['error']}{Style.RESET_ALL}")
+            return
+        
+        budget = Config().get("general.startup_budget_ms", 100)
+        color = Fore.GREEN if report["elapsed_ms"] <= budget else Fore.RED
+        print(f"\n{Fore.YELLOW}Startup Report ({report['target']}){Style.RESET_ALL}")
+        print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        print(f"  Elapsed: {color}{report['elapsed_ms']:.1f} ms{Style.RESET_ALL} (budget {budget} ms)")
+        print(f"\n  {Fore.CYAN}{'Import':<35} {'Cumulative':>10} {'Self':>8}{Style.RESET_ALL}")
+        print(f"  {'-'*35} {'-'*10} {'-'*8}")
+        for name, cumulative, own in report["top_imports"]:
+            print(f"  {name:<35} {cumulative:>7.1f} ms {own:>5.1f} ms")
+        print()
+    
+    def _start_metrics_export(self):
+        """Export metrics from startup when the config asks for a Prometheus file or port"""
+        config = Config()
+        path = config.get("metrics.prometheus_file")
+        port = config.get("metrics.prometheus_port")
+        if not (path or port):
+            return
+        from utils.metrics import PrometheusExporter
+        self.metrics_exporter = PrometheusExporter()
+        try:
+            if path:
+                self.metrics_exporter.write_file(path, config.get("metrics.export_interval", 15))
+            if port:
+                self.metrics_exporter.serve(int(port))
+        except (OSError, ValueError) as e:
+            print(f"{Fore.RED}[!] Cannot export metrics: {e}{Style.RESET_ALL}")
+    
+    def cmd_stats(self, args):
+        from utils.helpers import format_size
+        from utils.metrics import PrometheusExporter, get_registry
+        registry = get_registry()
+        parts = args.split()
+        action = parts[0].lower() if parts else ""
+        
+        if action == "reset":
+            registry.reset()
+            print(f"{Fore.GREEN}[+] Metrics reset{Style.RESET_ALL}")
+            return
+        if action in ("export", "serve"):
+            try:
+                if action == "export" and len(parts) < 2:
+                    raise ValueError("missing file")
+                self.metrics_exporter = self.metrics_exporter or PrometheusExporter()
+                if action == "export":
+                    interval = float(parts[2]) if len(parts) > 2 else 15
+                    self.metrics_exporter.write_file(parts[1], interval)
+                    print(f"{Fore.GREEN}[+] Writing metrics to {parts[1]} every {interval:g}s{Style.RESET_ALL}")
+                else:
+                    port = self.metrics_exporter.serve(int(parts[1]) if len(parts) > 1 else 9464)
+                    print(f"{Fore.GREEN}[+] Serving metrics on http://127.0.0.1:{port}/metrics{Style.RESET_ALL}")
+            except ValueError:
+                print(f"{Fore.RED}[!] Usage: stats [reset | export <file> [interval] | serve [port] | stop]{Style.RESET_ALL}")
+            except OSError as e:
+                print(f"{Fore.RED}[!] Cannot export metrics: {e}{Style.RESET_ALL}")
+            return
+        if action == "stop":
+            if self.metrics_exporter:
+                self.metrics_exporter.stop()
+                self.metrics_exporter = None
+            print(f"{Fore.GREEN}[+] Metrics export stopped{Style.RESET_ALL}")
+            return
+        if action:
+            print(f"{Fore.RED}[!] Usage: stats [reset | export <file> [interval] | serve [port] | stop]{Style.RESET_ALL}")
+            return
+        
+        modules = registry.summary("module")
+        if not modules:
+            print(f"{Fore.YELLOW}[*] No requests or findings recorded yet{Style.RESET_ALL}")
+            return
+        elapsed = max(time.time() - registry.started, 1)
+        
+        def ms(histogram, p):
+            value = histogram.percentile(p)
+            return "-" if value is None else f"{value * 1000:.0f}"
+        
+        def error_rate(row):
+            return f"{100 * row['errors'] / row['requests']:.1f}" if row["requests"] else "-"
+        
+        print(f"\n{Fore.YELLOW}Metrics (last {elapsed / 60:.1f} min){Style.RESET_ALL}")
+        print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        print(f"  {Fore.CYAN}{'Module':<22} {'Requests':>8} {'Req/s':>6} {'Err%':>5} {'Sent':>10} {'Received':>10} "
+              f"{'p50ms':>6} {'p95ms':>6} {'p99ms':>6} {'Findings':>8} {'/min':>5}{Style.RESET_ALL}")
+        print(f"  {'-'*22} {'-'*8} {'-'*6} {'-'*5} {'-'*10} {'-'*10} {'-'*6} {'-'*6} {'-'*6} {'-'*8} {'-'*5}")
+        for name, row in sorted(modules.items()):
+            print(f"  {name[:22]:<22} {int(row['requests']):>8} {row['requests'] / elapsed:>6.1f} {error_rate(row):>5} "
+                  f"{format_size(row['sent']):>10} {format_size(row['received']):>10} "
+                  f"{ms(row['latency'], 50):>6} {ms(row['latency'], 95):>6} {ms(row['latency'], 99):>6} "
+                  f"{int(row['findings']):>8} {row['findings'] * 60 / elapsed:>5.1f}")
+        
+        hosts = registry.summary("host")
+        if hosts:
+            print(f"\n  {Fore.CYAN}{'Host':<30} {'Requests':>8} {'Active':>6} {'Err%':>5} {'Connects':>8} "
+                  f"{'Failed':>6} {'p50ms':>6} {'p95ms':>6} {'p99ms':>6}{Style.RESET_ALL}")
+            print(f"  {'-'*30} {'-'*8} {'-'*6} {'-'*5} {'-'*8} {'-'*6} {'-'*6} {'-'*6} {'-'*6}")
+            for name, row in sorted(hosts.items(), key=lambda item: -item[1]["requests"]):
+                print(f"  {name[:30]:<30} {int(row['requests']):>8} {int(row['in_flight']):>6} {error_rate(row):>5} "
+                      f"{int(row['connects']):>8} {int(row['connect_errors']):>6} "
+                      f"{ms(row['latency'], 50):>6} {ms(row['latency'], 95):>6} {ms(row['latency'], 99):>6}")
+        print()
+    
     def cmd_exit(self, args):
+        if self.metrics_exporter:
+            self.metrics_exporter.stop()
         print(f"\n{Fore.YELLOW}[*] Thank you for using Kotosploit! Meow~{Style.RESET_ALL}")
         self.running = False
         sys.exit(0)
@@ -0,0 +1,145 @@
+"""Background job management for Kotosploit"""
+
+import contextvars
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from colorama import Fore, Style
+from modules.base import BaseModule
+from utils.context import JobCancelled, bind_cancel_event
+
+_job_output: contextvars.ContextVar = contextvars.ContextVar("job_output", default=None)
+
+def capture_output(output: Optional["JobOutput"]):
+    """Send stdout writes made in the current context to output instead of the terminal"""
+    _job_output.set(output)
+
+class JobOutput:
+    def __init__(self, max_chars: int = 1_000_000):
+        self.max_chars = max_chars
+        self.chunks = []
+        self.size = 0
+        self._lock = threading.Lock()
+    
+    def write(self, text: str):
+        with self._lock:
+            self.chunks.append(text)
+            self.size += len(text)
+            while self.size > self.max_chars and len(self.chunks) > 1:
+                self.size -= len(self.chunks.pop(0))
+    
+    def text(self) -> str:
+        """Captured output with carriage-return progress lines collapsed to their final state"""
+        with self._lock:
+            raw = "".join(self.chunks)
+        return "\n".join(line.rsplit('\r', 1)[-1] for line in raw.split('\n'))
+
+
+class OutputRouter:
+    """Stands in for sys.stdout and sends writes from job threads to that job's buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text: str):
+        output = _job_output.get()
+        if output is not None:
+            output.write(text)
+            return len(text)
+        return self.stream.write(text)
+    
+    def flush(self):
+        if _job_output.get() is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class Job:
+    def __init__(self, job_id: int, module_path: str, module: BaseModule,
+                 on_event: Callable = None, on_finish: Callable = None):
+        self.id = job_id
+        self.module_path = module_path
+        self.module = module
+        self.on_event = on_event
+        self.on_finish = on_finish
+        self.output = JobOutput()
+        self.cancel_event = threading.Event()
+        self.status = "running"
+        self.result = None
+        self.error = None
+        self.started = time.time()
+        self.finished = None
+        self.thread = None
+    
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.time()) - self.started
+
+
+class JobManager:
+    def __init__(self):
+        self.jobs: Dict[int, Job] = {}
+        self.next_id = 1
+        self._lock = threading.Lock()
+        if not isinstance(sys.stdout, OutputRouter):
+            sys.stdout = OutputRouter(sys.stdout)
+    
+    @property
+    def console_stream(self):
+        # Looked up on each use since JSON Lines mode moves terminal output to stderr
+        return sys.stdout.stream if isinstance(sys.stdout, OutputRouter) else sys.stdout
+    
+    def start(self, module_path: str, module: BaseModule, on_event: Callable = None,
+              on_finish: Callable = None) -> Job:
+        with self._lock:
+            job = Job(self.next_id, module_path, module, on_event, on_finish)
+            self.jobs[job.id] = job
+            self.next_id += 1
+        
+        context = contextvars.Context()
+        job.thread = threading.Thread(target=context.run, args=(self._run, job), name=f"job-{job.id}", daemon=True)
+        job.thread.start()
+        return job
+    
+    def _run(self, job: Job):
+        capture_output(job.output)
+        bind_cancel_event(job.cancel_event)
+        try:
+            job.result = job.module.collect(job.on_event)
+            job.status = "completed"
+        except JobCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished = time.time()
+        
+        if job.on_finish:
+            job.on_finish(job.result or {"success": False, "message": job.error or job.status})
+        
+        message = (job.result or {}).get("message") or job.error or job.status
+        self.console_stream.write(
+            f"\n{Fore.YELLOW}[*] Job {job.id} ({job.module_path}) {job.status}: {message}{Style.RESET_ALL}\n"
+        )
+        self.console_stream.flush()
+    
+    def get(self, job_id: int) -> Optional[Job]:
+        return self.jobs.get(job_id)
+    
+    def list_jobs(self) -> List[Job]:
+        return [self.jobs[job_id] for job_id in sorted(self.jobs)]
+    
+    def wait(self, timeout: float = None):
+        for job in self.list_jobs():
+            job.thread.join(timeout)
+    
+    def kill(self, job_id: int) -> bool:
+        job = self.jobs.get(job_id)
+        if not job or job.status != "running":
+            return False
+        job.cancel_event.set()
+        return True
@@ -1,50 +1,205 @@
 """Module loader system for Kotosploit"""
 
+import ast
 import importlib
+import json
 import os
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 from modules.base import BaseModule
+from utils.config import Config
+
+MODULES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "modules")
+INDEX_VERSION = 2
 
 class ModuleLoader:
-    def __init__(self):
-        self.modules = {}
-        self._scan_modules()
+    """Registry of modules backed by a metadata index built from the source, not by importing.
     
-    def _scan_modules(self):
-        module_paths = {
+    The index is cached on disk and an entry is only re-parsed when its file's mtime changes,
+    so listing, searching and info never import a module; get_module imports exactly one.
+    """
+    
+    def __init__(self, index_path: str = None):
+        self.index_path = index_path or os.path.join(
+            Config().get("cache.directory", "./cache"), "module_index.json"
+        )
+        self.module_paths = {
             "exploit": "modules.exploits",
             "auxiliary": "modules.auxiliary",
         }
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self.modules = {}
+        self._scan_modules()
+    
+    def _scan_modules(self):
+        cached = self._load_index()
+        changed = False
         
-        for module_type, base_path in module_paths.items():
-            try:
-                package = importlib.import_module(base_path)
-                if package.__file__ is None:
+        for module_type, base_path in self.module_paths.items():
+            package_dir = os.path.join(MODULES_DIR, base_path.split('.')[-1])
+            if not os.path.isdir(package_dir):
+                continue
+            
+            for filename in sorted(os.listdir(package_dir)):
+                if not filename.endswith('.py') or filename == '__init__.py':
                     continue
-                package_dir = os.path.dirname(package.__file__)
+                file_path = os.path.join(package_dir, filename)
+                module_name = filename[:-3]
+                module_key = f"{module_type}/{module_name}"
+                mtime = os.path.getmtime(file_path)
                 
-                for filename in os.listdir(package_dir):
-                    if filename.endswith('.py') and filename != '__init__.py':
-                        module_name = filename[:-3]
-                        full_path = f"{base_path}.{module_name}"
-                        module_key = f"{module_type}/{module_name}"
-                        self.modules[module_key] = full_path
-            except Exception:
-                pass
+                entry = cached.get(module_key)
+                if not entry or entry.get("mtime") != mtime or entry.get("file") != file_path:
+                    entry = self._inspect(file_path)
+                    if entry is not None:
+                        entry.update({"file": file_path, "mtime": mtime,
+                                      "import_path": f"{base_path}.{module_name}"})
+                    else:
+                        entry = {"file": file_path, "mtime": mtime, "class": None}
+                    changed = True
+                
+                # Helper scripts without a module class stay in the index so they aren't re-parsed
+                cached[module_key] = entry
+                if entry.get("class"):
+                    self.index[module_key] = entry
+                    self.modules[module_key] = entry["import_path"]
+        
+        stale = [key for key, entry in cached.items() if not os.path.exists(entry.get("file", ""))]
+        for key in stale:
+            del cached[key]
+        if changed or stale:
+            self._save_index(cached)
+    
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                return data.get("modules", {})
+        except Exception:
+            pass
+        return {}
+    
+    def _save_index(self, entries: Dict[str, Dict[str, Any]]):
+        try:
+            directory = os.path.dirname(self.index_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({"version": INDEX_VERSION, "modules": entries}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+    
+    def _inspect(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Pull class name and metadata out of a module file's AST without executing it"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                tree = ast.parse(f.read(), filename=file_path)
+        except (OSError, SyntaxError, ValueError):
+            return None
+        
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and any(self._base_name(base) == "BaseModule" for base in node.bases):
+                metadata = {
+                    "class": node.name,
+                    "name": node.name,
+                    "type": "base",
+                    "description": "",
+                    "author": "Kotosploit Team",
+                    "version": "1.0",
+                    "options": {},
+                    "required": []
+                }
+                for item in node.body:
+                    # Class-level version = "..." overriding BaseModule's
+                    if (isinstance(item, ast.Assign) and len(item.targets) == 1
+                            and isinstance(item.targets[0], ast.Name) and item.targets[0].id == "version"):
+                        metadata["version"] = str(self._literal(item.value))
+                init = next((item for item in node.body
+                             if isinstance(item, ast.FunctionDef) and item.name == "__init__"), None)
+                if init:
+                    self._inspect_init(init, metadata)
+                return metadata
+        return None
+    
+    def _inspect_init(self, init: ast.FunctionDef, metadata: Dict[str, Any]):
+        attributes = {"description": "description", "module_type": "type", "author": "author"}
+        for statement in ast.walk(init):
+            if isinstance(statement, ast.Assign):
+                for target in statement.targets:
+                    if not (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                            and target.value.id == "self"):
+                        continue
+                    if target.attr in attributes:
+                        value = self._literal(statement.value)
+                        if isinstance(value, str):
+                            metadata[attributes[target.attr]] = value
+                    elif target.attr == "options" and isinstance(statement.value, ast.Dict):
+                        metadata["options"] = self._literal_dict(statement.value)
+                    elif target.attr == "required_options":
+                        value = self._literal(statement.value)
+                        if isinstance(value, list):
+                            metadata["required"] = value
+            
+            # Some modules pass their metadata to super().__init__(name=..., options={...})
+            elif (isinstance(statement, ast.Call) and isinstance(statement.func, ast.Attribute)
+                  and statement.func.attr == "__init__"):
+                for keyword in statement.keywords:
+                    if keyword.arg in ("name", "description", "author"):
+                        value = self._literal(keyword.value)
+                        if isinstance(value, str):
+                            metadata[keyword.arg] = value
+                    elif keyword.arg == "options" and isinstance(keyword.value, ast.Dict):
+                        for option, spec in self._literal_dict(keyword.value).items():
+                            if isinstance(spec, dict):
+                                metadata["options"][option] = spec.get("value")
+                                if spec.get("required"):
+                                    metadata["required"].append(option)
+    
+    def _literal_dict(self, node: ast.Dict) -> Dict[str, Any]:
+        # Options computed at runtime (e.g. from the config) are recorded without a default
+        result = {}
+        for key, value in zip(node.keys, node.values):
+            key = self._literal(key) if key is not None else None
+            if isinstance(key, str):
+                result[key] = self._literal(value)
+        return result
+    
+    def _literal(self, node: ast.AST) -> Any:
+        try:
+            return ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError, RecursionError):
+            return None
+    
+    def _base_name(self, node: ast.AST) -> str:
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute):
+            return node.attr
+        return ""
     
     def get_module(self, module_path: str) -> Optional[BaseModule]:
-        if module_path not in self.modules:
+        entry = self.index.get(module_path)
+        if not entry:
             return None
         
         try:
-            module = importlib.import_module(self.modules[module_path])
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, BaseModule) and attr != BaseModule:
-                    return attr()
+            module = importlib.import_module(entry["import_path"])
+            return getattr(module, entry["class"])()
         except Exception as e:
             print(f"Error loading module: {e}")
             return None
     
+    def get_metadata(self, module_path: str) -> Optional[Dict[str, Any]]:
+        return self.index.get(module_path)
+    
+    def search(self, term: str) -> List[str]:
+        term = term.lower()
+        return sorted(
+            key for key, entry in self.index.items()
+            if term in key.lower() or term in entry["name"].lower() or term in entry["description"].lower()
+        )
+    
     def list_modules(self) -> Dict[str, str]:
         return self.modules.copy()
@@ -0,0 +1,93 @@
+"""JSON Lines output mode for Kotosploit"""
+
+import json
+import sys
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+from colorama import AnsiToWin32
+from core.jobs import OutputRouter
+from modules.events import Finding
+from utils import progress
+
+OUTPUT_MODES = ("text", "jsonl")
+
+class JsonlWriter:
+    """Writes one JSON object per line; shared by the console, its jobs and batch blocks"""
+    
+    def __init__(self, path: str = None):
+        self.path = None if path in (None, '-') else path
+        if self.path:
+            self.stream = open(self.path, 'a', encoding='utf-8')
+        else:
+            # The process's own stdout, not the colorama/job-routing wrappers around it
+            self.stream = sys.__stdout__
+        self._lock = threading.Lock()
+    
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str, separators=(',', ':'))
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+    
+    def finding(self, finding: Finding):
+        self.write({"event": "finding", **finding.to_dict()})
+    
+    def completion(self, module_path: str, target: str, result: Dict[str, Any]):
+        self.write({
+            "event": "module_complete",
+            "module": module_path,
+            "target": target,
+            "success": bool(result.get("success")),
+            "message": result.get("message", ""),
+            "result": result,
+            "completed_at": datetime.now().isoformat()
+        })
+    
+    def close(self):
+        if self.path:
+            with self._lock:
+                self.stream.close()
+
+
+_writer: Optional[JsonlWriter] = None
+_human_stream = None
+
+def get_writer() -> Optional[JsonlWriter]:
+    """The active JSON Lines writer, or None in text mode"""
+    return _writer
+
+def enable_jsonl(path: str = None) -> JsonlWriter:
+    """Switch to JSON Lines output ('-' or None for stdout, otherwise append to path).
+    
+    Progress lines and colors are turned off and human-readable output is moved to stderr,
+    so stdout carries nothing but JSON when records are written there.
+    """
+    global _writer, _human_stream
+    writer = JsonlWriter(path)
+    disable_jsonl()
+    _writer = writer
+    progress.set_enabled(False)
+    
+    plain = AnsiToWin32(sys.__stderr__, strip=True).stream
+    if isinstance(sys.stdout, OutputRouter):
+        _human_stream = sys.stdout.stream
+        sys.stdout.stream = plain
+    else:
+        _human_stream = sys.stdout
+        sys.stdout = plain
+    return _writer
+
+def disable_jsonl():
+    """Back to colored text output on stdout"""
+    global _writer, _human_stream
+    if _writer is None:
+        return
+    _writer.close()
+    _writer = None
+    progress.set_enabled(True)
+    if isinstance(sys.stdout, OutputRouter):
+        sys.stdout.stream = _human_stream
+    else:
+        sys.stdout = _human_stream
+    _human_stream = None
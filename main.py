@@ -4,9 +4,52 @@ Kotosploit Framework - Web Penetration Testing Framework
 Main Entry Point
 """
 
-from core.console import KotosploitConsole
+import argparse
+import sys
 
 def main():
+    parser = argparse.ArgumentParser(description="Kotosploit Framework")
+    parser.add_argument("-r", "--resource", metavar="FILE",
+                        help="run commands from a resource script ('-' for stdin) and exit")
+    parser.add_argument("-w", "--workers", type=int, default=4,
+                        help="resource script blocks to run in parallel (default: 4)")
+    parser.add_argument("--jsonl", nargs="?", const="-", metavar="FILE",
+                        help="emit findings and module results as JSON Lines to stdout (or FILE); "
+                             "other output goes to stderr without colors or progress")
+    parser.add_argument("--diff", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="compare the findings of two session journals or JSON/JSONL reports; "
+                             "prints JSON and exits 1 if there are new findings")
+    parser.add_argument("--startup-check", action="store_true",
+                        help="check console and module cold-start time against the configured budget")
+    args = parser.parse_args()
+    
+    if args.startup_check:
+        from utils.startup import check_budget
+        sys.exit(check_budget())
+    
+    if args.diff:
+        import json
+        from utils.diff import diff_files
+        try:
+            result = diff_files(*args.diff)
+        except (OSError, ValueError) as e:
+            print(f"cannot read findings: {e}", file=sys.stderr)
+            sys.exit(2)
+        print(json.dumps(result, indent=2, default=str))
+        sys.exit(1 if result["new"] else 0)
+    
+    if args.jsonl:
+        from core.output import enable_jsonl
+        try:
+            enable_jsonl(args.jsonl)
+        except OSError as e:
+            parser.error(f"cannot open {args.jsonl}: {e}")
+    
+    if args.resource:
+        from core.batch import run_script
+        sys.exit(run_script(args.resource, args.workers))
+    
+    from core.console import KotosploitConsole
     console = KotosploitConsole()
     console.run()
 
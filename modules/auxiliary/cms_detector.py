@@ -1,6 +1,5 @@
 """CMS (Content Management System) detection module"""
 
-import requests
 import re
 from colorama import Fore, Style
 from modules.base import BaseModule
@@ -111,6 +110,7 @@ class CMSDetector(BaseModule):
         }
     
     def run(self):
+        from utils.http_client import get_client
         url = self.get_option("URL")
         timeout = int(self.get_option("TIMEOUT"))
         
@@ -118,7 +118,7 @@ class CMSDetector(BaseModule):
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
         try:
-            response = requests.get(url, timeout=timeout, verify=False)
+            response = get_client().get(url, timeout=timeout, verify=False)
             html = response.text
             headers = response.headers
             
@@ -131,7 +131,7 @@ class CMSDetector(BaseModule):
                     if sig_type == "Path":
                         test_url = url.rstrip('/') + signature
                         try:
-                            test_response = requests.get(test_url, timeout=5, verify=False)
+                            test_response = get_client().get(test_url, timeout=5, verify=False)
                             if test_response.status_code in [200, 301, 302, 403]:
                                 matches.append(f"{sig_type}: {signature}")
                         except Exception:
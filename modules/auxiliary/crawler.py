@@ -1,7 +1,6 @@
 """Web crawler module for discovering endpoints"""
 
-import requests
-from bs4 import BeautifulSoup
+from collections import deque
 from urllib.parse import urljoin, urlparse
 from colorama import Fore, Style
 from modules.base import BaseModule
@@ -15,6 +14,7 @@ class WebCrawler(BaseModule):
             "URL": "",
             "DEPTH": "2",
             "TIMEOUT": "10",
+            "INCREMENTAL": "false",
         }
         self.required_options = ["URL"]
         self.visited_urls = set()
@@ -30,7 +30,37 @@ class WebCrawler(BaseModule):
         print(f"{Fore.YELLOW}[*] Max depth: {depth}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
-        self._crawl(url, depth, timeout)
+        # Pages that haven't changed since the last crawl reuse their links and forms instead of being parsed
+        scan_state = None
+        if self.get_option("INCREMENTAL").lower() in ("true", "yes", "1"):
+            from utils.incremental import ScanState
+            scan_state = ScanState()
+        
+        checkpoint = self.create_checkpoint()
+        state = checkpoint.state
+        self.visited_urls = set(state.get("visited", []))
+        self.discovered_urls = set(state.get("discovered", []))
+        self.forms = state.get("forms", [])
+        frontier = deque(tuple(item) for item in state.get("frontier", [(url, 0)]))
+        if state:
+            print(f"{Fore.YELLOW}[*] Resuming crawl with {len(frontier)} queued URLs{Style.RESET_ALL}\n")
+        
+        try:
+            while frontier:
+                checkpoint.maybe_save(lambda: self._checkpoint_state(frontier))
+                current_url, current_depth = frontier[0]
+                self._crawl(current_url, depth, timeout, frontier, current_depth, scan_state)
+                frontier.popleft()
+        except KeyboardInterrupt:
+            if frontier:
+                self.visited_urls.discard(frontier[0][0])
+            checkpoint.save(self._checkpoint_state(frontier))
+            print(f"\n{Fore.YELLOW}[*] Crawl interrupted, checkpoint saved: {checkpoint.id}{Style.RESET_ALL}")
+            raise
+        finally:
+            if scan_state:
+                scan_state.close()
+        checkpoint.complete()
         
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}[+] Crawl complete!{Style.RESET_ALL}\n")
@@ -60,46 +90,75 @@ class WebCrawler(BaseModule):
             "forms": self.forms
         }
     
-    def _crawl(self, url: str, depth: int, timeout: int, current_depth: int = 0):
+    def _checkpoint_state(self, frontier) -> dict:
+        return {
+            "frontier": list(frontier),
+            "visited": list(self.visited_urls),
+            "discovered": list(self.discovered_urls),
+            "forms": self.forms
+        }
+    
+    def _crawl(self, url: str, depth: int, timeout: int, frontier, current_depth: int = 0, scan_state=None):
+        from utils.http_client import get_client
+        from bs4 import BeautifulSoup
         if current_depth > depth or url in self.visited_urls:
             return
         
         self.visited_urls.add(url)
         
         try:
-            response = requests.get(url, timeout=timeout, verify=False)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if scan_state:
+                from utils.incremental import EndpointCheck, test_set_hash
+                check = EndpointCheck(scan_state, self.__class__.__module__, url, url,
+                                      test_set_hash(self.version, None), timeout)
+                if check.unchanged:
+                    links, forms = check.previous["data"]["links"], check.previous["data"]["forms"]
+                elif check.response is not None:
+                    links, forms = self._parse(url, BeautifulSoup(check.response.text, 'html.parser'))
+                    check.save({"links": links, "forms": forms})
+                else:
+                    return
+            else:
+                response = get_client().get(url, timeout=timeout, verify=False)
+                links, forms = self._parse(url, BeautifulSoup(response.text, 'html.parser'))
             
-            for link in soup.find_all('a', href=True):
-                absolute_url = urljoin(url, link['href'])
+            for absolute_url in links:
+                self.discovered_urls.add(absolute_url)
+                print(f"{Fore.CYAN}[+] Found: {absolute_url}{Style.RESET_ALL}")
                 
-                if urlparse(absolute_url).netloc == urlparse(url).netloc:
-                    self.discovered_urls.add(absolute_url)
-                    print(f"{Fore.CYAN}[+] Found: {absolute_url}{Style.RESET_ALL}")
-                    
-                    if current_depth < depth:
-                        self._crawl(absolute_url, depth, timeout, current_depth + 1)
+                if current_depth < depth and absolute_url not in self.visited_urls:
+                    frontier.append((absolute_url, current_depth + 1))
             
-            for form in soup.find_all('form'):
-                action = form.get('action', '')
-                method = form.get('method', 'get').upper()
-                absolute_action = urljoin(url, action)
-                
-                form_data = {
-                    "url": url,
-                    "action": absolute_action,
-                    "method": method,
-                    "inputs": []
-                }
-                
-                for input_tag in form.find_all('input'):
-                    form_data["inputs"].append({
-                        "name": input_tag.get('name', ''),
-                        "type": input_tag.get('type', 'text')
-                    })
-                
+            for form_data in forms:
                 self.forms.append(form_data)
-                print(f"{Fore.GREEN}[+] Found form: {absolute_action} ({method}){Style.RESET_ALL}")
+                print(f"{Fore.GREEN}[+] Found form: {form_data['action']} ({form_data['method']}){Style.RESET_ALL}")
         
         except Exception:
             pass
+    
+    def _parse(self, url: str, soup):
+        """Same-host links and forms on a page"""
+        links = []
+        for link in soup.find_all('a', href=True):
+            absolute_url = urljoin(url, link['href'])
+            if urlparse(absolute_url).netloc == urlparse(url).netloc:
+                links.append(absolute_url)
+        
+        forms = []
+        for form in soup.find_all('form'):
+            action = form.get('action', '')
+            form_data = {
+                "url": url,
+                "action": urljoin(url, action),
+                "method": form.get('method', 'get').upper(),
+                "inputs": []
+            }
+            
+            for input_tag in form.find_all('input'):
+                form_data["inputs"].append({
+                    "name": input_tag.get('name', ''),
+                    "type": input_tag.get('type', 'text')
+                })
+            
+            forms.append(form_data)
+        return links, forms
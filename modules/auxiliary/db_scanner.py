@@ -1,10 +1,11 @@
 """Database service scanner and fingerprinting module"""
 
-import socket
 import re
 from urllib.parse import urlparse
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
+from utils.net import open_connection, probe_port
 
 class DatabaseScanner(BaseModule):
     def __init__(self):
@@ -49,6 +50,9 @@ class DatabaseScanner(BaseModule):
         }
     
     def run(self):
+        return self.collect()
+    
+    def stream(self):
         target = self.get_option("TARGET")
         timeout = int(self.get_option("TIMEOUT"))
         
@@ -60,8 +64,8 @@ class DatabaseScanner(BaseModule):
         
         detected_services = []
         
-        for port, service_name in self.db_ports.items():
-            print(f"{Fore.CYAN}[*] Checking port {port} ({service_name})...{Style.RESET_ALL}", end='\r')
+        for i, (port, service_name) in enumerate(self.db_ports.items(), 1):
+            yield Progress(i, len(self.db_ports), f"Checking port {port} ({service_name})")
             
             if self._check_port(hostname, port, timeout):
                 banner = self._grab_banner(hostname, port, timeout)
@@ -74,7 +78,10 @@ class DatabaseScanner(BaseModule):
                     "banner": banner[:100] if banner else "No banner"
                 })
                 
-                print(f"{Fore.GREEN}[+] FOUND: {service_name} on port {port} (Type: {db_type}){Style.RESET_ALL}")
+                yield Finding("Database service", f"{hostname}:{port}", severity="medium",
+                              description=f"{service_name} on port {port} (Type: {db_type})",
+                              evidence=banner[:100] if banner else None)
+        yield Progress(len(self.db_ports), len(self.db_ports), done=True)
         
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         
@@ -86,33 +93,27 @@ class DatabaseScanner(BaseModule):
                     print(f"{Fore.YELLOW}    Banner: {service['banner'][:80]}...{Style.RESET_ALL}")
             print()
             
-            return {
+            yield Result({
                 "success": True,
                 "message": f"Detected {len(detected_services)} database services",
                 "services": detected_services
-            }
+            })
         else:
             print(f"{Fore.YELLOW}[*] No database services detected{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
                 "message": "No database services detected"
-            }
+            })
     
     def _check_port(self, hostname: str, port: int, timeout: int) -> bool:
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((hostname, port))
-            sock.close()
-            return result == 0
+            return probe_port(hostname, port, timeout) == 0
         except Exception:
             return False
     
     def _grab_banner(self, hostname: str, port: int, timeout: int) -> str:
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            sock.connect((hostname, port))
+            sock = open_connection(hostname, port, timeout)
             
             try:
                 sock.send(b'\n')
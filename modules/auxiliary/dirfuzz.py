@@ -1,8 +1,14 @@
 """Directory and file fuzzing module"""
 
-import requests
+import itertools
+import queue
+import secrets
+import threading
+from urllib.parse import urlparse
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
+from utils.context import JobCancelled, check_cancelled, propagate
 
 class DirectoryFuzzer(BaseModule):
     def __init__(self):
@@ -15,6 +21,8 @@ class DirectoryFuzzer(BaseModule):
             "EXTENSIONS": "",
             "TIMEOUT": "5",
             "THREADS": "10",
+            "RECURSIVE": "false",
+            "MAX_DEPTH": "3",
         }
         self.required_options = ["URL"]
         
@@ -27,46 +35,99 @@ class DirectoryFuzzer(BaseModule):
             ".git", ".env", ".htaccess", "robots.txt", "sitemap.xml",
             "readme", "README", "LICENSE", "install", "setup",
         ]
+        
+        self.listing_markers = ["Index of /", "Directory listing for", "<title>Directory"]
+        self.soft_404_tolerance = 64
     
     def run(self):
+        return self.collect()
+    
+    def stream(self):
+        from utils.http_client import get_client
         url = self.get_option("URL").rstrip('/')
         wordlist_type = self.get_option("WORDLIST")
         extensions = self.get_option("EXTENSIONS").split(',') if self.get_option("EXTENSIONS") else ['']
         timeout = int(self.get_option("TIMEOUT"))
+        threads = max(1, int(self.get_option("THREADS")))
+        recursive = self.get_option("RECURSIVE").lower() in ("true", "yes", "1")
+        max_depth = int(self.get_option("MAX_DEPTH")) if recursive else 0
         
         print(f"{Fore.YELLOW}[*] Target URL: {url}{Style.RESET_ALL}")
         print(f"{Fore.YELLOW}[*] Wordlist: {wordlist_type}{Style.RESET_ALL}")
+        if recursive:
+            print(f"{Fore.YELLOW}[*] Recursive mode: max depth {max_depth}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
-        found = []
-        wordlist = self.default_wordlist
+        checkpoint = self.create_checkpoint()
+        state = checkpoint.state
         
-        total = len(wordlist) * len(extensions) if extensions else len(wordlist)
-        current = 0
+        self._root = url
+        self._probes = [f"{word}{ext}" for word in self.default_wordlist for ext in extensions]
+        self._timeout = timeout
+        self._max_depth = max_depth
+        self._queue = queue.PriorityQueue()
+        self._events = queue.Queue()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stopping = False
+        self._scanned = set()
+        self._directories = {}
+        self._completed = {}
+        self._baselines = {base: tuple(b) if b else None for base, b in state.get("baselines", {}).items()}
+        self._found = [tuple(item) for item in state.get("found", [])]
+        self._current = 0
+        self._total = 0
+        self._errors = 0
+        
+        if state:
+            print(f"{Fore.YELLOW}[*] Resuming {len(state['directories'])} directories from checkpoint{Style.RESET_ALL}\n")
+            for base, entry in state["directories"].items():
+                self._enqueue_directory(base, entry["depth"], entry["offset"])
+        else:
+            self._enqueue_directory(f"{url}/", 0)
         
-        for word in wordlist:
-            for ext in extensions:
-                current += 1
-                path = f"{word}{ext}"
-                test_url = f"{url}/{path}"
-                
-                print(f"{Fore.CYAN}[{current}/{total}] Testing: /{path}{Style.RESET_ALL}", end='\r')
-                
+        # THREADS workers to start with; the pool grows with the host's adaptive concurrency limit
+        controller = get_client().controller_for(urlparse(url).netloc)
+        workers = []
+        self._add_workers(workers, threads)
+        
+        # None on the event queue marks the end of the scan
+        threading.Thread(target=lambda: (self._queue.join(), self._events.put(None)), daemon=True).start()
+        try:
+            # Worker threads report through the event queue; findings are yielded as they arrive
+            while True:
                 try:
-                    response = requests.get(test_url, timeout=timeout, verify=False, allow_redirects=False)
-                    
-                    if response.status_code == 200:
-                        found.append((path, response.status_code, len(response.content)))
-                        print(f"{Fore.GREEN}[+] FOUND: /{path} (Status: {response.status_code}, Size: {len(response.content)} bytes){Style.RESET_ALL}")
-                    elif response.status_code in [301, 302, 307, 308]:
-                        found.append((path, response.status_code, 0))
-                        print(f"{Fore.YELLOW}[*] REDIRECT: /{path} (Status: {response.status_code}){Style.RESET_ALL}")
-                    elif response.status_code == 403:
-                        found.append((path, response.status_code, 0))
-                        print(f"{Fore.MAGENTA}[!] FORBIDDEN: /{path} (Status: {response.status_code}){Style.RESET_ALL}")
-                        
-                except Exception:
+                    event = self._events.get(timeout=1.0)
+                    if event is None:
+                        break
+                    yield event
+                except queue.Empty:
                     pass
+                check_cancelled()
+                checkpoint.maybe_save(self._checkpoint_state)
+                self._add_workers(workers, int(controller.limit))
+            # Workers of a killed job skip the rest of the queue, which ends it early
+            check_cancelled()
+        except (KeyboardInterrupt, GeneratorExit):
+            self._stopping = True
+            checkpoint.save(self._checkpoint_state())
+            print(f"\n{Fore.YELLOW}[*] Scan interrupted, checkpoint saved: {checkpoint.id}{Style.RESET_ALL}")
+            raise
+        except BaseException:
+            self._stopping = True
+            raise
+        finally:
+            # Workers exit on their sentinel; when stopping they skip the rest of the queue first,
+            # which also lets the end-of-scan helper's queue.join() return
+            for _ in workers:
+                self._queue.put((float('inf'), next(self._sequence), None))
+        for worker in workers:
+            worker.join()
+        
+        checkpoint.complete()
+        yield Progress(self._current, self._total, errors=self._errors, done=True)
+        
+        found = self._found
         
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         
@@ -75,14 +136,150 @@ class DirectoryFuzzer(BaseModule):
             for path, status, size in found:
                 print(f"{Fore.CYAN}  /{path} - Status: {status}, Size: {size} bytes{Style.RESET_ALL}")
             
-            return {
+            yield Result({
                 "success": True,
                 "message": f"Found {len(found)} paths",
-                "found": found
-            }
+                "found": found,
+                "directories": sorted(d[len(url) + 1:] for d in self._scanned)
+            })
         else:
             print(f"{Fore.YELLOW}[*] No accessible paths found{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
                 "message": "No paths found"
+            })
+    
+    def _add_workers(self, workers: list, count: int):
+        while len(workers) < count:
+            worker = threading.Thread(target=propagate(self._worker), daemon=True)
+            worker.start()
+            workers.append(worker)
+    
+    def _enqueue_directory(self, base: str, depth: int, offset: int = 0):
+        """Queue a directory for scanning unless its prefix was already seen."""
+        with self._lock:
+            if base in self._scanned or depth > self._max_depth:
+                return
+            self._scanned.add(base)
+            self._directories[base] = {"depth": depth, "offset": offset}
+            self._completed[base] = set()
+            self._total += len(self._probes)
+            self._current += offset
+        if offset < len(self._probes):
+            self._queue.put((depth, next(self._sequence), ("directory", base, depth, offset)))
+    
+    def _checkpoint_state(self) -> dict:
+        with self._lock:
+            return {
+                "directories": {base: dict(entry) for base, entry in self._directories.items()},
+                "baselines": dict(self._baselines),
+                "found": list(self._found)
             }
+    
+    def _mark_done(self, base: str, index: int):
+        """Advance the directory's wordlist offset past every contiguously completed probe."""
+        with self._lock:
+            entry = self._directories[base]
+            completed = self._completed[base]
+            completed.add(index)
+            while entry["offset"] in completed:
+                completed.remove(entry["offset"])
+                entry["offset"] += 1
+    
+    def _worker(self):
+        while True:
+            _, _, task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                if self._stopping:
+                    continue
+                if task[0] == "directory":
+                    self._start_directory(*task[1:])
+                else:
+                    self._probe(*task[1:])
+            except JobCancelled:
+                # The job was killed; skip what is left and exit on the sentinel like any other stop
+                self._stopping = True
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+    
+    def _start_directory(self, base: str, depth: int, offset: int):
+        """Calibrate the soft-404 signature of a directory, then queue its probes."""
+        if base not in self._baselines:
+            self._baselines[base] = self._calibrate(base)
+        for index in range(offset, len(self._probes)):
+            self._queue.put((depth, next(self._sequence), ("probe", base, index, depth)))
+    
+    def _calibrate(self, base: str):
+        from utils.http_client import get_client
+        try:
+            response = get_client().get(f"{base}{secrets.token_hex(8)}", timeout=self._timeout,
+                                    verify=False, allow_redirects=False)
+        except Exception:
+            return None
+        if response.status_code == 404:
+            return None
+        return response.status_code, len(response.content)
+    
+    def _is_soft_404(self, base: str, status: int, size: int) -> bool:
+        baseline = self._baselines.get(base)
+        if not baseline:
+            return False
+        return status == baseline[0] and abs(size - baseline[1]) <= self.soft_404_tolerance
+    
+    def _probe(self, base: str, index: int, depth: int):
+        done = True
+        try:
+            self._probe_path(base, self._probes[index], depth)
+        except JobCancelled:
+            # The request was never sent, so a resumed scan tests this path again
+            done = False
+            raise
+        finally:
+            if done:
+                self._mark_done(base, index)
+    
+    def _probe_path(self, base: str, path: str, depth: int):
+        from utils.http_client import get_client
+        test_url = f"{base}{path}"
+        display = test_url[len(self._root) + 1:]
+        
+        with self._lock:
+            self._current += 1
+            self._events.put(Progress(self._current, self._total, f"Testing: /{display}", self._errors))
+        
+        try:
+            response = get_client().get(test_url, timeout=self._timeout, verify=False, allow_redirects=False)
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            return
+        
+        status = response.status_code
+        size = len(response.content)
+        if self._is_soft_404(base, status, size):
+            return
+        
+        is_directory = False
+        with self._lock:
+            if status == 200:
+                self._found.append((display, status, size))
+                self._events.put(Finding("Accessible path", test_url, severity="info",
+                                         description=f"/{display} (Status: {status}, Size: {size} bytes)"))
+                is_directory = any(marker in response.text for marker in self.listing_markers)
+            elif status in [301, 302, 307, 308]:
+                self._found.append((display, status, 0))
+                self._events.put(Finding("Redirect", test_url, severity="info",
+                                         description=f"/{display} (Status: {status})"))
+                is_directory = response.headers.get("Location", "").rstrip().endswith(f"/{path}/")
+            elif status == 403:
+                self._found.append((display, status, 0))
+                self._events.put(Finding("Forbidden path", test_url, severity="low",
+                                         description=f"/{display} (Status: {status})"))
+                is_directory = '.' not in path
+        
+        if is_directory:
+            self._enqueue_directory(f"{test_url}/", depth + 1)
@@ -1,6 +1,5 @@
 """HTTP header analyzer module"""
 
-import requests
 from colorama import Fore, Style
 from modules.base import BaseModule
 
@@ -26,6 +25,7 @@ class HeaderAnalyzer(BaseModule):
         }
     
     def run(self):
+        from utils.http_client import get_client
         url = self.get_option("URL")
         timeout = int(self.get_option("TIMEOUT"))
         
@@ -33,7 +33,7 @@ class HeaderAnalyzer(BaseModule):
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
         try:
-            response = requests.get(url, timeout=timeout, verify=False)
+            response = get_client().get(url, timeout=timeout, verify=False)
             
             print(f"{Fore.GREEN}[+] All Response Headers:{Style.RESET_ALL}\n")
             for header, value in response.headers.items():
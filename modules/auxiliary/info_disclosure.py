@@ -1,8 +1,8 @@
 """Information disclosure scanner module"""
 
-import requests
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
 
 class InformationDisclosure(BaseModule):
     def __init__(self):
@@ -80,6 +80,11 @@ class InformationDisclosure(BaseModule):
         ]
     
     def run(self):
+        return self.collect()
+    
+    def stream(self):
+        import re
+        from utils.http_client import get_client
         url = self.get_option("URL").rstrip('/')
         timeout = int(self.get_option("TIMEOUT"))
         
@@ -90,35 +95,39 @@ class InformationDisclosure(BaseModule):
         
         print(f"{Fore.CYAN}[*] Checking sensitive files...{Style.RESET_ALL}\n")
         
-        for path in self.sensitive_paths:
+        errors = 0
+        for i, path in enumerate(self.sensitive_paths, 1):
             test_url = f"{url}/{path}"
-            print(f"{Fore.CYAN}Testing: {path}{Style.RESET_ALL}", end='\r')
+            yield Progress(i, len(self.sensitive_paths), f"Testing: {path}", errors)
             
             try:
-                response = requests.get(test_url, timeout=timeout, verify=False)
-                
-                if response.status_code == 200:
-                    disclosed_info.append({
-                        "type": "Sensitive File",
-                        "path": path,
-                        "url": test_url,
-                        "size": len(response.content)
-                    })
-                    print(f"{Fore.RED}[!] FOUND: {path} (Size: {len(response.content)} bytes){Style.RESET_ALL}")
-                    
-                    for pattern, description in self.sensitive_patterns:
-                        import re
-                        if re.search(pattern, response.text, re.IGNORECASE):
-                            disclosed_info.append({
-                                "type": "Sensitive Data",
-                                "path": path,
-                                "url": test_url,
-                                "description": description
-                            })
-                            print(f"{Fore.RED}    [!] Contains: {description}{Style.RESET_ALL}")
-            
+                response = get_client().get(test_url, timeout=timeout, verify=False)
             except Exception:
-                pass
+                errors += 1
+                continue
+            
+            if response.status_code == 200:
+                disclosed_info.append({
+                    "type": "Sensitive File",
+                    "path": path,
+                    "url": test_url,
+                    "size": len(response.content)
+                })
+                yield Finding("Sensitive file", test_url, severity="medium",
+                              description=f"{path} (Size: {len(response.content)} bytes)")
+                
+                for pattern, description in self.sensitive_patterns:
+                    if re.search(pattern, response.text, re.IGNORECASE):
+                        disclosed_info.append({
+                            "type": "Sensitive Data",
+                            "path": path,
+                            "url": test_url,
+                            "description": description
+                        })
+                        # One finding per kind of secret in the file
+                        yield Finding("Sensitive data", test_url, severity="high",
+                                      description=f"{path} contains: {description}", evidence_class=description)
+        yield Progress(len(self.sensitive_paths), len(self.sensitive_paths), errors=errors, done=True)
         
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         
@@ -131,14 +140,14 @@ class InformationDisclosure(BaseModule):
                     print(f"{Fore.RED}  Description: {info['description']}{Style.RESET_ALL}")
                 print()
             
-            return {
+            yield Result({
                 "success": True,
                 "message": f"Found {len(disclosed_info)} disclosure issues",
                 "disclosed": disclosed_info
-            }
+            })
         else:
             print(f"{Fore.GREEN}[+] No obvious information disclosure issues found{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
                 "message": "No issues found"
-            }
+            })
@@ -1,9 +1,10 @@
 """Port scanner module"""
 
-import socket
 from urllib.parse import urlparse
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
+from utils.net import probe_port
 
 class PortScanner(BaseModule):
     def __init__(self):
@@ -40,6 +41,9 @@ class PortScanner(BaseModule):
         }
     
     def run(self):
+        return self.collect()
+    
+    def stream(self):
         target = self.get_option("TARGET")
         ports_option = self.get_option("PORTS")
         timeout = int(self.get_option("TIMEOUT"))
@@ -62,25 +66,38 @@ class PortScanner(BaseModule):
                     ports = [int(p.strip()) for p in ports_option.split(',')]
             except Exception:
                 print(f"{Fore.RED}[!] Invalid port specification{Style.RESET_ALL}")
-                return {"success": False, "message": "Invalid port specification"}
+                yield Result({"success": False, "message": "Invalid port specification"})
+                return
         
-        open_ports = []
+        checkpoint = self.create_checkpoint()
+        start = checkpoint.state.get("index", 0)
+        open_ports = [tuple(p) for p in checkpoint.state.get("open_ports", [])]
+        if start:
+            print(f"{Fore.YELLOW}[*] Resuming from port index {start}/{len(ports)}{Style.RESET_ALL}\n")
         
-        for port in ports:
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(timeout)
-                result = sock.connect_ex((hostname, port))
-                sock.close()
-                
-                if result == 0:
+        errors = 0
+        index = start
+        try:
+            for index in range(start, len(ports)):
+                checkpoint.maybe_save(lambda: {"index": index, "open_ports": open_ports})
+                port = ports[index]
+                yield Progress(index + 1, len(ports), f"Port {port}", errors)
+                try:
+                    is_open = probe_port(hostname, port, timeout) == 0
+                except Exception:
+                    errors += 1
+                    continue
+                if is_open:
                     service = self.common_ports.get(port, "Unknown")
                     open_ports.append((port, service))
-                    print(f"{Fore.GREEN}[+] Port {port} OPEN ({service}){Style.RESET_ALL}")
-                else:
-                    print(f"{Fore.CYAN}[-] Port {port} closed{Style.RESET_ALL}", end='\r')
-            except Exception:
-                pass
+                    yield Finding("Open port", f"{hostname}:{port}", severity="info",
+                                  description=f"Port {port} OPEN ({service})")
+        except (KeyboardInterrupt, GeneratorExit):
+            checkpoint.save({"index": index, "open_ports": open_ports})
+            print(f"\n{Fore.YELLOW}[*] Scan interrupted, checkpoint saved: {checkpoint.id}{Style.RESET_ALL}")
+            raise
+        checkpoint.complete()
+        yield Progress(len(ports), len(ports), errors=errors, done=True)
         
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         
@@ -89,14 +106,14 @@ class PortScanner(BaseModule):
             for port, service in open_ports:
                 print(f"{Fore.CYAN}  Port {port}: {service}{Style.RESET_ALL}")
             print()
-            return {
+            yield Result({
                 "success": True,
                 "message": f"Found {len(open_ports)} open ports",
                 "open_ports": open_ports
-            }
+            })
         else:
             print(f"{Fore.YELLOW}[*] No open ports found{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
                 "message": "No open ports found"
-            }
+            })
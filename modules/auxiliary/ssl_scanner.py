@@ -1,11 +1,13 @@
 """SSL/TLS vulnerability scanner module"""
 
-import requests
 import ssl
-import socket
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from urllib.parse import urlparse
 from colorama import Fore, Style
 from modules.base import BaseModule
+from utils.context import check_cancelled, propagate
+from utils.net import open_connection
 
 class SSLScanner(BaseModule):
     def __init__(self):
@@ -15,12 +17,26 @@ class SSLScanner(BaseModule):
         self.options = {
             "URL": "",
             "TIMEOUT": "10",
+            "THREADS": "10",
+            "CIPHERS": "true",
         }
         self.required_options = ["URL"]
+        
+        self.protocols = [
+            ("SSLv3", ssl.TLSVersion.SSLv3),
+            ("TLSv1.0", ssl.TLSVersion.TLSv1),
+            ("TLSv1.1", ssl.TLSVersion.TLSv1_1),
+            ("TLSv1.2", ssl.TLSVersion.TLSv1_2),
+            ("TLSv1.3", ssl.TLSVersion.TLSv1_3),
+        ]
+        self.weak_protocols = ["SSLv3", "TLSv1.0", "TLSv1.1"]
+        self.weak_cipher_markers = ["NULL", "EXP", "RC4", "DES", "MD5", "ADH", "AECDH", "anon"]
     
     def run(self):
         url = self.get_option("URL")
         timeout = int(self.get_option("TIMEOUT"))
+        threads = max(1, int(self.get_option("THREADS")))
+        enumerate_ciphers = self.get_option("CIPHERS").lower() in ("true", "yes", "1")
         
         parsed = urlparse(url)
         hostname = parsed.hostname or parsed.path
@@ -34,51 +50,66 @@ class SSLScanner(BaseModule):
             "port": port,
             "issues": [],
             "protocols": [],
-            "ciphers": []
+            "ciphers": {},
+            "certificate": {}
         }
         
-        print(f"{Fore.CYAN}[*] Testing SSL/TLS protocols...{Style.RESET_ALL}\n")
-        
-        protocols = [
-            ("SSLv2", ssl.PROTOCOL_SSLv23),
-            ("SSLv3", ssl.PROTOCOL_SSLv23),
-            ("TLSv1.0", ssl.PROTOCOL_TLSv1),
-            ("TLSv1.1", ssl.PROTOCOL_TLSv1_1),
-            ("TLSv1.2", ssl.PROTOCOL_TLSv1_2),
-        ]
-        
-        try:
-            if hasattr(ssl, 'PROTOCOL_TLSv1_3'):
-                protocols.append(("TLSv1.3", ssl.PROTOCOL_TLSv1_3))
-        except AttributeError:
-            pass
-        
-        for proto_name, proto_const in protocols:
-            try:
-                context = ssl.SSLContext(proto_const)
-                with socket.create_connection((hostname, port), timeout=timeout) as sock:
-                    with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                        results["protocols"].append(proto_name)
-                        print(f"{Fore.GREEN}[+] {proto_name}: SUPPORTED{Style.RESET_ALL}")
-                        
-                        if proto_name in ["SSLv2", "SSLv3", "TLSv1.0"]:
-                            issue = f"Weak protocol {proto_name} is supported"
-                            results["issues"].append(issue)
-                            print(f"{Fore.RED}    [!] WARNING: {issue}{Style.RESET_ALL}")
-            except Exception:
-                print(f"{Fore.YELLOW}[-] {proto_name}: NOT SUPPORTED{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}[*] Testing SSL/TLS protocols and certificate...{Style.RESET_ALL}\n")
         
-        print(f"\n{Fore.CYAN}[*] Testing HTTPS certificate...{Style.RESET_ALL}\n")
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            # Round one: every protocol version, plus one handshake that reads the certificate
+            # without judging it and one that verifies it
+            cert_future = pool.submit(propagate(self._handshake), hostname, port, timeout)
+            verify_future = pool.submit(propagate(self._handshake), hostname, port, timeout, verify=True)
+            protocol_futures = [
+                (name, pool.submit(propagate(self._handshake), hostname, port, timeout, version=version))
+                for name, version in self.protocols
+            ]
+            
+            for proto_name, future in protocol_futures:
+                handshake = future.result()
+                # A killed job's handshakes return None, which must not be reported as unsupported
+                check_cancelled()
+                if handshake:
+                    results["protocols"].append(proto_name)
+                    results["ciphers"][proto_name] = [handshake["cipher"]]
+                    print(f"{Fore.GREEN}[+] {proto_name}: SUPPORTED{Style.RESET_ALL}")
+                    
+                    if proto_name in self.weak_protocols:
+                        issue = f"Weak protocol {proto_name} is supported"
+                        results["issues"].append(issue)
+                        print(f"{Fore.RED}    [!] WARNING: {issue}{Style.RESET_ALL}")
+                else:
+                    print(f"{Fore.YELLOW}[-] {proto_name}: NOT SUPPORTED{Style.RESET_ALL}")
+            
+            self._check_certificate(cert_future, verify_future, results)
+            
+            # Round two: per-cipher handshakes for every supported protocol. TLS 1.3 suites cannot
+            # be restricted from Python, so only the negotiated suite is reported for it.
+            if enumerate_ciphers:
+                print(f"\n{Fore.CYAN}[*] Enumerating cipher suites...{Style.RESET_ALL}\n")
+                versions = dict(self.protocols)
+                cipher_futures = [
+                    (proto_name, cipher, pool.submit(propagate(self._handshake), hostname, port, timeout,
+                                                     version=versions[proto_name], cipher=cipher))
+                    for proto_name in results["protocols"] if proto_name != "TLSv1.3"
+                    for cipher in self._candidate_ciphers()
+                ]
+                for proto_name, cipher, future in cipher_futures:
+                    accepted = future.result()
+                    check_cancelled()
+                    if accepted and cipher not in results["ciphers"][proto_name]:
+                        results["ciphers"][proto_name].append(cipher)
         
-        try:
-            response = requests.get(f"https://{hostname}:{port}", timeout=timeout, verify=True)
-            print(f"{Fore.GREEN}[+] Valid SSL certificate{Style.RESET_ALL}")
-        except requests.exceptions.SSLError as e:
-            issue = f"SSL certificate error: {str(e)}"
-            results["issues"].append(issue)
-            print(f"{Fore.RED}[!] {issue}{Style.RESET_ALL}")
-        except Exception as e:
-            print(f"{Fore.RED}[!] Error: {e}{Style.RESET_ALL}")
+        for proto_name, ciphers in results["ciphers"].items():
+            print(f"{Fore.CYAN}  {proto_name}: {len(ciphers)} cipher suite(s){Style.RESET_ALL}")
+            for cipher in ciphers:
+                if any(marker in cipher for marker in self.weak_cipher_markers):
+                    issue = f"Weak cipher {cipher} accepted over {proto_name}"
+                    results["issues"].append(issue)
+                    print(f"{Fore.RED}    [!] {cipher}{Style.RESET_ALL}")
+                else:
+                    print(f"{Fore.WHITE}    - {cipher}{Style.RESET_ALL}")
         
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         
@@ -99,3 +130,87 @@ class SSLScanner(BaseModule):
                 "message": "No major issues found",
                 "results": results
             }
+    
+    def _context(self, version=None, cipher: str = None) -> ssl.SSLContext:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        if version:
+            context.minimum_version = version
+            context.maximum_version = version
+        # SECLEVEL=0 lets OpenSSL offer the legacy protocols and ciphers being tested for
+        context.set_ciphers(f"{cipher or 'ALL:COMPLEMENTOFALL'}:@SECLEVEL=0")
+        return context
+    
+    def _candidate_ciphers(self) -> list:
+        try:
+            return [c["name"] for c in self._context().get_ciphers() if c["protocol"] != "TLSv1.3"]
+        except ssl.SSLError:
+            return []
+    
+    def _handshake(self, hostname: str, port: int, timeout: int, version=None, cipher: str = None,
+                   verify: bool = False):
+        try:
+            context = ssl.create_default_context() if verify else self._context(version, cipher)
+            with open_connection(hostname, port, timeout) as sock:
+                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
+                    # getpeercert() only decodes verified certificates; the DER form is always there
+                    der = ssock.getpeercert(binary_form=True)
+                    return {
+                        "version": ssock.version(),
+                        "cipher": ssock.cipher()[0],
+                        "cert": der
+                    }
+        except ssl.SSLCertVerificationError as e:
+            if verify:
+                return {"error": e.verify_message or str(e)}
+            return None
+        except Exception:
+            return None
+    
+    def _check_certificate(self, future, verify_future, results):
+        from utils.x509 import parse_certificate
+        print(f"\n{Fore.CYAN}[*] Certificate:{Style.RESET_ALL}\n")
+        handshake = future.result()
+        verified = verify_future.result()
+        
+        if not handshake:
+            print(f"{Fore.RED}[!] Error: could not complete a TLS handshake{Style.RESET_ALL}")
+            return
+        
+        try:
+            cert = parse_certificate(handshake["cert"]) if handshake["cert"] else {}
+        except (IndexError, ValueError):
+            cert = {}
+        subject = dict(item[0] for item in cert.get("subject", ()))
+        issuer = dict(item[0] for item in cert.get("issuer", ()))
+        certificate = {
+            "subject": subject.get("commonName"),
+            "issuer": issuer.get("organizationName") or issuer.get("commonName"),
+            "not_before": cert.get("notBefore"),
+            "not_after": cert.get("notAfter"),
+            "alt_names": [value for _, value in cert.get("subjectAltName", ())],
+            "verified": bool(verified) and "error" not in verified,
+            "negotiated": f"{handshake['version']} {handshake['cipher']}"
+        }
+        results["certificate"] = certificate
+        
+        if certificate["verified"]:
+            print(f"{Fore.GREEN}[+] Valid SSL certificate{Style.RESET_ALL}")
+        else:
+            error = verified["error"] if verified else "verifying handshake failed"
+            issue = f"SSL certificate error: {error}"
+            results["issues"].append(issue)
+            print(f"{Fore.RED}[!] {issue}{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}    Subject: {certificate['subject']}{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}    Issuer: {certificate['issuer']}{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}    Valid until: {certificate['not_after']}{Style.RESET_ALL}")
+        print(f"{Fore.WHITE}    Negotiated: {certificate['negotiated']}{Style.RESET_ALL}")
+        
+        if certificate["not_after"]:
+            expires = datetime.fromtimestamp(ssl.cert_time_to_seconds(certificate["not_after"]), timezone.utc)
+            days_left = (expires - datetime.now(timezone.utc)).days
+            if days_left < 30:
+                issue = f"Certificate expires in {days_left} days"
+                results["issues"].append(issue)
+                print(f"{Fore.RED}    [!] {issue}{Style.RESET_ALL}")
@@ -1,8 +1,8 @@
 """Subdomain enumeration module"""
 
-import dns.resolver
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
 
 class SubdomainEnumerator(BaseModule):
     def __init__(self):
@@ -30,6 +30,10 @@ class SubdomainEnumerator(BaseModule):
         ]
     
     def run(self):
+        return self.collect()
+    
+    def stream(self):
+        import dns.resolver
         domain = self.get_option("DOMAIN")
         wordlist_type = self.get_option("WORDLIST")
         
@@ -42,15 +46,17 @@ class SubdomainEnumerator(BaseModule):
         
         for i, subdomain in enumerate(wordlist, 1):
             full_domain = f"{subdomain}.{domain}"
-            print(f"{Fore.CYAN}[{i}/{len(wordlist)}] Testing: {full_domain}{Style.RESET_ALL}", end='\r')
+            yield Progress(i, len(wordlist), f"Testing: {full_domain}")
             
             try:
                 answers = dns.resolver.resolve(full_domain, 'A')
-                ips = [str(rdata) for rdata in answers]
-                found.append((full_domain, ips))
-                print(f"{Fore.GREEN}[+] FOUND: {full_domain} -> {', '.join(ips)}{Style.RESET_ALL}")
             except Exception:
-                pass
+                continue
+            ips = [str(rdata) for rdata in answers]
+            found.append((full_domain, ips))
+            yield Finding("Subdomain", full_domain, severity="info",
+                          description=f"{full_domain} -> {', '.join(ips)}", evidence=ips)
+        yield Progress(len(wordlist), len(wordlist), done=True)
         
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
         
@@ -59,14 +65,14 @@ class SubdomainEnumerator(BaseModule):
             for subdomain, ips in found:
                 print(f"{Fore.CYAN}  {subdomain} -> {', '.join(ips)}{Style.RESET_ALL}")
             
-            return {
+            yield Result({
                 "success": True,
                 "message": f"Found {len(found)} subdomains",
                 "found": found
-            }
+            })
         else:
             print(f"{Fore.YELLOW}[*] No subdomains found{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
                 "message": "No subdomains found"
-            }
+            })
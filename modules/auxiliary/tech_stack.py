@@ -1,6 +1,5 @@
 """Technology stack detection module"""
 
-import requests
 import re
 from colorama import Fore, Style
 from modules.base import BaseModule
@@ -69,6 +68,7 @@ class TechStackDetector(BaseModule):
         }
     
     def run(self):
+        from utils.http_client import get_client
         url = self.get_option("URL")
         timeout = int(self.get_option("TIMEOUT"))
         
@@ -76,7 +76,7 @@ class TechStackDetector(BaseModule):
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
         try:
-            response = requests.get(url, timeout=timeout, verify=False)
+            response = get_client().get(url, timeout=timeout, verify=False)
             html = response.text.lower()
             headers = response.headers
             
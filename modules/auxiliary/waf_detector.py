@@ -1,6 +1,5 @@
 """WAF (Web Application Firewall) Detector"""
 
-import requests
 from colorama import Fore, Style
 from modules.base import BaseModule
 import re
@@ -87,6 +86,8 @@ class WAFDetector(BaseModule):
         ]
     
     def run(self):
+        from utils.http_client import get_client
+        import requests
         url = self.options["URL"]["value"]
         timeout = int(self.options["TIMEOUT"]["value"])
         
@@ -100,7 +101,7 @@ class WAFDetector(BaseModule):
         
         try:
             print(f"{Fore.YELLOW}[*] Sending normal request...{Style.RESET_ALL}")
-            normal_response = requests.get(url, timeout=timeout, allow_redirects=True)
+            normal_response = get_client().get(url, timeout=timeout, allow_redirects=True)
             
             waf_info = self.check_waf_signatures(normal_response)
             if waf_info:
@@ -151,12 +152,14 @@ class WAFDetector(BaseModule):
         return detected
     
     def test_with_attacks(self, url, timeout):
+        from utils.http_client import get_client
+        import requests
         detected = []
         
         for payload in self.attack_payloads:
             try:
                 test_url = url + "?test=" + payload
-                response = requests.get(test_url, timeout=timeout, allow_redirects=False)
+                response = get_client().get(test_url, timeout=timeout, allow_redirects=False)
                 
                 if response.status_code in [403, 406, 429, 999]:
                     print(f"{Fore.YELLOW}[*] Attack blocked (Status: {response.status_code}) - WAF likely present{Style.RESET_ALL}")
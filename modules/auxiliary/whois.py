@@ -1,63 +1,145 @@
 """WHOIS lookup module"""
 
-import whois
+import os
 from colorama import Fore, Style
 from modules.base import BaseModule
+from utils.cache import ResultCache
+from utils.config import Config
 
 class WhoisLookup(BaseModule):
     def __init__(self):
         super().__init__()
         self.description = "WHOIS domain information lookup"
         self.module_type = "auxiliary"
+        config = Config()
         self.options = {
             "DOMAIN": "",
+            "CACHE_TTL": str(config.get("cache.whois_ttl", 86400)),
+            "OFFLINE": "false",
+            "DNS": "true",
         }
         self.required_options = ["DOMAIN"]
+        self.cache_path = os.path.join(config.get("cache.directory", "./cache"), "kotosploit_cache.db")
+        self.dns_record_types = ["A", "AAAA", "MX", "NS", "TXT"]
     
     def run(self):
-        domain = self.get_option("DOMAIN")
+        domain = self.get_option("DOMAIN").strip().lower().rstrip('.')
+        ttl = int(self.get_option("CACHE_TTL"))
+        offline = self.get_option("OFFLINE").lower() in ("true", "yes", "1")
+        with_dns = self.get_option("DNS").lower() in ("true", "yes", "1")
         
         print(f"{Fore.YELLOW}[*] Looking up WHOIS information for: {domain}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
+        cache = ResultCache(self.cache_path)
         try:
-            w = whois.whois(domain)
+            try:
+                info = self._cached_lookup(cache, "whois", domain, ttl, offline, self._whois)
+            except Exception as e:
+                print(f"{Fore.RED}[!] Error: {e}{Style.RESET_ALL}\n")
+                return {
+                    "success": False,
+                    "message": f"Error: {e}"
+                }
             
             print(f"{Fore.GREEN}[+] WHOIS Information:{Style.RESET_ALL}\n")
+            self._print_info(info)
             
-            info = {
-                "Domain Name": w.get('domain_name') if isinstance(w, dict) else getattr(w, 'domain_name', None),
-                "Registrar": w.get('registrar') if isinstance(w, dict) else getattr(w, 'registrar', None),
-                "Creation Date": w.get('creation_date') if isinstance(w, dict) else getattr(w, 'creation_date', None),
-                "Expiration Date": w.get('expiration_date') if isinstance(w, dict) else getattr(w, 'expiration_date', None),
-                "Updated Date": w.get('updated_date') if isinstance(w, dict) else getattr(w, 'updated_date', None),
-                "Name Servers": w.get('name_servers') if isinstance(w, dict) else getattr(w, 'name_servers', None),
-                "Status": w.get('status') if isinstance(w, dict) else getattr(w, 'status', None),
-                "Emails": w.get('emails') if isinstance(w, dict) else getattr(w, 'emails', None),
-                "Organization": w.get('org') if isinstance(w, dict) else getattr(w, 'org', None),
-                "Country": w.get('country') if isinstance(w, dict) else getattr(w, 'country', None),
-            }
-            
-            for key, value in info.items():
-                if value:
-                    if isinstance(value, list):
-                        print(f"{Fore.CYAN}  {key}:{Style.RESET_ALL}")
-                        for item in value:
-                            print(f"{Fore.WHITE}    - {item}{Style.RESET_ALL}")
-                    else:
-                        print(f"{Fore.CYAN}  {key}: {Fore.WHITE}{value}{Style.RESET_ALL}")
+            dns_records = {}
+            if with_dns:
+                try:
+                    dns_records = self._cached_lookup(cache, "dns", domain, ttl, offline, self._dns_records)
+                    print(f"\n{Fore.GREEN}[+] DNS Records:{Style.RESET_ALL}\n")
+                    self._print_info(dns_records)
+                except Exception as e:
+                    print(f"{Fore.YELLOW}[*] DNS metadata unavailable: {e}{Style.RESET_ALL}")
             
             print()
             
             return {
                 "success": True,
                 "message": "WHOIS lookup completed",
-                "data": info
-            }
-            
-        except Exception as e:
-            print(f"{Fore.RED}[!] Error: {e}{Style.RESET_ALL}\n")
-            return {
-                "success": False,
-                "message": f"Error: {e}"
+                "data": info,
+                "dns": dns_records
             }
+        finally:
+            cache.close()
+    
+    def _cached_lookup(self, cache: ResultCache, namespace: str, domain: str, ttl: int, offline: bool, lookup):
+        """Serve fresh cache hits, fall back to stale entries when offline or when the live lookup fails"""
+        cached = cache.get(namespace, domain)
+        if cached and (offline or cached[1] <= ttl):
+            print(f"{Fore.CYAN}[*] Using cached {namespace.upper()} data ({self._format_age(cached[1])} old){Style.RESET_ALL}")
+            return cached[0]
+        if offline:
+            raise LookupError(f"No cached {namespace.upper()} data for {domain} (offline mode)")
+        
+        try:
+            value = lookup(domain)
+        except Exception:
+            if not cached:
+                raise
+            print(f"{Fore.YELLOW}[*] Live {namespace.upper()} lookup failed, using stale cache "
+                  f"({self._format_age(cached[1])} old){Style.RESET_ALL}")
+            return cached[0]
+        
+        cache.set(namespace, domain, value)
+        return value
+    
+    def _whois(self, domain: str) -> dict:
+        import whois
+        w = whois.whois(domain)
+        fields = {
+            "Domain Name": "domain_name",
+            "Registrar": "registrar",
+            "Creation Date": "creation_date",
+            "Expiration Date": "expiration_date",
+            "Updated Date": "updated_date",
+            "Name Servers": "name_servers",
+            "Status": "status",
+            "Emails": "emails",
+            "Organization": "org",
+            "Country": "country",
+        }
+        info = {}
+        for label, field in fields.items():
+            value = w.get(field) if isinstance(w, dict) else getattr(w, field, None)
+            info[label] = self._serialize(value)
+        return info
+    
+    def _dns_records(self, domain: str) -> dict:
+        import dns.resolver
+        records = {}
+        for record_type in self.dns_record_types:
+            try:
+                answers = dns.resolver.resolve(domain, record_type)
+                records[record_type] = [str(rdata) for rdata in answers]
+            except Exception:
+                pass
+        if not records:
+            raise LookupError(f"No DNS records found for {domain}")
+        return records
+    
+    def _serialize(self, value):
+        if isinstance(value, (list, tuple, set)):
+            return [self._serialize(item) for item in value]
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return value
+    
+    def _print_info(self, info: dict):
+        for key, value in info.items():
+            if value:
+                if isinstance(value, list):
+                    print(f"{Fore.CYAN}  {key}:{Style.RESET_ALL}")
+                    for item in value:
+                        print(f"{Fore.WHITE}    - {item}{Style.RESET_ALL}")
+                else:
+                    print(f"{Fore.CYAN}  {key}: {Fore.WHITE}{value}{Style.RESET_ALL}")
+    
+    def _format_age(self, seconds: float) -> str:
+        if seconds < 3600:
+            return f"{int(seconds // 60)}m"
+        if seconds < 86400:
+            return f"{seconds / 3600:.1f}h"
+        return f"{seconds / 86400:.1f}d"
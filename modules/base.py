@@ -1,20 +1,104 @@
 """Base module class for all Kotosploit modules"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+from colorama import Fore, Style
+from modules.events import Finding, Result
+from utils.checkpoint import Checkpoint
 
 class BaseModule(ABC):
+    # Bump when a module's checks change so incremental rescans test everything again
+    version = "1.0"
+    
     def __init__(self):
         self.options = {}
         self.required_options = []
         self.description = ""
         self.author = "Kotosploit Team"
         self.module_type = "base"
-        
+        self.resume_state = None
+    
     @abstractmethod
     def run(self) -> Dict[str, Any]:
         pass
     
+    def stream(self) -> Iterator[Any]:
+        """Yield Finding/Progress events as work happens, ending with a Result.
+        
+        Modules that don't stream get their run() result wrapped as the only event.
+        """
+        yield Result(self.run() or {})
+    
+    def collect(self, on_event: Callable[[Any], None] = None) -> Dict[str, Any]:
+        """Drive stream(), handing each event to on_event (a progress renderer by default)"""
+        from utils.http_client import get_client
+        from utils.metrics import get_registry, module_label, module_scope
+        from utils.progress import ProgressRenderer
+        renderer = None if on_event else ProgressRenderer()
+        on_event = on_event or renderer.handle
+        result = {}
+        registry = get_registry()
+        label = module_label(self.__class__.__module__)
+        try:
+            # Requests and connections made while the module runs are counted against it, and
+            # cookies it picks up don't carry over into other modules, jobs or later runs
+            with module_scope(label), get_client().cookie_scope():
+                for event in self._event_source():
+                    if isinstance(event, Result):
+                        result = event.data
+                    else:
+                        if isinstance(event, Finding):
+                            registry.record_finding(label, event.severity)
+                        on_event(event)
+        finally:
+            if renderer:
+                renderer.close()
+        return result
+    
+    def incremental_key(self) -> Optional[Tuple[str, str, Any]]:
+        """(url, endpoint, test set) for modules that support the INCREMENTAL option.
+        
+        url is fetched to tell whether the endpoint changed, endpoint names what is tested there
+        and test set is everything (payloads, patterns) whose change means testing again.
+        """
+        return None
+    
+    def _event_source(self) -> Iterator[Any]:
+        """stream(), or the stored events of the last run when INCREMENTAL is on and nothing changed"""
+        incremental = str(self.get_option("INCREMENTAL") or "").lower() in ("true", "yes", "1")
+        key = self.incremental_key() if incremental else None
+        if not key:
+            yield from self.stream()
+            return
+        
+        from utils.incremental import EndpointCheck, ScanState, test_set_hash
+        url, endpoint, test_set = key
+        timeout = int(self.get_option("TIMEOUT") or 10)
+        state = ScanState()
+        try:
+            check = EndpointCheck(state, self.__class__.__module__, endpoint, url,
+                                  test_set_hash(self.version, test_set), timeout)
+            if check.unchanged:
+                previous = check.previous["data"]
+                print(f"{Fore.GREEN}[*] {endpoint} unchanged since the last scan, "
+                      f"reusing {len(previous['findings'])} finding(s){Style.RESET_ALL}")
+                # Re-yielded so reports, the findings database and diffs still see them
+                for finding in previous["findings"]:
+                    yield Finding.from_dict(finding)
+                yield Result(dict(previous["result"], incremental="unchanged"))
+                return
+            
+            findings = []
+            for event in self.stream():
+                if isinstance(event, Finding):
+                    findings.append(event.to_dict())
+                elif isinstance(event, Result) and not event.data.get("probe_errors"):
+                    # A run where probes failed (breaker open, rate limiting) isn't a result worth replaying
+                    check.save({"findings": findings, "result": event.data})
+                yield event
+        finally:
+            state.close()
+    
     def set_option(self, name: str, value: Any):
         if name.upper() in self.options:
             self.options[name.upper()] = value
@@ -42,5 +126,17 @@ class BaseModule(ABC):
             "name": self.__class__.__name__,
             "description": self.description,
             "author": self.author,
-            "type": self.module_type
+            "type": self.module_type,
+            "version": self.version
         }
+    
+    def create_checkpoint(self) -> Checkpoint:
+        """Return the checkpoint for this run, picking up saved state when resuming"""
+        resume = self.resume_state or {}
+        self.resume_state = None
+        return Checkpoint(
+            module=self.__class__.__module__,
+            options=dict(self.options),
+            checkpoint_id=resume.get("id"),
+            state=resume.get("state")
+        )
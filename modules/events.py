@@ -0,0 +1,88 @@
+"""Events yielded by modules that stream their results"""
+
+from datetime import datetime
+from typing import Any, Dict
+from colorama import Fore, Style
+from utils.dedup import fingerprint
+
+SEVERITY_COLORS = {
+    "critical": Fore.RED,
+    "high": Fore.RED,
+    "medium": Fore.YELLOW,
+    "low": Fore.CYAN,
+    "info": Fore.GREEN,
+}
+
+class Finding:
+    def __init__(self, type: str, target: str, parameter: str = None, payload: str = None,
+                 severity: str = "high", description: str = None, evidence: Any = None,
+                 module: str = None, evidence_class: str = None):
+        self.type = type
+        self.target = target
+        self.parameter = parameter
+        self.payload = payload
+        self.severity = severity
+        self.description = description
+        self.evidence = evidence
+        self.module = module
+        self.evidence_class = evidence_class
+        # Same issue found by different payloads or runs shares a fingerprint
+        self.fingerprint = fingerprint(type, target, parameter, evidence_class)
+        self.discovered_at = datetime.now().isoformat()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "target": self.target,
+            "parameter": self.parameter,
+            "payload": self.payload,
+            "severity": self.severity,
+            "description": self.description,
+            "evidence": self.evidence,
+            "module": self.module,
+            "evidence_class": self.evidence_class,
+            "fingerprint": self.fingerprint,
+            "discovered_at": self.discovered_at
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Finding":
+        finding = cls(data["type"], data["target"], parameter=data.get("parameter"),
+                      payload=data.get("payload"), severity=data.get("severity", "high"),
+                      description=data.get("description"), evidence=data.get("evidence"),
+                      module=data.get("module"), evidence_class=data.get("evidence_class"))
+        finding.discovered_at = data.get("discovered_at") or finding.discovered_at
+        return finding
+
+
+class Progress:
+    def __init__(self, current: int, total: int = None, message: str = "", errors: int = None,
+                 done: bool = False):
+        self.current = current
+        self.total = total
+        self.message = message
+        self.errors = errors
+        self.done = done
+
+
+class Result:
+    """Last event of a stream; data is what run() returns"""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+
+def format_finding(finding: Finding) -> str:
+    """Console line(s) for a finding"""
+    color = SEVERITY_COLORS.get(finding.severity, Fore.RED)
+    marker = "[+]" if finding.severity == "info" else "[!]"
+    if finding.description:
+        line = f"{finding.type}: {finding.description}"
+    elif finding.parameter:
+        line = f"{finding.type} in '{finding.parameter}'"
+    else:
+        line = f"{finding.type}: {finding.target}"
+    text = f"{color}{marker} {line}{Style.RESET_ALL}"
+    if finding.payload:
+        text += f"\n{Fore.YELLOW}    Payload: {finding.payload}{Style.RESET_ALL}"
+    return text
@@ -1,10 +1,10 @@
 """Command Injection scanner module"""
 
-import requests
 import urllib.parse
 import time
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
 
 class CommandInjectionScanner(BaseModule):
     def __init__(self):
@@ -16,6 +16,7 @@ class CommandInjectionScanner(BaseModule):
             "PARAM": "",
             "METHOD": "GET",
             "TIMEOUT": "10",
+            "INCREMENTAL": "false",
         }
         self.required_options = ["URL", "PARAM"]
         
@@ -73,6 +74,14 @@ class CommandInjectionScanner(BaseModule):
         ]
     
     def run(self):
+        return self.collect()
+    
+    def incremental_key(self):
+        url = self.get_option("URL")
+        endpoint = f"{self.get_option('METHOD').upper()} {url} {self.get_option('PARAM')}"
+        return url, endpoint, [self.payloads, self.detection_patterns, self.get_option("TIMEOUT")]
+    
+    def stream(self):
         url = self.get_option("URL")
         param = self.get_option("PARAM")
         method = self.get_option("METHOD").upper()
@@ -83,51 +92,53 @@ class CommandInjectionScanner(BaseModule):
         print(f"{Fore.YELLOW}[*] Method: {method}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
-        vulnerabilities = []
+        found = 0
+        self._probe_errors = 0
         
         for i, payload in enumerate(self.payloads, 1):
-            print(f"{Fore.CYAN}[{i}/{len(self.payloads)}] Testing payload: {payload[:50]}...{Style.RESET_ALL}")
+            yield Progress(i, len(self.payloads), f"Testing payload: {payload[:50]}...", self._probe_errors)
             
             vuln_type = self._test_payload(url, param, payload, method, timeout)
             if vuln_type:
-                vulnerabilities.append({
-                    "payload": payload,
-                    "parameter": param,
-                    "type": vuln_type
-                })
-                print(f"{Fore.RED}[!] VULNERABLE ({vuln_type})!{Style.RESET_ALL}")
+                found += 1
+                yield Finding(vuln_type, url, parameter=param, payload=payload)
         
+        yield Progress(len(self.payloads), len(self.payloads), errors=self._probe_errors, done=True)
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        if self._probe_errors:
+            print(f"{Fore.YELLOW}[*] {self._probe_errors} probes failed to get a response{Style.RESET_ALL}")
         
-        if vulnerabilities:
-            print(f"{Fore.RED}[!] Found {len(vulnerabilities)} potential Command Injection vulnerabilities!{Style.RESET_ALL}\n")
-            for vuln in vulnerabilities:
-                print(f"{Fore.YELLOW}  Type: {vuln['type']}{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}  Param: {vuln['parameter']}{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}  Payload: {vuln['payload']}{Style.RESET_ALL}\n")
-            
-            return {
+        if found:
+            print(f"{Fore.RED}[!] Found {found} potential Command Injection vulnerabilities!{Style.RESET_ALL}\n")
+            yield Result({
                 "success": True,
-                "message": f"Found {len(vulnerabilities)} vulnerabilities",
-                "vulnerabilities": vulnerabilities
-            }
+                "message": f"Found {found} vulnerabilities",
+                "findings": found,
+                "probe_errors": self._probe_errors
+            })
         else:
             print(f"{Fore.GREEN}[+] No Command Injection vulnerabilities detected{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
-                "message": "No vulnerabilities found"
-            }
+                "message": "No vulnerabilities found",
+                "findings": 0,
+                "probe_errors": self._probe_errors
+            })
     
     def _test_payload(self, url, param, payload, method, timeout):
+        # Time-based payloads need the full timeout to tell a deliberate delay from a slow host
+        from utils.http_client import get_client
+        import requests
+        adaptive = "sleep" not in payload.lower()
         try:
             start_time = time.time()
             
             if method == "GET":
                 test_url = f"{url}?{param}={urllib.parse.quote(payload)}"
-                response = requests.get(test_url, timeout=timeout, verify=False)
+                response = get_client().get(test_url, timeout=timeout, verify=False, adaptive_timeout=adaptive)
             else:
                 data = {param: payload}
-                response = requests.post(url, data=data, timeout=timeout, verify=False)
+                response = get_client().post(url, data=data, timeout=timeout, verify=False, adaptive_timeout=adaptive)
             
             elapsed_time = time.time() - start_time
             
@@ -137,11 +148,12 @@ class CommandInjectionScanner(BaseModule):
             
             if "sleep" in payload.lower() and elapsed_time >= 5:
                 return "Time-based Command Injection"
-            
+        
         except requests.exceptions.Timeout:
             if "sleep" in payload.lower():
                 return "Time-based Command Injection"
+            self._probe_errors += 1
         except Exception:
-            pass
+            self._probe_errors += 1
         
         return None
@@ -1,7 +1,5 @@
 """CSRF (Cross-Site Request Forgery) Vulnerability Detector"""
 
-import requests
-from bs4 import BeautifulSoup
 from colorama import Fore, Style
 from modules.base import BaseModule
 import re
@@ -49,6 +47,8 @@ class CSRFDetector(BaseModule):
         ]
     
     def run(self):
+        from utils.http_client import get_client
+        import requests
         url = self.options["URL"]["value"]
         check_forms = self.options["CHECK_FORMS"]["value"].lower() == "true"
         check_headers = self.options["CHECK_HEADERS"]["value"].lower() == "true"
@@ -63,7 +63,7 @@ class CSRFDetector(BaseModule):
         vulnerabilities = []
         
         try:
-            response = requests.get(url, timeout=timeout, allow_redirects=True)
+            response = get_client().get(url, timeout=timeout, allow_redirects=True)
             
             if check_headers:
                 header_vulns = self.check_csrf_headers(response)
@@ -103,6 +103,7 @@ class CSRFDetector(BaseModule):
         return vulns
     
     def check_forms(self, response, base_url):
+        from bs4 import BeautifulSoup
         vulns = []
         
         print(f"\n{Fore.YELLOW}[*] Analyzing forms for CSRF tokens...{Style.RESET_ALL}")
@@ -1,9 +1,9 @@
 """Open Redirect vulnerability scanner module"""
 
-import requests
 import urllib.parse
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
 from modules.payloads.wordlists import OPEN_REDIRECT_PAYLOADS
 
 class OpenRedirectScanner(BaseModule):
@@ -16,10 +16,19 @@ class OpenRedirectScanner(BaseModule):
             "PARAM": "url",
             "METHOD": "GET",
             "TIMEOUT": "10",
+            "INCREMENTAL": "false",
         }
         self.required_options = ["URL", "PARAM"]
     
     def run(self):
+        return self.collect()
+    
+    def incremental_key(self):
+        url = self.get_option("URL")
+        endpoint = f"{self.get_option('METHOD').upper()} {url} {self.get_option('PARAM')}"
+        return url, endpoint, OPEN_REDIRECT_PAYLOADS
+    
+    def stream(self):
         url = self.get_option("URL")
         param = self.get_option("PARAM")
         method = self.get_option("METHOD").upper()
@@ -30,53 +39,54 @@ class OpenRedirectScanner(BaseModule):
         print(f"{Fore.YELLOW}[*] Method: {method}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
-        vulnerabilities = []
+        found = 0
+        self._probe_errors = 0
         
         for i, payload in enumerate(OPEN_REDIRECT_PAYLOADS, 1):
-            print(f"{Fore.CYAN}[{i}/{len(OPEN_REDIRECT_PAYLOADS)}] Testing payload: {payload}{Style.RESET_ALL}")
+            yield Progress(i, len(OPEN_REDIRECT_PAYLOADS), f"Testing payload: {payload}", self._probe_errors)
             
             if self._test_payload(url, param, payload, method, timeout):
-                vulnerabilities.append({
-                    "payload": payload,
-                    "parameter": param
-                })
-                print(f"{Fore.RED}[!] VULNERABLE (Open Redirect)!{Style.RESET_ALL}")
+                found += 1
+                yield Finding("Open Redirect", url, parameter=param, payload=payload)
         
+        yield Progress(len(OPEN_REDIRECT_PAYLOADS), len(OPEN_REDIRECT_PAYLOADS), errors=self._probe_errors, done=True)
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        if self._probe_errors:
+            print(f"{Fore.YELLOW}[*] {self._probe_errors} probes failed to get a response{Style.RESET_ALL}")
         
-        if vulnerabilities:
-            print(f"{Fore.RED}[!] Found {len(vulnerabilities)} potential Open Redirect vulnerabilities!{Style.RESET_ALL}\n")
-            for vuln in vulnerabilities:
-                print(f"{Fore.YELLOW}  Param: {vuln['parameter']}{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}  Payload: {vuln['payload']}{Style.RESET_ALL}\n")
-            
-            return {
+        if found:
+            print(f"{Fore.RED}[!] Found {found} potential Open Redirect vulnerabilities!{Style.RESET_ALL}\n")
+            yield Result({
                 "success": True,
-                "message": f"Found {len(vulnerabilities)} vulnerabilities",
-                "vulnerabilities": vulnerabilities
-            }
+                "message": f"Found {found} vulnerabilities",
+                "findings": found,
+                "probe_errors": self._probe_errors
+            })
         else:
             print(f"{Fore.GREEN}[+] No Open Redirect vulnerabilities detected{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
-                "message": "No vulnerabilities found"
-            }
+                "message": "No vulnerabilities found",
+                "findings": 0,
+                "probe_errors": self._probe_errors
+            })
     
     def _test_payload(self, url, param, payload, method, timeout):
+        from utils.http_client import get_client
         try:
             if method == "GET":
                 test_url = f"{url}?{param}={urllib.parse.quote(payload)}"
-                response = requests.get(test_url, timeout=timeout, verify=False, allow_redirects=False)
+                response = get_client().get(test_url, timeout=timeout, verify=False, allow_redirects=False)
             else:
                 data = {param: payload}
-                response = requests.post(url, data=data, timeout=timeout, verify=False, allow_redirects=False)
+                response = get_client().post(url, data=data, timeout=timeout, verify=False, allow_redirects=False)
             
             if response.status_code in [301, 302, 303, 307, 308]:
                 location = response.headers.get('Location', '')
                 if 'evil.com' in location.lower() or 'google.com' in location.lower():
                     return True
-            
+        
         except Exception:
-            pass
+            self._probe_errors += 1
         
         return False
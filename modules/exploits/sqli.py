@@ -1,9 +1,9 @@
 """SQL Injection scanner module"""
 
-import requests
 import urllib.parse
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
 
 class SQLInjectionScanner(BaseModule):
     def __init__(self):
@@ -15,6 +15,7 @@ class SQLInjectionScanner(BaseModule):
             "PARAM": "",
             "METHOD": "GET",
             "TIMEOUT": "10",
+            "INCREMENTAL": "false",
         }
         self.required_options = ["URL", "PARAM"]
         
@@ -58,6 +59,14 @@ class SQLInjectionScanner(BaseModule):
         ]
     
     def run(self):
+        return self.collect()
+    
+    def incremental_key(self):
+        url = self.get_option("URL")
+        endpoint = f"{self.get_option('METHOD').upper()} {url} {self.get_option('PARAM')}"
+        return url, endpoint, [self.payloads, self.error_patterns, self.get_option("TIMEOUT")]
+    
+    def stream(self):
         url = self.get_option("URL")
         param = self.get_option("PARAM")
         method = self.get_option("METHOD").upper()
@@ -68,50 +77,52 @@ class SQLInjectionScanner(BaseModule):
         print(f"{Fore.YELLOW}[*] Method: {method}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
-        vulnerabilities = []
+        found = 0
+        # Probes whose request failed; a scan with any of these isn't a clean result
+        self._probe_errors = 0
         
         for i, payload in enumerate(self.payloads, 1):
-            print(f"{Fore.CYAN}[{i}/{len(self.payloads)}] Testing payload: {payload[:50]}...{Style.RESET_ALL}")
+            yield Progress(i, len(self.payloads), f"Testing payload: {payload[:50]}...", self._probe_errors)
             
             vulnerable, vuln_type = self._test_payload(url, param, payload, method, timeout)
-            
             if vulnerable:
-                vulnerabilities.append({
-                    "payload": payload,
-                    "type": vuln_type,
-                    "parameter": param
-                })
-                print(f"{Fore.RED}[!] VULNERABLE ({vuln_type})!{Style.RESET_ALL}")
+                found += 1
+                yield Finding(vuln_type, url, parameter=param, payload=payload)
         
+        yield Progress(len(self.payloads), len(self.payloads), errors=self._probe_errors, done=True)
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        if self._probe_errors:
+            print(f"{Fore.YELLOW}[*] {self._probe_errors} probes failed to get a response{Style.RESET_ALL}")
         
-        if vulnerabilities:
-            print(f"{Fore.RED}[!] Found {len(vulnerabilities)} potential SQL injection vulnerabilities!{Style.RESET_ALL}\n")
-            for vuln in vulnerabilities:
-                print(f"{Fore.YELLOW}  Type: {vuln['type']}{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}  Param: {vuln['parameter']}{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}  Payload: {vuln['payload']}{Style.RESET_ALL}\n")
-            
-            return {
+        if found:
+            print(f"{Fore.RED}[!] Found {found} potential SQL injection vulnerabilities!{Style.RESET_ALL}\n")
+            yield Result({
                 "success": True,
-                "message": f"Found {len(vulnerabilities)} vulnerabilities",
-                "vulnerabilities": vulnerabilities
-            }
+                "message": f"Found {found} vulnerabilities",
+                "findings": found,
+                "probe_errors": self._probe_errors
+            })
         else:
             print(f"{Fore.GREEN}[+] No SQL injection vulnerabilities detected{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
-                "message": "No vulnerabilities found"
-            }
+                "message": "No vulnerabilities found",
+                "findings": 0,
+                "probe_errors": self._probe_errors
+            })
     
     def _test_payload(self, url, param, payload, method, timeout):
+        from utils.http_client import get_client
+        import requests
+        # SLEEP/WAITFOR payloads are detected by timing out, so they keep the full TIMEOUT
+        adaptive = not ("SLEEP" in payload or "WAITFOR" in payload)
         try:
             if method == "GET":
                 test_url = f"{url}?{param}={urllib.parse.quote(payload)}"
-                response = requests.get(test_url, timeout=timeout, verify=False)
+                response = get_client().get(test_url, timeout=timeout, verify=False, adaptive_timeout=adaptive)
             else:
                 data = {param: payload}
-                response = requests.post(url, data=data, timeout=timeout, verify=False)
+                response = get_client().post(url, data=data, timeout=timeout, verify=False, adaptive_timeout=adaptive)
             
             for pattern in self.error_patterns:
                 if pattern.lower() in response.text.lower():
@@ -119,11 +130,12 @@ class SQLInjectionScanner(BaseModule):
             
             if len(response.text) > 10000:
                 return True, "Union-based SQLi (suspected)"
-            
+        
         except requests.exceptions.Timeout:
             if "SLEEP" in payload or "WAITFOR" in payload:
                 return True, "Time-based SQLi"
+            self._probe_errors += 1
         except Exception:
-            pass
+            self._probe_errors += 1
         
         return False, None
@@ -1,9 +1,9 @@
 """Cross-Site Scripting (XSS) detector module"""
 
-import requests
 import urllib.parse
 from colorama import Fore, Style
 from modules.base import BaseModule
+from modules.events import Finding, Progress, Result
 
 class XSSDetector(BaseModule):
     def __init__(self):
@@ -15,6 +15,7 @@ class XSSDetector(BaseModule):
             "PARAM": "",
             "METHOD": "GET",
             "TIMEOUT": "10",
+            "INCREMENTAL": "false",
         }
         self.required_options = ["URL", "PARAM"]
         
@@ -40,6 +41,14 @@ class XSSDetector(BaseModule):
         ]
     
     def run(self):
+        return self.collect()
+    
+    def incremental_key(self):
+        url = self.get_option("URL")
+        endpoint = f"{self.get_option('METHOD').upper()} {url} {self.get_option('PARAM')}"
+        return url, endpoint, self.payloads
+    
+    def stream(self):
         url = self.get_option("URL")
         param = self.get_option("PARAM")
         method = self.get_option("METHOD").upper()
@@ -50,51 +59,52 @@ class XSSDetector(BaseModule):
         print(f"{Fore.YELLOW}[*] Method: {method}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
         
-        vulnerabilities = []
+        found = 0
+        self._probe_errors = 0
         
         for i, payload in enumerate(self.payloads, 1):
-            print(f"{Fore.CYAN}[{i}/{len(self.payloads)}] Testing payload: {payload[:50]}...{Style.RESET_ALL}")
+            yield Progress(i, len(self.payloads), f"Testing payload: {payload[:50]}...", self._probe_errors)
             
             if self._test_payload(url, param, payload, method, timeout):
-                vulnerabilities.append({
-                    "payload": payload,
-                    "parameter": param
-                })
-                print(f"{Fore.RED}[!] VULNERABLE (Reflected XSS)!{Style.RESET_ALL}")
+                found += 1
+                yield Finding("Reflected XSS", url, parameter=param, payload=payload)
         
+        yield Progress(len(self.payloads), len(self.payloads), errors=self._probe_errors, done=True)
         print(f"\n{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
+        if self._probe_errors:
+            print(f"{Fore.YELLOW}[*] {self._probe_errors} probes failed to get a response{Style.RESET_ALL}")
         
-        if vulnerabilities:
-            print(f"{Fore.RED}[!] Found {len(vulnerabilities)} potential XSS vulnerabilities!{Style.RESET_ALL}\n")
-            for vuln in vulnerabilities:
-                print(f"{Fore.YELLOW}  Param: {vuln['parameter']}{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}  Payload: {vuln['payload']}{Style.RESET_ALL}\n")
-            
-            return {
+        if found:
+            print(f"{Fore.RED}[!] Found {found} potential XSS vulnerabilities!{Style.RESET_ALL}\n")
+            yield Result({
                 "success": True,
-                "message": f"Found {len(vulnerabilities)} vulnerabilities",
-                "vulnerabilities": vulnerabilities
-            }
+                "message": f"Found {found} vulnerabilities",
+                "findings": found,
+                "probe_errors": self._probe_errors
+            })
         else:
             print(f"{Fore.GREEN}[+] No XSS vulnerabilities detected{Style.RESET_ALL}\n")
-            return {
+            yield Result({
                 "success": True,
-                "message": "No vulnerabilities found"
-            }
+                "message": "No vulnerabilities found",
+                "findings": 0,
+                "probe_errors": self._probe_errors
+            })
     
     def _test_payload(self, url, param, payload, method, timeout):
+        from utils.http_client import get_client
         try:
             if method == "GET":
                 test_url = f"{url}?{param}={urllib.parse.quote(payload)}"
-                response = requests.get(test_url, timeout=timeout, verify=False)
+                response = get_client().get(test_url, timeout=timeout, verify=False)
             else:
                 data = {param: payload}
-                response = requests.post(url, data=data, timeout=timeout, verify=False)
+                response = get_client().post(url, data=data, timeout=timeout, verify=False)
             
             if payload in response.text or urllib.parse.quote(payload) in response.text:
                 return True
-            
+        
         except Exception:
-            pass
+            self._probe_errors += 1
         
         return False
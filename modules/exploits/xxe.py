@@ -1,6 +1,5 @@
 """XXE (XML External Entity) Vulnerability Scanner"""
 
-import requests
 from colorama import Fore, Style
 from modules.base import BaseModule
 import re
@@ -106,6 +105,8 @@ class XXEScanner(BaseModule):
         ]
     
     def run(self):
+        from utils.http_client import get_client
+        import requests
         url = self.options["URL"]["value"]
         method = self.options["METHOD"]["value"].upper()
         param = self.options["PARAM"]["value"]
@@ -132,15 +133,15 @@ class XXEScanner(BaseModule):
                 if method == "POST":
                     if param:
                         data = {param: payload_info['payload']}
-                        response = requests.post(url, data=data, headers=headers, timeout=timeout)
+                        response = get_client().post(url, data=data, headers=headers, timeout=timeout)
                     else:
-                        response = requests.post(url, data=payload_info['payload'], headers=headers, timeout=timeout)
+                        response = get_client().post(url, data=payload_info['payload'], headers=headers, timeout=timeout)
                 else:
                     if param:
                         params = {param: payload_info['payload']}
-                        response = requests.get(url, params=params, headers=headers, timeout=timeout)
+                        response = get_client().get(url, params=params, headers=headers, timeout=timeout)
                     else:
-                        response = requests.get(url, headers=headers, timeout=timeout)
+                        response = get_client().get(url, headers=headers, timeout=timeout)
                 
                 if self.check_xxe_response(response.text, payload_info['name']):
                     vulnerabilities.append({
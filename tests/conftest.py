@@ -0,0 +1,45 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+class _Handler(BaseHTTPRequestHandler):
+    # /admin and /login exist; /cookie sets a cookie and echoes the ones sent; everything else is a 404
+    pages = {"/": b"<html><a href='/admin'>admin</a></html>", "/admin": b"admin panel", "/login": b"login"}
+    
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/cookie":
+            body = (self.headers.get("Cookie") or "").encode()
+            self.send_response(200)
+            self.send_header("Set-Cookie", "sid=1; Path=/")
+        else:
+            body = self.pages.get(path)
+            self.send_response(200 if body is not None else 404)
+            body = body if body is not None else b"not found"
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def http_server():
+    """Base URL of a local web server"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in a scratch directory so checkpoints, caches and sessions don't land in the repo"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,29 @@
+from conftest import _Handler
+from modules.auxiliary.info_disclosure import InformationDisclosure
+from modules.auxiliary.port_scanner import PortScanner
+from modules.events import Finding
+
+def _findings(module):
+    events = []
+    result = module.collect(events.append)
+    return result, [event for event in events if isinstance(event, Finding)]
+
+def test_open_port_is_a_finding(http_server, workdir):
+    port = http_server.rsplit(":", 1)[1]
+    module = PortScanner()
+    module.set_option("TARGET", "127.0.0.1")
+    module.set_option("PORTS", port)
+    
+    result, findings = _findings(module)
+    assert result["open_ports"] == [(int(port), "Unknown")]
+    assert [(f.type, f.target) for f in findings] == [("Open port", f"127.0.0.1:{port}")]
+
+def test_disclosed_file_and_secret_are_findings(http_server, workdir, monkeypatch):
+    monkeypatch.setitem(_Handler.pages, "/.env", b"api_key = 'abc123'")
+    module = InformationDisclosure()
+    module.set_option("URL", http_server)
+    
+    result, findings = _findings(module)
+    assert len(result["disclosed"]) == 2
+    assert [(f.type, f.target) for f in findings] == [("Sensitive file", f"{http_server}/.env"),
+                                                      ("Sensitive data", f"{http_server}/.env")]
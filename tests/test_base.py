@@ -0,0 +1,13 @@
+from modules.auxiliary.dirfuzz import DirectoryFuzzer
+
+def test_module_instance_runs_twice(http_server, workdir):
+    module = DirectoryFuzzer()
+    module.set_option("URL", http_server)
+    module.set_option("THREADS", "2")
+    
+    first = module.collect(lambda event: None)
+    second = module.collect(lambda event: None)
+    
+    assert first["success"] and second["success"]
+    assert {path for path, _, _ in first["found"]} == {"admin", "login"}
+    assert sorted(second["found"]) == sorted(first["found"])
@@ -0,0 +1,29 @@
+from core.batch import BatchRunner, parse_script
+
+def run(script):
+    return BatchRunner(parse_script(script), workers=1).run()
+
+def test_unknown_module_fails_block(workdir):
+    summary = run("use exploit/doesnotexist\nrun\n")
+    assert not summary["success"]
+    assert summary["blocks"][0]["errors"] == ["Failed: use exploit/doesnotexist", "Failed: run"]
+
+def test_missing_option_and_bad_set_fail_block(workdir):
+    summary = run("use exploit/xss\nset NOSUCHOPTION 1\nrun\n")
+    assert summary["blocks"][0]["errors"] == ["Failed: set NOSUCHOPTION 1", "Failed: run"]
+
+def test_successful_block(http_server, workdir):
+    summary = run(f"use exploit/xss\nset URL {http_server}/\nset PARAM q\nrun\n")
+    assert summary["success"]
+    assert summary["modules_run"] == 1
+
+def test_background_job_counted_once(http_server, workdir):
+    setup = f"use exploit/xss\nset URL {http_server}/\nset PARAM q\n"
+    script = f"{setup}run -j\n---\n{setup}run\nrun -j\n"
+    summary = BatchRunner(parse_script(script), workers=2).run()
+    assert [len(block["modules"]) for block in summary["blocks"]] == [1, 2]
+    assert summary["modules_run"] == 3
+
+def test_background_job_output_in_block_output(http_server, workdir, capsys):
+    run(f"use exploit/xss\nset URL {http_server}/\nset PARAM q\nrun -j\n")
+    assert "job 1 (exploit/xss)" in capsys.readouterr().out
@@ -0,0 +1,9 @@
+from utils.checkpoint import Checkpoint
+
+def test_checkpoints_started_together_get_their_own_files(workdir):
+    first = Checkpoint("modules.auxiliary.dirfuzz", {})
+    second = Checkpoint("modules.auxiliary.dirfuzz", {})
+    assert first.id != second.id
+    first.save({"index": 1})
+    second.save({"index": 2})
+    assert first.path != second.path
@@ -0,0 +1,16 @@
+from utils.concurrency import AdaptiveConcurrencyController
+
+def _window(controller, concurrent):
+    for _ in range(controller.window):
+        for _ in range(concurrent):
+            controller.acquire()
+        for _ in range(concurrent):
+            controller.release()
+        controller.on_success(0.01)
+
+def test_limit_grows_only_when_reached():
+    controller = AdaptiveConcurrencyController(initial_limit=4, window=5)
+    _window(controller, 1)
+    assert controller.limit == 4
+    _window(controller, 4)
+    assert controller.limit == 5
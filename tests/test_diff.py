@@ -0,0 +1,22 @@
+import json
+import pytest
+from utils.diff import diff_files, load_findings
+
+FINDING = {"type": "Reflected XSS", "target": "http://example.test/?q=1", "parameter": "q", "payload": "<svg>"}
+
+def _write(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+def test_jsonl_output_findings_are_diffed(workdir):
+    baseline = _write(workdir / "a.jsonl", [{"event": "module_complete", "module": "exploit/xss"}])
+    current = _write(workdir / "b.jsonl", [{"event": "finding", **FINDING}])
+    
+    assert load_findings(current)[0]["type"] == "Reflected XSS"
+    result = diff_files(baseline, current)
+    assert len(result["new"]) == 1 and not result["fixed"]
+
+def test_unrecognized_file_is_an_error(workdir):
+    path = _write(workdir / "other.jsonl", [{"hello": "world"}])
+    with pytest.raises(ValueError):
+        load_findings(path)
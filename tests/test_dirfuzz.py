@@ -0,0 +1,51 @@
+import contextvars
+import threading
+import time
+import pytest
+from modules.auxiliary.dirfuzz import DirectoryFuzzer
+from utils.context import JobCancelled, bind_cancel_event
+
+def test_killed_job_stops_workers_quietly(http_server, workdir, monkeypatch):
+    uncaught = []
+    monkeypatch.setattr(threading, "excepthook", uncaught.append)
+    module = DirectoryFuzzer()
+    module.set_option("URL", http_server)
+    
+    def run():
+        cancel = threading.Event()
+        cancel.set()
+        bind_cancel_event(cancel)
+        module.collect(lambda event: None)
+    
+    with pytest.raises(JobCancelled):
+        contextvars.Context().run(run)
+    assert uncaught == []
+
+def test_interrupted_scan_releases_its_threads(http_server, workdir):
+    before = threading.active_count()
+    module = DirectoryFuzzer()
+    module.set_option("URL", http_server)
+    module.set_option("THREADS", "4")
+    
+    events = module.stream()
+    next(events)
+    events.close()
+    
+    deadline = time.monotonic() + 5
+    while threading.active_count() > before and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert threading.active_count() == before
+
+def test_worker_pool_follows_adaptive_limit(http_server, workdir):
+    from utils.http_client import get_client
+    controller = get_client().controller_for(http_server.split("://")[1])
+    controller.limit = 6
+    module = DirectoryFuzzer()
+    module.set_option("URL", http_server)
+    module.set_option("THREADS", "2")
+    
+    workers = []
+    add_workers = module._add_workers
+    module._add_workers = lambda pool, count: (add_workers(pool, count), workers.append(len(pool)))
+    module.collect(lambda event: None)
+    assert workers[0] == 2 and max(workers) >= 6
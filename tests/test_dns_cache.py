@@ -0,0 +1,23 @@
+import threading
+import time
+from utils.dns_cache import DNSCache
+
+def test_record_ttl_is_fetched_off_the_request_path(monkeypatch):
+    cache = DNSCache(default_ttl=300)
+    release = threading.Event()
+    
+    def slow_ttl(hostname):
+        release.wait(5)
+        return 10
+    monkeypatch.setattr(cache, "_record_ttl", slow_ttl)
+    
+    start = time.monotonic()
+    assert cache.resolve("localhost")
+    assert time.monotonic() - start < 1
+    assert cache.entries["localhost"][0] - time.monotonic() > 200
+    
+    release.set()
+    deadline = time.monotonic() + 5
+    while cache.entries["localhost"][0] - time.monotonic() > 200 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.entries["localhost"][0] - time.monotonic() <= 10
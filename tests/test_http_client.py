@@ -0,0 +1,12 @@
+from utils.http_client import HTTPClient
+
+def test_cookie_scopes_share_the_pool_but_not_cookies(http_server):
+    client = HTTPClient()
+    with client.cookie_scope():
+        client.get(f"{http_server}/cookie")
+        assert client.get(f"{http_server}/cookie").text == "sid=1"
+        pool = client._session().get_adapter(http_server)
+    with client.cookie_scope():
+        assert client.get(f"{http_server}/cookie").text == ""
+        assert client._session().get_adapter(http_server) is pool
+    assert client.get(f"{http_server}/cookie").text == ""
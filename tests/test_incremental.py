@@ -0,0 +1,24 @@
+from modules.exploits.xss import XSSDetector
+
+def scan(url):
+    module = XSSDetector()
+    module.set_option("URL", f"{url}/")
+    module.set_option("PARAM", "q")
+    module.set_option("INCREMENTAL", "true")
+    return module.collect(lambda event: None)
+
+def test_unchanged_endpoint_is_replayed(http_server, workdir):
+    assert "incremental" not in scan(http_server)
+    assert scan(http_server)["incremental"] == "unchanged"
+
+def test_run_with_failed_probes_is_not_stored(http_server, workdir, monkeypatch):
+    def failing_probe(self, *args):
+        self._probe_errors += 1
+        return False
+    with monkeypatch.context() as patch:
+        patch.setattr(XSSDetector, "_test_payload", failing_probe)
+        assert scan(http_server)["probe_errors"] == len(XSSDetector().payloads)
+    
+    # Nothing was stored, so the endpoint is tested again
+    result = scan(http_server)
+    assert "incremental" not in result and result["probe_errors"] == 0
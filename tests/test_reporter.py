@@ -0,0 +1,33 @@
+import csv
+import json
+from utils.advanced_reporter import AdvancedReporter
+from utils.report_writers import WRITERS
+
+def _findings(count):
+    for i in range(count):
+        yield {"type": "XSS", "target": f"http://example.test/{i}", "parameter": "q", "payload": "<svg>"}
+
+def test_all_formats_from_one_pass(workdir):
+    consumed = []
+    
+    def findings():
+        for finding in _findings(2500):
+            consumed.append(finding)
+            yield finding
+    
+    reports = AdvancedReporter().generate_all_reports("report", findings=findings())
+    assert reports == ["report.json", "report.csv", "report.xml", "report.html"]
+    assert len(consumed) == 2500
+    with open("report.json", encoding="utf-8") as f:
+        assert len(json.load(f)["vulnerabilities"]) == 2500
+    with open("report.csv", newline="", encoding="utf-8") as f:
+        assert len(list(csv.reader(f))) == 2501
+
+def test_failing_writer_does_not_block_the_others(workdir, monkeypatch):
+    def broken(out, meta, findings, executions):
+        next(iter(findings))
+        raise RuntimeError("disk full")
+    monkeypatch.setitem(WRITERS, "xml", (broken, "XML", "xml"))
+    
+    reports = AdvancedReporter().generate_all_reports("report", findings=_findings(5000))
+    assert reports == ["report.json", "report.csv", "report.html"]
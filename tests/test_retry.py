@@ -0,0 +1,27 @@
+import time
+import pytest
+import requests
+from utils.http_client import HTTPClient
+from utils.retry import CircuitBreaker
+
+def test_probe_released_after_unrelated_error(monkeypatch):
+    client = HTTPClient()
+    client.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    client.breaker.record_failure("example.test")
+    time.sleep(0.1)
+    assert client.breaker.state("example.test") == CircuitBreaker.HALF_OPEN
+    
+    def redirect_loop(*args):
+        raise requests.exceptions.TooManyRedirects("loop")
+    monkeypatch.setattr(client, "_send", redirect_loop)
+    with pytest.raises(requests.exceptions.TooManyRedirects):
+        client.get("http://example.test/")
+    
+    # The failed probe said nothing about the host, so another one may go through
+    assert client.breaker.allow("example.test")
+
+def test_record_failure_returns_count_when_opening():
+    breaker = CircuitBreaker(failure_threshold=3)
+    assert breaker.record_failure("h") is None
+    assert breaker.record_failure("h") is None
+    assert breaker.record_failure("h") == 3
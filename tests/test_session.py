@@ -0,0 +1,50 @@
+from utils.diff import load_findings
+from utils.session import SessionManager, read_session
+
+def test_saved_session_is_listed_and_loadable(workdir):
+    manager = SessionManager()
+    manager.add_finding({"type": "Reflected XSS", "target": "http://example.test/?q=1", "parameter": "q",
+                         "payload": "<script>"})
+    path = manager.save_session("nightly")
+    
+    assert path.endswith("nightly.ktj")
+    assert [session["name"] for session in manager.list_sessions()] == ["nightly.ktj"]
+    assert len(load_findings(path)) == 1
+    
+    other = SessionManager()
+    assert other.load_session("nightly")
+    assert other.session_id == manager.session_id
+    assert len(other.current_session["findings"]) == 1
+
+def test_saving_a_named_session_under_another_name_keeps_it(workdir):
+    manager = SessionManager()
+    manager.add_note("first")
+    manager.save_session("baseline")
+    manager.save_session("nightly")
+    assert [session["name"] for session in manager.list_sessions()] == ["baseline.ktj", "nightly.ktj"]
+
+def test_read_session_has_no_side_effects(workdir):
+    manager = SessionManager("saved")
+    manager.add_target("http://example.test/")
+    path = manager.save_session("scan")
+    
+    session = read_session(path)
+    assert session["targets"] == ["http://example.test/"]
+    assert sorted(p.name for p in workdir.iterdir()) == ["saved"]
+
+def test_legacy_session_is_listed_and_convertible(workdir):
+    import pickle
+    manager = SessionManager()
+    legacy = {"id": "20240101_120000", "start_time": "2024-01-01T12:00:00", "targets": ["http://example.test"],
+              "modules_used": [], "options": {}, "results": [], "notes": [],
+              "findings": [{"type": "Reflected XSS", "target": "http://example.test/?q=1", "parameter": "q"}]}
+    with open("sessions/old.kts", "wb") as f:
+        pickle.dump(legacy, f)
+    
+    assert [(s["name"], s["legacy"]) for s in manager.list_sessions()] == [("old.kts", True)]
+    assert not manager.load_session("old")
+    
+    assert manager.convert_session("old").endswith("old.ktj")
+    assert manager.load_session("old")
+    assert manager.current_session["targets"] == ["http://example.test"]
+    assert len(manager.current_session["findings"]) == 1
@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+import pytest
+from utils.config import Config
+from utils.startup import PROJECT_ROOT, CONSOLE_STARTUP, measure_startup
+
+@pytest.mark.parametrize("target", [None, "exploit/sqli"])
+def test_startup_within_budget(target, workdir):
+    budget_ms = Config().get("general.startup_budget_ms", 100)
+    # The first start in a fresh directory builds the module index; the budget is for later ones
+    measure_startup(target)
+    report = measure_startup(target)
+    assert report["success"], report["error"]
+    assert report["elapsed_ms"] <= budget_ms, report["top_imports"]
+
+def test_console_defers_report_imports(workdir):
+    # Only needed once a report is written or the findings database is opened
+    code = CONSOLE_STARTUP + "import sys\nprint(' '.join(sorted(sys.modules)))\n"
+    proc = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=PROJECT_ROOT),
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert not set(proc.stdout.split()) & {"sqlite3", "gzip", "csv", "xml.sax.saxutils"}
@@ -0,0 +1,68 @@
+"""Persistent SQLite-backed cache for slow lookups (WHOIS, DNS metadata)"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+class ResultCache:
+    def __init__(self, db_path: str = "./cache/kotosploit_cache.db"):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self.conn.commit()
+    
+    def get(self, namespace: str, key: str, max_age: float = None) -> Optional[Tuple[Any, float]]:
+        """Return (value, age_seconds), or None when missing or older than max_age"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, stored_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        if not row:
+            return None
+        age = time.time() - row[1]
+        if max_age is not None and age > max_age:
+            return None
+        return json.loads(row[0]), age
+    
+    def set(self, namespace: str, key: str, value: Any):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, default=str), time.time())
+            )
+            self.conn.commit()
+    
+    def purge(self, namespace: str = None, older_than: float = None) -> int:
+        query = "DELETE FROM cache WHERE 1 = 1"
+        params = []
+        if namespace:
+            query += " AND namespace = ?"
+            params.append(namespace)
+        if older_than is not None:
+            query += " AND stored_at < ?"
+            params.append(time.time() - older_than)
+        with self._lock:
+            deleted = self.conn.execute(query, params).rowcount
+            self.conn.commit()
+        return deleted
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
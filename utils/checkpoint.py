@@ -0,0 +1,82 @@
+"""Checkpoint storage for resumable long-running scans"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, Any, Callable, List, Optional
+
+CHECKPOINT_DIR = "./checkpoints"
+
+class Checkpoint:
+    def __init__(self, module: str, options: Dict[str, Any], checkpoint_id: str = None,
+                 state: Dict[str, Any] = None, checkpoint_dir: str = CHECKPOINT_DIR,
+                 interval: float = 30.0):
+        self.module = module
+        self.options = options
+        # Microseconds keep runs of the same module started in the same second (batch, run -j) apart
+        self.id = checkpoint_id or f"{module.rsplit('.', 1)[-1]}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        self.state = state or {}
+        self.checkpoint_dir = checkpoint_dir
+        self.interval = interval
+        self.last_save = time.monotonic()
+    
+    @property
+    def path(self) -> str:
+        return os.path.join(self.checkpoint_dir, f"{self.id}.json")
+    
+    def save(self, state: Dict[str, Any]):
+        """Write the cursor and partial results atomically so a crash mid-write keeps the old file."""
+        if not os.path.exists(self.checkpoint_dir):
+            os.makedirs(self.checkpoint_dir)
+        
+        data = {
+            "id": self.id,
+            "module": self.module,
+            "options": self.options,
+            "state": state,
+            "updated": datetime.now().isoformat()
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+        self.state = state
+        self.last_save = time.monotonic()
+    
+    def maybe_save(self, state_fn: Callable[[], Dict[str, Any]]) -> bool:
+        if time.monotonic() - self.last_save < self.interval:
+            return False
+        self.save(state_fn())
+        return True
+    
+    def complete(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class CheckpointManager:
+    def __init__(self, checkpoint_dir: str = CHECKPOINT_DIR):
+        self.checkpoint_dir = checkpoint_dir
+    
+    def load(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        path = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json")
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
+    
+    def list_checkpoints(self) -> List[Dict[str, Any]]:
+        checkpoints = []
+        if not os.path.exists(self.checkpoint_dir):
+            return checkpoints
+        
+        for filename in sorted(os.listdir(self.checkpoint_dir)):
+            if filename.endswith('.json'):
+                data = self.load(filename[:-5])
+                if data:
+                    checkpoints.append(data)
+        return checkpoints
@@ -0,0 +1,106 @@
+"""Adaptive (AIMD) concurrency control driven by latency and server pushback"""
+
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+PUSHBACK_STATUS = (429, 503)
+
+def parse_retry_after(value: Optional[str], max_delay: float = 300.0) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), max_delay)
+
+
+class AdaptiveConcurrencyController:
+    def __init__(self, initial_limit: int = 10, min_limit: int = 1, max_limit: int = 64,
+                 window: int = 20, tolerance: float = 1.5, backoff: float = 0.5):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = window
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self.baseline = None
+        self.paused_until = 0.0
+        self._samples = []
+        self._saturated = False
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+    
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+    
+    def acquire(self):
+        with self._cond:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    break
+                self._cond.wait(timeout=wait if wait > 0 else 0.5)
+            self.in_flight += 1
+            if self.in_flight >= int(self.limit):
+                self._saturated = True
+    
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+    
+    def on_success(self, latency: float):
+        """Grow by one slot per window while p50 latency stays near the best seen, shrink otherwise.
+        
+        Only a window in which the limit was actually reached grows it, so callers that send fewer
+        requests than allowed (serial modules) don't push it up without having tested it.
+        """
+        with self._cond:
+            self._samples.append(latency)
+            if len(self._samples) < self.window:
+                return
+            p50 = statistics.median(self._samples)
+            self._samples = []
+            saturated, self._saturated = self._saturated, False
+            if self.baseline is None or p50 < self.baseline:
+                self.baseline = p50
+            if p50 <= self.baseline * self.tolerance:
+                if saturated:
+                    self.limit = min(self.limit + 1, self.max_limit)
+            else:
+                self._decrease(0.9)
+            # Let the baseline drift slowly so a lasting shift in the target's speed is accepted
+            self.baseline += (p50 - self.baseline) * 0.05
+            self._cond.notify_all()
+    
+    def on_pushback(self, retry_after: Optional[float] = None):
+        """Back off on 429/503 or connection resets and honor Retry-After for the whole host"""
+        with self._cond:
+            self._decrease(self.backoff)
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            self._samples = []
+    
+    def _decrease(self, factor: float):
+        # A burst of failures from requests already in flight counts as one congestion signal
+        now = time.monotonic()
+        if now - self._last_decrease < 1.0:
+            return
+        self._last_decrease = now
+        self.limit = max(self.limit * factor, self.min_limit)
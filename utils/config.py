@@ -16,7 +16,8 @@ class Config:
                 "user_agent": "Kotosploit/1.0",
                 "verify_ssl": False,
                 "max_threads": 10,
-                "verbose": True
+                "verbose": True,
+                "startup_budget_ms": 100
             },
             "scanner": {
                 "sqli": {
@@ -45,11 +46,27 @@ class Config:
                 "format": "json",
                 "directory": "./reports"
             },
+            "findings": {
+                "database": "./sessions/findings.db"
+            },
+            "metrics": {
+                "prometheus_file": None,
+                "export_interval": 15,
+                "prometheus_port": None
+            },
+            "cache": {
+                "directory": "./cache",
+                "whois_ttl": 86400
+            },
             "network": {
                 "proxy": None,
                 "proxy_type": "http",
                 "retry_attempts": 3,
-                "retry_delay": 1
+                "retry_delay": 1,
+                "max_in_flight": 64,
+                "circuit_breaker_threshold": 5,
+                "circuit_breaker_timeout": 30,
+                "dns_ttl": 300
             }
         }
         
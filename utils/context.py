@@ -0,0 +1,33 @@
+"""Per-job execution context (cancellation) shared with a job's worker threads"""
+
+import contextvars
+import threading
+from typing import Callable, Optional
+
+_cancel_event: contextvars.ContextVar = contextvars.ContextVar("cancel_event", default=None)
+
+class JobCancelled(KeyboardInterrupt):
+    """Raised in a background job's threads once it has been killed; modules treat it like Ctrl-C"""
+
+def bind_cancel_event(event: Optional[threading.Event]):
+    _cancel_event.set(event)
+
+def check_cancelled():
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise JobCancelled()
+
+def propagate(fn: Callable) -> Callable:
+    """Wrap fn so threads running it inherit the caller's job context (cancellation, output routing).
+    
+    A killed job ends the wrapped call quietly (returning None) instead of printing a traceback
+    from every worker thread; the job's own thread still sees the cancellation.
+    """
+    context = contextvars.copy_context()
+    
+    def wrapper(*args, **kwargs):
+        try:
+            return context.copy().run(fn, *args, **kwargs)
+        except JobCancelled:
+            return None
+    return wrapper
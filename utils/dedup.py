@@ -0,0 +1,105 @@
+"""Canonical fingerprints for findings and merging of duplicates"""
+
+import hashlib
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+# "Error-based SQLi", "Time-based Command Injection", "Union-based SQLi (suspected)"
+EVIDENCE_PREFIX = re.compile(r"^\s*([\w-]+)-based\s+", re.IGNORECASE)
+SUSPECTED_SUFFIX = re.compile(r"\s*\(suspected\)\s*$", re.IGNORECASE)
+
+def normalize_endpoint(target: str) -> str:
+    """scheme://host[:port]/path?names - lowercased host, default port and parameter values dropped"""
+    if not target:
+        return ""
+    parts = urlsplit(target if "://" in target else f"//{target}")
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+    names = sorted({name for name, _ in parse_qsl(parts.query, keep_blank_values=True)})
+    endpoint = f"{scheme}://{host}{path}" if scheme else f"{host}{path}"
+    return f"{endpoint}?{'&'.join(names)}" if names else endpoint
+
+def split_type(vuln_type: str) -> Tuple[str, str]:
+    """('Time-based SQLi') -> ('sqli', 'time'); types without a technique get an empty class"""
+    vuln_type = SUSPECTED_SUFFIX.sub("", vuln_type or "")
+    match = EVIDENCE_PREFIX.match(vuln_type)
+    if match:
+        return vuln_type[match.end():].strip().lower(), match.group(1).lower()
+    return vuln_type.strip().lower(), ""
+
+def fingerprint(vuln_type: str, target: str, parameter: str = None, evidence_class: str = None) -> str:
+    kind, detected_class = split_type(vuln_type)
+    key = "\x1f".join([kind, normalize_endpoint(target), parameter or "",
+                       (evidence_class or detected_class).lower()])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+def merge(existing: Dict[str, Any], duplicate: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold a duplicate into an already-merged finding, keeping every distinct payload"""
+    payloads = duplicate.get("payloads")
+    if payloads is None:
+        payloads = [] if duplicate.get("payload") is None else [duplicate["payload"]]
+    for payload in payloads:
+        if payload not in existing["payloads"]:
+            existing["payloads"].append(payload)
+    existing["occurrences"] = existing.get("occurrences", 1) + duplicate.get("occurrences", 1)
+    seen = duplicate.get("last_seen") or duplicate.get("discovered_at")
+    if seen and seen > (existing.get("last_seen") or ""):
+        existing["last_seen"] = seen
+    return existing
+
+def merged(finding: Dict[str, Any]) -> Dict[str, Any]:
+    """First occurrence of a finding in merged form"""
+    result = dict(finding)
+    if "fingerprint" not in result:
+        result["fingerprint"] = fingerprint(result.get("type"), result.get("target"),
+                                            result.get("parameter"), result.get("evidence_class"))
+    if "payloads" not in result:
+        result["payloads"] = [] if result.get("payload") is None else [result["payload"]]
+    result.setdefault("occurrences", 1)
+    result.setdefault("last_seen", result.get("discovered_at"))
+    return result
+
+class FindingSet:
+    """Unique findings in discovery order; duplicates are merged into the first occurrence"""
+    
+    def __init__(self, findings: List[Dict[str, Any]] = None):
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        for finding in findings or []:
+            self.add(finding)
+    
+    def add(self, finding: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Returns the merged finding and whether it was new"""
+        finding = merged(finding)
+        with self._lock:
+            existing = self.items.get(finding["fingerprint"])
+            if existing is None:
+                self.items[finding["fingerprint"]] = finding
+                return finding, True
+            return merge(existing, finding), False
+    
+    def clear(self):
+        with self._lock:
+            self.items = {}
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.items.get(key)
+    
+    def values(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self.items.values())
+    
+    def __len__(self) -> int:
+        return len(self.items)
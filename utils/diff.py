@@ -0,0 +1,67 @@
+"""Scan-to-scan comparison of findings by fingerprint"""
+
+import gzip
+import json
+import os
+from typing import Any, Dict, Iterable, List
+from utils.dedup import FindingSet
+from utils.session import SESSION_EXTENSION, read_session
+
+def _open(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+# JSONL records that carry a finding: "record" lines from a JSONL report, "event" lines from --jsonl output
+FINDING_RECORDS = (("record", "vulnerability"), ("event", "finding"))
+# Other records of those two formats; a file with none of these isn't a report at all
+OTHER_RECORDS = (("record", "session"), ("record", "module_execution"), ("event", "module_complete"),
+                 ("event", "summary"))
+
+def _jsonl_findings(f) -> List[Dict[str, Any]]:
+    findings = []
+    recognized = False
+    for line in filter(str.strip, f):
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            continue
+        key = "record" if "record" in record else "event"
+        tag = (key, record.get(key))
+        if tag in FINDING_RECORDS:
+            findings.append({key: value for key, value in record.items() if key != tag[0]})
+        recognized = recognized or tag in FINDING_RECORDS or tag in OTHER_RECORDS
+    if not recognized:
+        raise ValueError("no report or --jsonl output records found")
+    return findings
+
+def load_findings(path: str) -> List[Dict[str, Any]]:
+    """Findings from a session journal (.ktj), a JSON/JSONL report or --jsonl output, optionally gzipped"""
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith(SESSION_EXTENSION):
+        return read_session(path)["findings"]
+    with _open(path) as f:
+        if name.endswith(".jsonl"):
+            return _jsonl_findings(f)
+        report = json.load(f)
+    if not isinstance(report, dict) or "vulnerabilities" not in report:
+        raise ValueError("not a Kotosploit JSON report")
+    return report["vulnerabilities"]
+
+def diff_findings(old: Iterable[Dict[str, Any]], new: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split findings into new, fixed and unchanged; one pass over each side.
+    
+    Reports written before findings had fingerprints get them computed here, and duplicates
+    within one side are merged first so a finding is counted once.
+    """
+    before = FindingSet(old)
+    after = FindingSet(new)
+    return {
+        "new": [finding for key, finding in after.items.items() if key not in before.items],
+        "fixed": [finding for key, finding in before.items.items() if key not in after.items],
+        "unchanged": [finding for key, finding in after.items.items() if key in before.items],
+    }
+
+def diff_files(baseline: str, current: str) -> Dict[str, Any]:
+    result = {"baseline": os.path.abspath(baseline), "current": os.path.abspath(current)}
+    result.update(diff_findings(load_findings(baseline), load_findings(current)))
+    return result
@@ -0,0 +1,108 @@
+"""Session-level caching DNS resolver shared by HTTP and raw-socket modules"""
+
+import ipaddress
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from utils.config import Config
+
+class DNSCache:
+    def __init__(self, default_ttl: float = 300, min_ttl: float = 5, max_ttl: float = 3600,
+                 negative_ttl: float = 30):
+        self.default_ttl = default_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.entries: Dict[str, Tuple[float, Optional[List[Tuple[int, str]]]]] = {}
+        self.lookups = 0
+        self._lock = threading.Lock()
+        self._host_locks: Dict[str, threading.Lock] = {}
+    
+    def resolve(self, hostname: str) -> List[Tuple[int, str]]:
+        """Return (family, address) pairs for hostname, raising socket.gaierror like getaddrinfo"""
+        try:
+            return [(socket.AF_INET6 if ipaddress.ip_address(hostname).version == 6 else socket.AF_INET, hostname)]
+        except ValueError:
+            pass
+        
+        entry = self._cached(hostname)
+        if entry is None:
+            # One lookup per host: concurrent misses wait for the first resolver call
+            with self._host_lock(hostname):
+                entry = self._cached(hostname)
+                if entry is None:
+                    entry = self._lookup(hostname)
+        if entry[1] is None:
+            raise socket.gaierror(socket.EAI_NONAME, f"Name or service not known: {hostname}")
+        return entry[1]
+    
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+    
+    def _cached(self, hostname: str):
+        with self._lock:
+            entry = self.entries.get(hostname)
+            if entry and entry[0] > time.monotonic():
+                return entry
+            return None
+    
+    def _host_lock(self, hostname: str) -> threading.Lock:
+        with self._lock:
+            return self._host_locks.setdefault(hostname, threading.Lock())
+    
+    def _lookup(self, hostname: str):
+        self.lookups += 1
+        resolved_at = time.monotonic()
+        try:
+            infos = socket.getaddrinfo(hostname, None, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            entry = (resolved_at + self.negative_ttl, None)
+        else:
+            addresses = []
+            for family, _, _, _, sockaddr in infos:
+                if (family, sockaddr[0]) not in addresses:
+                    addresses.append((family, sockaddr[0]))
+            entry = (resolved_at + self._clamp(self.default_ttl), addresses)
+        
+        with self._lock:
+            self.entries[hostname] = entry
+        if entry[1] is not None:
+            # The record's real TTL is looked up off the request path; until it arrives (or if it
+            # never does) the default TTL applies
+            threading.Thread(target=self._refine_ttl, args=(hostname, entry, resolved_at), daemon=True).start()
+        return entry
+    
+    def _clamp(self, ttl: float) -> float:
+        return min(max(ttl, self.min_ttl), self.max_ttl)
+    
+    def _refine_ttl(self, hostname: str, entry, resolved_at: float):
+        ttl = self._record_ttl(hostname)
+        if ttl is None:
+            return
+        with self._lock:
+            # Unless the entry was replaced or cleared in the meantime
+            if self.entries.get(hostname) is entry:
+                self.entries[hostname] = (resolved_at + self._clamp(ttl), entry[1])
+    
+    def _record_ttl(self, hostname: str) -> Optional[float]:
+        # The system resolver is authoritative for addresses (it honors /etc/hosts); the DNS
+        # answer is only consulted for how long those addresses may be cached
+        try:
+            import dns.resolver
+            answer = dns.resolver.resolve(hostname, 'A', lifetime=2)
+            return answer.rrset.ttl
+        except Exception:
+            return None
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+def get_resolver() -> DNSCache:
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = DNSCache(default_ttl=Config().get("network.dns_ttl", 300))
+        return _resolver
@@ -0,0 +1,187 @@
+"""Indexed SQLite store for findings across sessions"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+from utils.dedup import merge, merged
+
+# Every column a query can filter on has an index; NOCASE so lookups are case-insensitive
+# and still indexed. 'category' is the short name of the module that found it (sqli, xss, ...).
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS findings (
+        id INTEGER PRIMARY KEY,
+        session_id TEXT,
+        fingerprint TEXT,
+        module TEXT COLLATE NOCASE,
+        category TEXT COLLATE NOCASE,
+        type TEXT COLLATE NOCASE,
+        host TEXT COLLATE NOCASE,
+        target TEXT,
+        parameter TEXT COLLATE NOCASE,
+        payload TEXT,
+        severity TEXT,
+        discovered_at TEXT NOT NULL,
+        data TEXT NOT NULL
+    )
+    """,
+    # One row per unique issue per session; repeat hits update it
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_findings_fingerprint ON findings (session_id, fingerprint)",
+    "CREATE INDEX IF NOT EXISTS idx_findings_host ON findings (host, discovered_at)",
+    # The common "type X on host Y" question gets its own index
+    "CREATE INDEX IF NOT EXISTS idx_findings_host_category ON findings (host, category, discovered_at)",
+    "CREATE INDEX IF NOT EXISTS idx_findings_module ON findings (module, discovered_at)",
+    "CREATE INDEX IF NOT EXISTS idx_findings_category ON findings (category, discovered_at)",
+    "CREATE INDEX IF NOT EXISTS idx_findings_type ON findings (type, discovered_at)",
+    "CREATE INDEX IF NOT EXISTS idx_findings_parameter ON findings (parameter, discovered_at)",
+    "CREATE INDEX IF NOT EXISTS idx_findings_discovered ON findings (discovered_at)",
+]
+
+def host_of(target: str) -> str:
+    """Host part of a URL, or the target itself for bare hosts, domains and IPs"""
+    if not target:
+        return ""
+    parsed = urlparse(target if "://" in target else f"//{target}")
+    return (parsed.hostname or target).lower()
+
+class FindingsStore:
+    """Findings database; the connection is opened on first use so startup stays cheap"""
+    
+    def __init__(self, db_path: str = "./sessions/findings.db"):
+        self.db_path = db_path
+        self.conn = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> "sqlite3.Connection":
+        if self.conn is None:
+            import sqlite3
+            directory = os.path.dirname(self.db_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            # Parallel batch blocks share the file, so wait on locks rather than failing
+            self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(SCHEMA[0])
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(findings)")}
+            if "fingerprint" not in columns:
+                # Databases from before findings were deduplicated
+                self.conn.execute("ALTER TABLE findings ADD COLUMN fingerprint TEXT")
+            for statement in SCHEMA[1:]:
+                self.conn.execute(statement)
+            self.conn.commit()
+        return self.conn
+    
+    def add(self, finding: Dict[str, Any], session_id: str = None) -> int:
+        """Insert a finding, or merge it into the session's row with the same fingerprint"""
+        finding = merged(finding)
+        module = finding.get("module") or ""
+        with self._lock:
+            conn = self._connect()
+            existing = conn.execute(
+                "SELECT id, data FROM findings WHERE session_id IS ? AND fingerprint = ?",
+                (session_id, finding["fingerprint"])
+            ).fetchone()
+            if existing:
+                data = merge(json.loads(existing[1]), finding)
+                conn.execute("UPDATE findings SET data = ? WHERE id = ?",
+                             (json.dumps(data, default=str), existing[0]))
+                conn.commit()
+                return existing[0]
+            
+            cursor = conn.execute(
+                "INSERT INTO findings (session_id, fingerprint, module, category, type, host, target,"
+                " parameter, payload, severity, discovered_at, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    session_id,
+                    finding["fingerprint"],
+                    module,
+                    module.rsplit('/', 1)[-1],
+                    finding.get("type"),
+                    host_of(finding.get("target")),
+                    finding.get("target"),
+                    finding.get("parameter"),
+                    finding.get("payload"),
+                    finding.get("severity"),
+                    finding.get("discovered_at") or "",
+                    json.dumps(finding, default=str)
+                )
+            )
+            conn.commit()
+        return cursor.lastrowid
+    
+    def _where(self, vuln_type: str = None, host: str = None, module: str = None,
+               parameter: str = None, since: str = None) -> Tuple[str, List[Any]]:
+        clauses = []
+        params = []
+        # A host narrows things down the most; '+' keeps SQLite from picking a broader index
+        # for the other columns when it has no statistics to go on
+        other = "+" if host else ""
+        if vuln_type:
+            column = self._type_column(vuln_type)
+            clauses.append(f"{column if column == 'category' else other + column} = ?")
+            params.append(vuln_type)
+        if host:
+            clauses.append("host = ?")
+            params.append(host_of(host))
+        if module:
+            clauses.append(f"{other}module = ?")
+            params.append(module)
+        if parameter:
+            clauses.append(f"{other}parameter = ?")
+            params.append(parameter)
+        if since:
+            clauses.append("discovered_at >= ?")
+            params.append(since)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+    
+    def _type_column(self, vuln_type: str) -> str:
+        # A type is either a module's short name (sqli) or an exact finding type (Error-based SQLi).
+        # Picking one column up front keeps the query on a single index that is already in time order.
+        with self._lock:
+            known = self._connect().execute(
+                "SELECT 1 FROM findings WHERE category = ? LIMIT 1", (vuln_type,)
+            ).fetchone()
+        return "category" if known else "type"
+    
+    def query(self, limit: Optional[int] = 50, offset: int = 0, **filters) -> List[Dict[str, Any]]:
+        """Newest first; filters are vuln_type, host, module, parameter and since (ISO timestamp)"""
+        where, params = self._where(**filters)
+        sql = f"SELECT id, data FROM findings{where} ORDER BY discovered_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [dict(json.loads(data), id=row_id) for row_id, data in rows]
+    
+    def iter_findings(self, batch_size: int = 1000, **filters) -> Iterator[Dict[str, Any]]:
+        """Every matching finding in discovery order, fetched in batches (for streaming reports)"""
+        where, params = self._where(**filters)
+        last = (" AND id > ?" if where else " WHERE id > ?")
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connect().execute(
+                    f"SELECT id, data FROM findings{where}{last} ORDER BY id LIMIT ?",
+                    params + [last_id, batch_size]
+                ).fetchall()
+            if not rows:
+                return
+            for row_id, data in rows:
+                yield dict(json.loads(data), id=row_id)
+            last_id = rows[-1][0]
+    
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._connect().execute(f"SELECT COUNT(*) FROM findings{where}", params).fetchone()[0]
+    
+    def close(self):
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -0,0 +1,261 @@
+"""Shared HTTP client with per-host adaptive concurrency control, retries, circuit breaking,
+RTT-tuned timeouts and cached DNS"""
+
+import contextvars
+import socket
+import threading
+import time
+import requests
+import urllib3
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util import connection
+from urllib.parse import urlparse
+from typing import Dict
+from colorama import Fore, Style
+from utils.config import Config
+from utils.metrics import get_registry
+from utils.concurrency import AdaptiveConcurrencyController, PUSHBACK_STATUS, parse_retry_after
+from utils.context import check_cancelled
+from utils.retry import RetryPolicy, CircuitBreaker
+from utils.net import connect_resolved
+from utils.rtt import get_estimator
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+RETRY_STATUS = (429, 502, 503, 504)
+FAILURE_STATUS = (502, 503, 504)
+
+# (client, session) for the module run in progress, so its cookies stay its own
+_run_session: contextvars.ContextVar = contextvars.ContextVar("http_session", default=None)
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    pass
+
+class TimedConnectionMixin:
+    """Opens urllib3 connections through the shared DNS cache and records connect latency"""
+    
+    def _new_conn(self):
+        start = time.monotonic()
+        try:
+            sock = connect_resolved(self._dns_host, self.port, lambda address: connection.create_connection(
+                address,
+                self.timeout,
+                source_address=self.source_address,
+                socket_options=self.socket_options,
+            ))
+        except socket.gaierror as e:
+            get_registry().record_connect(self.host, 0, error="dns")
+            raise NameResolutionError(self.host, self, e) from e
+        except socket.timeout as e:
+            get_registry().record_connect(self.host, 0, error="timeout")
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+            ) from e
+        except OSError as e:
+            kind = "refused" if isinstance(e, ConnectionRefusedError) else "error"
+            get_registry().record_connect(self.host, 0, error=kind)
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+        
+        elapsed = time.monotonic() - start
+        get_estimator().record_connect(self.host, elapsed)
+        get_registry().record_connect(self.host, elapsed)
+        return sock
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    pool_classes = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self.pool_classes
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        manager.pool_classes_by_scheme = self.pool_classes
+        return manager
+
+class HTTPClient:
+    def __init__(self, config: Config = None):
+        self.config = config or Config()
+        self.initial_limit = self.config.get("general.max_threads", 10)
+        self.max_limit = self.config.get("network.max_in_flight", 64)
+        self.controllers: Dict[str, AdaptiveConcurrencyController] = {}
+        self._lock = threading.Lock()
+        
+        self.retry = RetryPolicy(
+            attempts=self.config.get("network.retry_attempts", 3),
+            base_delay=self.config.get("network.retry_delay", 1)
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=self.config.get("network.circuit_breaker_threshold", 5),
+            reset_timeout=self.config.get("network.circuit_breaker_timeout", 30)
+        )
+        
+        self.adapter = TimedHTTPAdapter(pool_connections=self.max_limit, pool_maxsize=self.max_limit)
+        self.session = self._new_session()
+    
+    def _new_session(self) -> requests.Session:
+        """A session with its own cookie jar on the shared connection pool"""
+        session = requests.Session()
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        
+        proxy = self.config.get("network.proxy")
+        if proxy:
+            proxy_type = self.config.get("network.proxy_type", "http")
+            proxy_url = proxy if "://" in proxy else f"{proxy_type}://{proxy}"
+            session.proxies = {"http": proxy_url, "https": proxy_url}
+        return session
+    
+    @contextmanager
+    def cookie_scope(self):
+        """Requests made in this context, and in threads that inherit it, get a fresh cookie jar"""
+        token = _run_session.set((self, self._new_session()))
+        try:
+            yield
+        finally:
+            _run_session.reset(token)
+    
+    def _session(self) -> requests.Session:
+        current = _run_session.get()
+        return current[1] if current is not None and current[0] is self else self.session
+    
+    def controller_for(self, host: str) -> AdaptiveConcurrencyController:
+        with self._lock:
+            if host not in self.controllers:
+                self.controllers[host] = AdaptiveConcurrencyController(
+                    initial_limit=min(self.initial_limit, self.max_limit),
+                    max_limit=self.max_limit
+                )
+            return self.controllers[host]
+    
+    def request(self, method: str, url: str, adaptive_timeout: bool = True, **kwargs) -> requests.Response:
+        # No verify default here: calls that leave it out keep requests' verify=True, as they always had
+        kwargs.setdefault('timeout', self.config.get("general.timeout", 10))
+        host = urlparse(url).netloc
+        if adaptive_timeout:
+            kwargs['timeout'] = self._tuned_timeout(urlparse(url).hostname, kwargs['timeout'])
+        controller = self.controller_for(host)
+        
+        for attempt in range(self.retry.attempts + 1):
+            check_cancelled()
+            last_attempt = attempt == self.retry.attempts
+            if not self.breaker.allow(host):
+                raise CircuitOpenError(f"Circuit open for {host}, retry in {self.breaker.retry_in(host) or 0:.0f}s")
+            
+            try:
+                try:
+                    response = self._send(controller, method, url, kwargs)
+                except requests.exceptions.ReadTimeout:
+                    # Slow answers (e.g. time-based payloads) say nothing about host health, but the
+                    # timeout itself is a latency sample so a too-tight estimate corrects itself
+                    self.breaker.record_success(host)
+                    if isinstance(kwargs['timeout'], tuple):
+                        get_estimator().record_response(urlparse(url).hostname, kwargs['timeout'][1])
+                    raise
+                except requests.exceptions.ConnectionError:
+                    self._record_failure(host)
+                    if last_attempt:
+                        raise
+                    time.sleep(self.retry.delay(attempt))
+                    continue
+                
+                if response.status_code in FAILURE_STATUS:
+                    self._record_failure(host)
+                else:
+                    self.breaker.record_success(host)
+                
+                if response.status_code in RETRY_STATUS and not last_attempt:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After")) or 0
+                    time.sleep(max(retry_after, self.retry.delay(attempt)))
+                    continue
+                return response
+            finally:
+                # No-op once the attempt recorded a success or failure; anything else that ends it
+                # (TooManyRedirects, InvalidURL, a cancelled job) must not keep the probe slot forever
+                self.breaker.release(host)
+    
+    def _send(self, controller: AdaptiveConcurrencyController, method: str, url: str,
+              kwargs: dict) -> requests.Response:
+        registry = get_registry()
+        # Same host label the connection metrics use
+        host = urlparse(url).hostname or ""
+        with controller.slot():
+            in_flight = registry.request_started(host)
+            start = time.monotonic()
+            try:
+                response = self._session().request(method, url, **kwargs)
+            except requests.exceptions.Timeout:
+                registry.record_request(host, time.monotonic() - start, error="timeout")
+                raise
+            except requests.exceptions.ConnectionError:
+                registry.record_request(host, time.monotonic() - start, error="connection")
+                controller.on_pushback()
+                raise
+            finally:
+                in_flight.dec()
+            
+            if response.status_code in PUSHBACK_STATUS:
+                controller.on_pushback(parse_retry_after(response.headers.get("Retry-After")))
+            else:
+                controller.on_success(time.monotonic() - start)
+            get_estimator().record_response(urlparse(url).hostname, response.elapsed.total_seconds())
+            # A streamed body hasn't been read yet, so it is counted by its declared length
+            received = (int(response.headers.get("Content-Length") or 0) if kwargs.get("stream")
+                        else len(response.content))
+            registry.record_request(host, time.monotonic() - start, response.status_code,
+                                    sent=_body_size(response.request.body), received=received)
+            return response
+    
+    def _tuned_timeout(self, hostname: str, timeout):
+        """Split a scalar timeout into per-host connect/first-byte timeouts bounded by it"""
+        if timeout is None or isinstance(timeout, tuple):
+            return timeout
+        estimator = get_estimator()
+        return (estimator.connect_timeout(hostname, timeout), estimator.response_timeout(hostname, timeout))
+    
+    def _record_failure(self, host: str):
+        failures = self.breaker.record_failure(host)
+        if failures:
+            print(f"{Fore.RED}[!] {host} failed {failures} times in a row, "
+                  f"pausing requests for {self.breaker.reset_timeout}s{Style.RESET_ALL}")
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+    
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request('HEAD', url, **kwargs)
+
+
+def _body_size(body) -> int:
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    return 0
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client() -> HTTPClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient()
+        return _client
@@ -0,0 +1,127 @@
+"""Incremental rescanning: remember what was tested per endpoint and skip it while nothing changed"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from utils.config import Config
+
+def content_hash(status: int, body: str) -> str:
+    # Whitespace-only differences (re-indented templates, trailing newlines) don't count as changes
+    normalized = re.sub(r"\s+", " ", body or "").strip()
+    return hashlib.sha256(f"{status}\n{normalized}".encode("utf-8", "replace")).hexdigest()
+
+def test_set_hash(version: str, test_set: Any) -> str:
+    """Identity of what a module would run: its version plus payloads, patterns and settings"""
+    encoded = json.dumps([version, test_set], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+class ScanState:
+    """What each module last tested per endpoint: content fingerprint, validators and results"""
+    
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or os.path.join(Config().get("cache.directory", "./cache"), "scan_state.db")
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS endpoints (
+                module TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                content_hash TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                test_set TEXT NOT NULL,
+                data TEXT NOT NULL,
+                scanned_at REAL NOT NULL,
+                PRIMARY KEY (module, endpoint)
+            )
+        """)
+        self.conn.commit()
+    
+    def get(self, module: str, endpoint: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT content_hash, etag, last_modified, test_set, data, scanned_at FROM endpoints"
+                " WHERE module = ? AND endpoint = ?",
+                (module, endpoint)
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "content_hash": row[0],
+            "etag": row[1],
+            "last_modified": row[2],
+            "test_set": row[3],
+            "data": json.loads(row[4]),
+            "scanned_at": row[5]
+        }
+    
+    def set(self, module: str, endpoint: str, content_hash: str, etag: str, last_modified: str,
+            test_set: str, data: Any):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO endpoints (module, endpoint, content_hash, etag, last_modified,"
+                " test_set, data, scanned_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (module, endpoint, content_hash, etag, last_modified, test_set,
+                 json.dumps(data, default=str), time.time())
+            )
+            self.conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class EndpointCheck:
+    """Fetches an endpoint (conditionally, when validators are known) and compares it with the last scan.
+    
+    unchanged is True when the server answered 304, or the content hash matches, and the test set
+    is the same as last time; previous then holds what was stored for it.
+    """
+    
+    def __init__(self, state: ScanState, module: str, endpoint: str, url: str, test_set: str,
+                 timeout: int = 10):
+        from utils.http_client import get_client
+        self.state = state
+        self.module = module
+        self.endpoint = endpoint
+        self.test_set = test_set
+        self.previous = state.get(module, endpoint)
+        self.response = None
+        
+        comparable = self.previous is not None and self.previous["test_set"] == test_set
+        headers = {}
+        if comparable and self.previous["etag"]:
+            headers["If-None-Match"] = self.previous["etag"]
+        if comparable and self.previous["last_modified"]:
+            headers["If-Modified-Since"] = self.previous["last_modified"]
+        
+        try:
+            self.response = get_client().get(url, headers=headers, timeout=timeout, verify=False)
+        except Exception:
+            # Can't tell whether it changed, so it gets tested again
+            self.unchanged = False
+            self.content_hash = self.etag = self.last_modified = None
+            return
+        
+        not_modified = self.response.status_code == 304 and comparable
+        # A 304 may omit the validators; the ones that produced it are still good
+        kept = self.previous if not_modified else {}
+        self.etag = self.response.headers.get("ETag") or kept.get("etag")
+        self.last_modified = self.response.headers.get("Last-Modified") or kept.get("last_modified")
+        self.content_hash = (self.previous["content_hash"] if not_modified
+                             else content_hash(self.response.status_code, self.response.text))
+        self.unchanged = comparable and (not_modified or self.content_hash == self.previous["content_hash"])
+    
+    def save(self, data: Any):
+        if self.content_hash is not None:
+            self.state.set(self.module, self.endpoint, self.content_hash, self.etag, self.last_modified,
+                           self.test_set, data)
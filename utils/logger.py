@@ -1,60 +1,141 @@
 """Logging system for Kotosploit"""
 
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 from colorama import Fore, Style
 
+LOGGER_NAME = "Kotosploit"
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Attributes every LogRecord has; anything else was passed through extra= and goes into JSON records
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with extra= fields as top-level keys"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+_lock = threading.Lock()
+_listener = None
+_settings = None
+
+def _configure(settings: tuple) -> logging.Logger:
+    """Route the Kotosploit logger through a queue to a writer thread; a no-op for unchanged settings"""
+    global _listener, _settings
+    logger = logging.getLogger(LOGGER_NAME)
+    with _lock:
+        if settings == _settings:
+            return logger
+        _stop()
+        
+        log_file, level, json_format, max_bytes, backup_count, when, console = settings
+        if when:
+            file_handler = logging.handlers.TimedRotatingFileHandler(
+                log_file, when=when, backupCount=backup_count, encoding="utf-8", delay=True)
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        file_handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+        handlers = [file_handler]
+        if console:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+            handlers.append(stream_handler)
+        
+        # Callers only pay for a queue put; formatting and file I/O happen on the listener's thread
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.setLevel(level)
+        # Kept off the root logger so other libraries' logging setup is left alone
+        logger.propagate = False
+        _settings = settings
+    return logger
+
+def _stop():
+    global _listener, _settings
+    if _listener is not None:
+        # Drains the queue, so nothing logged before exit is lost
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _settings = None
+
+def shutdown():
+    with _lock:
+        _stop()
+
+atexit.register(shutdown)
+
 class KotosploitLogger:
-    def __init__(self, log_dir: str = "./logs", log_level: str = "INFO"):
+    def __init__(self, log_dir: str = "./logs", log_level: str = "INFO", json_format: bool = False,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5, when: str = None,
+                 console: bool = True):
+        """Rotates at max_bytes, or on a schedule when 'when' is set (e.g. "midnight", "H").
+        
+        Loggers created with the same settings share one writer; different settings replace it.
+        """
         self.log_dir = log_dir
         self.log_level = getattr(logging, log_level.upper(), logging.INFO)
         
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = os.path.join(log_dir, f"kotosploit_{timestamp}.log")
-        
-        logging.basicConfig(
-            level=self.log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
-        
-        self.logger = logging.getLogger("Kotosploit")
+        log_file = os.path.abspath(os.path.join(log_dir, "kotosploit.log"))
+        self.logger = _configure((log_file, self.log_level, json_format, max_bytes, backup_count,
+                                  when, console))
     
-    def debug(self, message: str):
-        self.logger.debug(message)
+    def debug(self, message: str, **fields):
+        self.logger.debug(message, extra=fields)
     
-    def info(self, message: str):
-        self.logger.info(message)
+    def info(self, message: str, **fields):
+        self.logger.info(message, extra=fields)
     
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def warning(self, message: str, **fields):
+        self.logger.warning(message, extra=fields)
     
-    def error(self, message: str):
-        self.logger.error(message)
+    def error(self, message: str, **fields):
+        self.logger.error(message, extra=fields)
     
-    def critical(self, message: str):
-        self.logger.critical(message)
+    def critical(self, message: str, **fields):
+        self.logger.critical(message, extra=fields)
     
     def log_module_execution(self, module_name: str, target: str, result: str):
         log_message = f"Module: {module_name} | Target: {target} | Result: {result}"
-        self.info(log_message)
+        self.info(log_message, event="module_execution", module_name=module_name, target=target, result=result)
     
     def log_vulnerability_found(self, vuln_type: str, target: str, payload: str):
         log_message = f"VULNERABILITY FOUND - Type: {vuln_type} | Target: {target} | Payload: {payload}"
-        self.critical(log_message)
+        self.critical(log_message, event="vulnerability", vuln_type=vuln_type, target=target, payload=payload)
         print(f"{Fore.RED}[VULN] {log_message}{Style.RESET_ALL}")
     
     def log_scan_start(self, scan_type: str, target: str):
         log_message = f"Starting {scan_type} scan on {target}"
-        self.info(log_message)
+        self.info(log_message, event="scan_start", scan_type=scan_type, target=target)
     
     def log_scan_complete(self, scan_type: str, target: str, findings: int):
         log_message = f"Completed {scan_type} scan on {target} - Found {findings} issues"
-        self.info(log_message)
+        self.info(log_message, event="scan_complete", scan_type=scan_type, target=target, findings=findings)
@@ -0,0 +1,361 @@
+"""Scan metrics: per-module and per-host counters, gauges and latency histograms"""
+
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_current_module: contextvars.ContextVar = contextvars.ContextVar("metrics_module", default="none")
+
+# Histogram values are kept in microseconds with 2**SUB_BITS linear sub-buckets per power of two,
+# so any recorded latency is off by at most 1/64 (HDR histogram style) in a few hundred buckets
+SUB_BITS = 6
+SUB_COUNT = 1 << SUB_BITS
+# Bucket bounds exported to Prometheus, in seconds
+EXPORT_BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def module_label(module_name: str) -> str:
+    """modules.exploits.xss -> exploit/xss, the same path 'use' takes"""
+    parts = module_name.split(".")
+    if len(parts) >= 3 and parts[0] == "modules":
+        return f"{parts[1].rstrip('s')}/{parts[-1]}"
+    return module_name
+
+@contextmanager
+def module_scope(label: str):
+    """Attribute metrics recorded in this context (and threads that inherit it) to a module"""
+    token = _current_module.set(label)
+    try:
+        yield
+    finally:
+        _current_module.reset(token)
+
+def current_module() -> str:
+    return _current_module.get()
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+class Gauge(Counter):
+    def dec(self, amount: float = 1):
+        with self._lock:
+            self.value -= amount
+    
+    def set(self, value: float):
+        with self._lock:
+            self.value = value
+
+class Histogram:
+    """Log-linear latency histogram: constant memory and relative error whatever the range"""
+    
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _index(micros: int) -> int:
+        if micros < SUB_COUNT:
+            return micros
+        shift = micros.bit_length() - SUB_BITS - 1
+        return ((shift + 1) << SUB_BITS) + (micros >> shift) - SUB_COUNT
+    
+    @staticmethod
+    def _upper(index: int) -> int:
+        """Largest value (microseconds) that falls into a bucket"""
+        if index < SUB_COUNT:
+            return index
+        shift = (index >> SUB_BITS) - 1
+        return (((index & (SUB_COUNT - 1)) + SUB_COUNT + 1) << shift) - 1
+    
+    def record(self, seconds: float):
+        micros = max(0, int(seconds * 1_000_000))
+        index = self._index(micros)
+        with self._lock:
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+            self.count += 1
+            self.sum += seconds
+            self.min = seconds if self.min is None else min(self.min, seconds)
+            self.max = seconds if self.max is None else max(self.max, seconds)
+    
+    def merge(self, other: "Histogram"):
+        with other._lock:
+            buckets, count, total = dict(other.buckets), other.count, other.sum
+            low, high = other.min, other.max
+        with self._lock:
+            for index, hits in buckets.items():
+                self.buckets[index] = self.buckets.get(index, 0) + hits
+            self.count += count
+            self.sum += total
+            if low is not None:
+                self.min = low if self.min is None else min(self.min, low)
+                self.max = high if self.max is None else max(self.max, high)
+    
+    def percentile(self, p: float) -> Optional[float]:
+        """Seconds below which p percent of samples fall"""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(1, int(round(p / 100 * self.count)))
+            seen = 0
+            for index in sorted(self.buckets):
+                seen += self.buckets[index]
+                if seen >= rank:
+                    return min(self._upper(index) / 1_000_000, self.max)
+            return self.max
+    
+    def cumulative(self, bounds: Tuple[float, ...] = EXPORT_BOUNDS) -> List[Tuple[float, int]]:
+        """(bound, samples <= bound) pairs, for Prometheus buckets"""
+        with self._lock:
+            items = sorted(self.buckets.items())
+        result = []
+        seen = 0
+        position = 0
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while position < len(items) and self._upper(items[position][0]) <= limit:
+                seen += items[position][1]
+                position += 1
+            result.append((bound, seen))
+        return result
+
+
+# name -> (type, help)
+METRICS = {
+    "kotosploit_requests_total": ("counter", "Requests sent"),
+    "kotosploit_request_errors_total": ("counter", "Requests that failed (timeout, connection) or got a 5xx"),
+    "kotosploit_responses_total": ("counter", "Responses by status class"),
+    "kotosploit_bytes_sent_total": ("counter", "Request body bytes sent"),
+    "kotosploit_bytes_received_total": ("counter", "Response body bytes received"),
+    "kotosploit_in_flight_requests": ("gauge", "Requests currently waiting on a response"),
+    "kotosploit_request_seconds": ("histogram", "Time from sending a request to its response"),
+    "kotosploit_connects_total": ("counter", "TCP connections opened"),
+    "kotosploit_connect_errors_total": ("counter", "TCP connections that failed"),
+    "kotosploit_connect_seconds": ("histogram", "Time to open a TCP connection"),
+    "kotosploit_findings_total": ("counter", "Findings reported by modules"),
+}
+
+class MetricsRegistry:
+    def __init__(self):
+        self.series: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], object] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+    
+    def _get(self, cls, name: str, labels: Dict[str, str]):
+        key = (name, tuple(sorted(labels.items())))
+        metric = self.series.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self.series.setdefault(key, cls())
+        return metric
+    
+    def counter(self, name: str, **labels) -> Counter:
+        return self._get(Counter, name, labels)
+    
+    def gauge(self, name: str, **labels) -> Gauge:
+        return self._get(Gauge, name, labels)
+    
+    def histogram(self, name: str, **labels) -> Histogram:
+        return self._get(Histogram, name, labels)
+    
+    def reset(self):
+        with self._lock:
+            self.series = {}
+            self.started = time.time()
+    
+    def collect(self, name: str) -> Iterator[Tuple[Dict[str, str], object]]:
+        with self._lock:
+            items = list(self.series.items())
+        for (series_name, labels), metric in items:
+            if series_name == name:
+                yield dict(labels), metric
+    
+    # Recording helpers used by the HTTP client, socket helpers and modules
+    
+    def request_started(self, host: str) -> Gauge:
+        gauge = self.gauge("kotosploit_in_flight_requests", module=current_module(), host=host)
+        gauge.inc()
+        return gauge
+    
+    def record_request(self, host: str, seconds: float, status: int = None, sent: int = 0,
+                       received: int = 0, error: str = None):
+        labels = {"module": current_module(), "host": host}
+        self.counter("kotosploit_requests_total", **labels).inc()
+        if sent:
+            self.counter("kotosploit_bytes_sent_total", **labels).inc(sent)
+        if received:
+            self.counter("kotosploit_bytes_received_total", **labels).inc(received)
+        if status is not None:
+            self.counter("kotosploit_responses_total", code=f"{status // 100}xx", **labels).inc()
+            self.histogram("kotosploit_request_seconds", **labels).record(seconds)
+        if error or (status is not None and status >= 500):
+            self.counter("kotosploit_request_errors_total", kind=error or "5xx", **labels).inc()
+    
+    def record_connect(self, host: str, seconds: float, error: str = None):
+        labels = {"module": current_module(), "host": host}
+        if error:
+            self.counter("kotosploit_connect_errors_total", kind=error, **labels).inc()
+            return
+        self.counter("kotosploit_connects_total", **labels).inc()
+        self.histogram("kotosploit_connect_seconds", **labels).record(seconds)
+    
+    def record_finding(self, module: str = None, severity: str = None):
+        self.counter("kotosploit_findings_total", module=module or current_module(),
+                     severity=severity or "unknown").inc()
+    
+    def summary(self, by: str) -> Dict[str, Dict[str, object]]:
+        """Totals grouped by the 'module' or 'host' label, for the stats command"""
+        rows: Dict[str, Dict[str, object]] = {}
+        
+        def row(key):
+            return rows.setdefault(key, {"requests": 0, "errors": 0, "sent": 0, "received": 0,
+                                         "in_flight": 0, "connects": 0, "connect_errors": 0,
+                                         "findings": 0, "latency": Histogram()})
+        fields = {
+            "kotosploit_requests_total": "requests",
+            "kotosploit_request_errors_total": "errors",
+            "kotosploit_connects_total": "connects",
+            "kotosploit_connect_errors_total": "connect_errors",
+            "kotosploit_bytes_sent_total": "sent",
+            "kotosploit_bytes_received_total": "received",
+            "kotosploit_in_flight_requests": "in_flight",
+        }
+        for name, field in fields.items():
+            for labels, metric in self.collect(name):
+                row(labels[by])[field] += metric.value
+        for labels, metric in self.collect("kotosploit_request_seconds"):
+            row(labels[by])["latency"].merge(metric)
+        if by == "module":
+            for labels, metric in self.collect("kotosploit_findings_total"):
+                row(labels["module"])["findings"] += metric.value
+        for key in [key for key, values in rows.items() if not any(
+                values[field] for field in ("requests", "connects", "connect_errors", "findings", "in_flight"))]:
+            del rows[key]
+        return rows
+    
+    def render_prometheus(self) -> str:
+        """Everything in the Prometheus text exposition format"""
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            series = list(self.collect(name))
+            if not series:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in series:
+                if kind == "histogram":
+                    for bound, seen in metric.cumulative():
+                        lines.append(f"{name}_bucket{_labels(labels, le=repr(bound))} {seen}")
+                    lines.append(f"{name}_bucket{_labels(labels, le='+Inf')} {metric.count}")
+                    lines.append(f"{name}_sum{_labels(labels)} {metric.sum:.6f}")
+                    lines.append(f"{name}_count{_labels(labels)} {metric.count}")
+                else:
+                    lines.append(f"{name}{_labels(labels)} {_number(metric.value)}")
+        return "\n".join(lines) + "\n"
+    
+    def write_prometheus(self, path: str):
+        """Write atomically so a node_exporter textfile collector never reads half a file"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        os.replace(temp_path, path)
+
+
+def _labels(labels: Dict[str, str], **extra) -> str:
+    labels = dict(labels, **extra)
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())) + "}"
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+_registry = MetricsRegistry()
+
+def get_registry() -> MetricsRegistry:
+    return _registry
+
+class PrometheusExporter:
+    """Keeps a Prometheus text file up to date and/or serves /metrics on a local port"""
+    
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry or get_registry()
+        self.file_path = None
+        self.interval = 15
+        self.server = None
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def write_file(self, path: str, interval: float = 15):
+        self.file_path = path
+        self.interval = interval
+        self.registry.write_prometheus(path)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_loop, name="metrics-file", daemon=True)
+            self._thread.start()
+    
+    def _write_loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.registry.write_prometheus(self.file_path)
+            except OSError:
+                pass
+    
+    def serve(self, port: int, host: str = "127.0.0.1") -> int:
+        """Serve the metrics at http://host:port/metrics; returns the bound port (0 picks a free one)"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self.registry
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.stop_server()
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+        return self.server.server_address[1]
+    
+    def stop_server(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+    
+    def stop(self):
+        self._stop.set()
+        self.stop_server()
+        if self.file_path:
+            try:
+                self.registry.write_prometheus(self.file_path)
+            except OSError:
+                pass
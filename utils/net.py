@@ -0,0 +1,56 @@
+"""Raw socket helpers with cached DNS and per-host RTT-tuned timeouts"""
+
+import errno
+import socket
+import time
+from typing import Callable
+from utils.context import check_cancelled
+from utils.dns_cache import get_resolver
+from utils.metrics import get_registry
+from utils.rtt import get_estimator
+
+def connect_resolved(hostname: str, port: int, connect: Callable):
+    """Call connect((address, port)) for each cached address of hostname until one succeeds"""
+    error = None
+    for _, address in get_resolver().resolve(hostname):
+        try:
+            return connect((address, port))
+        except OSError as e:
+            error = e
+    raise error
+
+def open_connection(hostname: str, port: int, timeout: float) -> socket.socket:
+    """Connect like socket.create_connection, using cached DNS and the host's tuned connect timeout"""
+    check_cancelled()
+    estimator = get_estimator()
+    connect_timeout = estimator.connect_timeout(hostname, timeout)
+    registry = get_registry()
+    start = time.monotonic()
+    try:
+        sock = connect_resolved(hostname, port, lambda address: socket.create_connection(address, timeout=connect_timeout))
+    except ConnectionRefusedError:
+        # A refusal is a full round trip, so it still counts as a latency sample
+        estimator.record_connect(hostname, time.monotonic() - start)
+        registry.record_connect(hostname, 0, error="refused")
+        raise
+    except socket.timeout:
+        registry.record_connect(hostname, 0, error="timeout")
+        raise
+    except OSError:
+        registry.record_connect(hostname, 0, error="error")
+        raise
+    estimator.record_connect(hostname, time.monotonic() - start)
+    registry.record_connect(hostname, time.monotonic() - start)
+    sock.settimeout(timeout)
+    return sock
+
+def probe_port(hostname: str, port: int, timeout: float) -> int:
+    """Return 0 if the port accepts a connection, otherwise an errno like socket.connect_ex"""
+    try:
+        sock = open_connection(hostname, port, timeout)
+    except socket.timeout:
+        return errno.ETIMEDOUT
+    except OSError as e:
+        return e.errno or errno.ECONNREFUSED
+    sock.close()
+    return 0
@@ -0,0 +1,125 @@
+"""Rate-limited progress line for long-running scans"""
+
+import sys
+import threading
+import time
+from colorama import Fore, Style
+from modules.events import Finding, Progress, format_finding
+
+REFRESH_RATE = 10.0
+_enabled = True
+
+def set_enabled(enabled: bool):
+    """Turn status lines on or off process-wide; findings are still printed"""
+    global _enabled
+    _enabled = enabled
+
+class ProgressRenderer:
+    """Single status line redrawn at most REFRESH_RATE times a second.
+    
+    update() is cheap enough to call for every probe: it only records state and redraws when the
+    refresh interval has passed. Findings are printed as their own lines above the status line.
+    """
+    
+    def __init__(self, total: int = None, refresh_rate: float = REFRESH_RATE, stream=None):
+        self.total = total
+        self.interval = 1.0 / refresh_rate
+        self.stream = stream
+        self.current = 0
+        self.errors = 0
+        self.message = ""
+        self.started = time.monotonic()
+        self._last_draw = 0.0
+        self._drawn = False
+        self._lock = threading.Lock()
+    
+    def update(self, current: int = None, total: int = None, message: str = None, errors: int = None):
+        with self._lock:
+            self.current = self.current + 1 if current is None else current
+            if total is not None:
+                self.total = total
+            if message is not None:
+                self.message = message
+            if errors is not None:
+                self.errors = errors
+            self._maybe_draw()
+    
+    def error(self, count: int = 1):
+        with self._lock:
+            self.errors += count
+            self._maybe_draw()
+    
+    def finding(self, text: str):
+        with self._lock:
+            self._clear()
+            self._write(f"{text}\n")
+            self._draw()
+    
+    def handle(self, event):
+        """Event callback for BaseModule.collect()"""
+        if isinstance(event, Finding):
+            self.finding(format_finding(event))
+        elif isinstance(event, Progress):
+            self.update(event.current, event.total, event.message, event.errors)
+            if event.done:
+                self.finish()
+    
+    def finish(self):
+        """Leave the final counts on screen as a normal line"""
+        with self._lock:
+            self.message = ""
+            self._clear()
+            if _enabled:
+                self._draw()
+                self._write("\n")
+                self._drawn = False
+    
+    def close(self):
+        """Remove the status line, e.g. when the scan is interrupted"""
+        with self._lock:
+            self._clear()
+    
+    def status(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        rate = self.current / elapsed
+        counter = f"[{self.current}/{self.total}]" if self.total else f"[{self.current}]"
+        if self.total:
+            counter += f" {self.current * 100 / self.total:.0f}%"
+        parts = [counter, f"{rate:.1f}/s"]
+        if self.total and rate > 0 and self.current < self.total:
+            parts.append(f"ETA {self._format_duration((self.total - self.current) / rate)}")
+        if self.errors:
+            parts.append(f"{self.errors} errors")
+        if self.message:
+            parts.append(self.message)
+        return " | ".join(parts)
+    
+    def _maybe_draw(self):
+        if time.monotonic() - self._last_draw >= self.interval:
+            self._draw()
+    
+    def _draw(self):
+        if not _enabled:
+            return
+        self._write(f"\r\033[K{Fore.CYAN}{self.status()}{Style.RESET_ALL}")
+        self._drawn = True
+        self._last_draw = time.monotonic()
+    
+    def _clear(self):
+        if self._drawn:
+            self._write("\r\033[K")
+            self._drawn = False
+    
+    def _write(self, text: str):
+        # Resolved per write so job output routing (which swaps sys.stdout) is honoured
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+    
+    def _format_duration(self, seconds: float) -> str:
+        seconds = int(seconds)
+        if seconds < 60:
+            return f"{seconds}s"
+        if seconds < 3600:
+            return f"{seconds // 60}m{seconds % 60:02d}s"
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
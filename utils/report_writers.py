@@ -0,0 +1,417 @@
+"""Incremental report writers.
+
+Each writer takes the report metadata, an iterator of findings and the module executions, and
+writes as it goes, so memory use does not grow with the number of findings. Findings may be raw
+dicts or ReportRows that were already normalized, which lets several writers share that work.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+FLUSH_EVERY = 1000
+CSV_FIELDS = ['type', 'target', 'parameter', 'payload', 'discovered_at']
+
+def open_report(filename: str, compress: bool = False, newline: str = None):
+    """Text stream for a report file, gzip-compressed when asked"""
+    # gzip, csv, zlib, html and xml.sax are imported where they are used; the console imports
+    # this module at startup and most sessions never write a report
+    if compress:
+        import gzip
+        return gzip.open(filename, 'wt', encoding='utf-8', newline=newline)
+    return open(filename, 'w', encoding='utf-8', newline=newline)
+
+def _flush_periodically(out, count: int):
+    if count % FLUSH_EVERY == 0:
+        out.flush()
+
+def _text(value: Any, default: str) -> str:
+    return default if value is None else str(value)
+
+class ReportRow:
+    """A finding with the display defaults applied and its JSON encoding done once"""
+    
+    __slots__ = ("type", "target", "parameter", "payload", "discovered_at", "severity", "occurrences", "json")
+    
+    def __init__(self, finding: Dict[str, Any]):
+        self.type = _text(finding.get('type'), 'Unknown')
+        self.target = _text(finding.get('target'), 'Unknown')
+        self.parameter = _text(finding.get('parameter'), 'N/A')
+        self.payload = _text(finding.get('payload'), 'N/A')
+        self.discovered_at = _text(finding.get('discovered_at'), 'Unknown')
+        self.severity = _text(finding.get('severity'), 'N/A')
+        self.occurrences = finding.get('occurrences') or 1
+        self.json = json.dumps(finding, default=str)
+
+def as_rows(findings: Iterable[Any]) -> Iterator[ReportRow]:
+    for finding in findings:
+        yield finding if isinstance(finding, ReportRow) else ReportRow(finding)
+
+def write_json(out, meta: Dict[str, Any], findings: Iterable[Dict[str, Any]],
+               executions: List[Dict[str, Any]]):
+    """Same document as the old json.dump output, one array element per line"""
+    out.write("{\n")
+    for key in ("session_id", "start_time", "end_time", "targets"):
+        out.write(f"  {json.dumps(key)}: {json.dumps(meta[key], default=str)},\n")
+    out.write('  "vulnerabilities": [')
+    for count, row in enumerate(as_rows(findings), 1):
+        out.write(("," if count > 1 else "") + "\n    " + row.json)
+        _flush_periodically(out, count)
+    out.write('\n  ],\n  "modules_executed": [')
+    for count, execution in enumerate(executions, 1):
+        out.write(("," if count > 1 else "") + "\n    " + json.dumps(execution, default=str))
+    out.write("\n  ]\n}\n")
+
+def write_jsonl(out, meta: Dict[str, Any], findings: Iterable[Dict[str, Any]],
+                executions: List[Dict[str, Any]]):
+    out.write(json.dumps({"record": "session", **meta}, default=str) + "\n")
+    for count, row in enumerate(as_rows(findings), 1):
+        # Splice the tag into the already-encoded object rather than encoding it again
+        body = row.json[1:] if row.json == "{}" else ", " + row.json[1:]
+        out.write('{"record": "vulnerability"' + body + "\n")
+        _flush_periodically(out, count)
+    for execution in executions:
+        out.write(json.dumps({"record": "module_execution", **execution}, default=str) + "\n")
+
+def write_csv(out, meta: Dict[str, Any], findings: Iterable[Dict[str, Any]],
+              executions: List[Dict[str, Any]]):
+    writer = None
+    for count, row in enumerate(as_rows(findings), 1):
+        # No header for an empty report, as before
+        if writer is None:
+            import csv
+            writer = csv.writer(out)
+            writer.writerow(CSV_FIELDS)
+        writer.writerow((row.type, row.target, row.parameter, row.payload, row.discovered_at))
+        _flush_periodically(out, count)
+
+def write_xml(out, meta: Dict[str, Any], findings: Iterable[Dict[str, Any]],
+              executions: List[Dict[str, Any]]):
+    from xml.sax.saxutils import XMLGenerator
+    xml = XMLGenerator(out, encoding='utf-8', short_empty_elements=True)
+    
+    def element(name: str, text: str):
+        xml.startElement(name, {})
+        xml.characters(text)
+        xml.endElement(name)
+    
+    xml.startDocument()
+    xml.startElement("kotosploit_scan", {})
+    xml.startElement("session", {})
+    element("id", meta["session_id"])
+    element("start_time", meta["start_time"])
+    element("end_time", meta["end_time"] or "In Progress")
+    xml.endElement("session")
+    
+    xml.startElement("targets", {})
+    for target in meta["targets"]:
+        element("target", target)
+    xml.endElement("targets")
+    
+    xml.startElement("vulnerabilities", {})
+    for count, row in enumerate(as_rows(findings), 1):
+        xml.startElement("vulnerability", {})
+        element("type", row.type)
+        element("target", row.target)
+        element("parameter", row.parameter)
+        element("payload", row.payload)
+        element("discovered_at", row.discovered_at)
+        xml.endElement("vulnerability")
+        _flush_periodically(out, count)
+    xml.endElement("vulnerabilities")
+    xml.endElement("kotosploit_scan")
+    xml.endDocument()
+
+HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Kotosploit Security Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+        .header {{ background-color: #d32f2f; color: white; padding: 20px; border-radius: 5px; }}
+        .section {{ background-color: white; margin: 20px 0; padding: 20px; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
+        table {{ width: 100%; border-collapse: collapse; }}
+        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
+        th {{ background-color: #f44336; color: white; }}
+        .vuln {{ background-color: #ffebee; }}
+        .success {{ background-color: #e8f5e9; }}
+        .cat {{ font-family: monospace; white-space: pre; }}
+        .controls {{ display: flex; gap: 10px; align-items: center; margin-bottom: 10px; flex-wrap: wrap; }}
+        .controls input {{ flex: 1; min-width: 240px; padding: 6px; }}
+        .grid {{ display: grid; grid-template-columns: 16% 28% 10% 22% 7% 5% 12%; }}
+        .grid span {{ padding: 8px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
+        .grid-header {{ background-color: #f44336; color: white; font-weight: bold; }}
+        .viewport {{ height: 600px; overflow-y: auto; position: relative; border-bottom: 1px solid #ddd; }}
+        .viewport .grid {{ position: absolute; left: 0; right: 0; height: 34px; box-sizing: border-box;
+                           border-bottom: 1px solid #ddd; background-color: #ffebee; }}
+        .status {{ color: #666; margin: 10px 0; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🐱 Kotosploit Security Scan Report</h1>
+        <p>Session ID: {session_id}</p>
+        <p>Start Time: {start_time}</p>
+        <p>End Time: {end_time}</p>
+    </div>
+    
+    <div class="section">
+        <h2>📊 Summary</h2>
+        <p><strong>Targets Scanned:</strong> {targets}</p>
+        <p><strong>Vulnerabilities Found:</strong> <span id="vulnerability-count">…</span></p>
+        <p><strong>Modules Executed:</strong> {executions}</p>
+    </div>
+    
+    <div class="section">
+        <h2>🎯 Targets</h2>
+        <ul>
+"""
+
+HTML_BODY = """        </ul>
+    </div>
+    
+    <div class="section">
+        <h2>🔓 Vulnerabilities</h2>
+        <noscript><p>This report renders its findings with JavaScript; use the JSON or CSV report instead.</p></noscript>
+        <div class="controls">
+            <input id="filter" type="search" placeholder="Filter by type, target, parameter or payload">
+            <select id="type-filter"><option value="">All types</option></select>
+            <select id="page-size">
+                <option value="100">100 / page</option>
+                <option value="1000" selected>1000 / page</option>
+                <option value="10000">10000 / page</option>
+            </select>
+            <button id="prev">&lsaquo; Prev</button>
+            <span id="page-info"></span>
+            <button id="next">Next &rsaquo;</button>
+        </div>
+        <div class="grid grid-header">
+            <span>Type</span><span>Target</span><span>Parameter</span><span>Payload</span>
+            <span>Severity</span><span>Hits</span><span>Discovered At</span>
+        </div>
+        <div id="viewport" class="viewport"><div id="canvas"></div></div>
+        <p id="status" class="status">Loading findings…</p>
+    </div>
+    
+    <div class="section">
+        <h2>📝 Module Executions</h2>
+        <table id="executions">
+            <tr>
+                <th>Module</th>
+                <th>Target</th>
+                <th>Status</th>
+                <th>Timestamp</th>
+            </tr>
+        </table>
+    </div>
+    
+    <div class="section">
+        <p style="text-align: center; color: #666;">
+            Generated by Kotosploit Framework<br>
+            For authorized security testing only
+        </p>
+    </div>
+    <script id="report-data" type="application/octet-stream">"""
+
+# Findings are embedded as gzip-compressed, base64-encoded JSON and only the rows in view are
+# turned into DOM nodes, so the page stays small and quick to open however many findings it holds
+HTML_SCRIPT = """</script>
+    <script>
+    (function () {
+        var ROW_HEIGHT = 34;
+        var OVERSCAN = 10;
+        var state = { findings: [], search: [], filtered: [], page: 0, pageSize: 1000 };
+        var viewport = document.getElementById("viewport");
+        var canvas = document.getElementById("canvas");
+        var status = document.getElementById("status");
+        
+        function decode(text) {
+            var binary = atob(text);
+            var bytes = new Uint8Array(binary.length);
+            for (var i = 0; i < binary.length; i++) {
+                bytes[i] = binary.charCodeAt(i);
+            }
+            var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+            return new Response(stream).json();
+        }
+        
+        function pageCount() {
+            return Math.max(1, Math.ceil(state.filtered.length / state.pageSize));
+        }
+        
+        function pageRows() {
+            var start = state.page * state.pageSize;
+            return Math.max(0, Math.min(state.pageSize, state.filtered.length - start));
+        }
+        
+        function cell(text) {
+            var span = document.createElement("span");
+            span.textContent = text;
+            span.title = text;
+            return span;
+        }
+        
+        function draw() {
+            var rows = pageRows();
+            var first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            var last = Math.min(rows, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+            var offset = state.page * state.pageSize;
+            var fragment = document.createDocumentFragment();
+            for (var i = first; i < last; i++) {
+                // [type, target, parameter, payload, discovered_at, severity, occurrences]
+                var finding = state.findings[state.filtered[offset + i]];
+                var row = document.createElement("div");
+                row.className = "grid";
+                row.style.top = (i * ROW_HEIGHT) + "px";
+                [finding[0], finding[1], finding[2], finding[3], finding[5], String(finding[6]), finding[4]]
+                    .forEach(function (value) { row.appendChild(cell(value)); });
+                fragment.appendChild(row);
+            }
+            canvas.replaceChildren(fragment);
+        }
+        
+        function showPage() {
+            canvas.style.height = (pageRows() * ROW_HEIGHT) + "px";
+            viewport.scrollTop = 0;
+            document.getElementById("page-info").textContent = "Page " + (state.page + 1) + " of " + pageCount();
+            status.textContent = state.filtered.length + " of " + state.findings.length + " findings";
+            draw();
+        }
+        
+        function applyFilter() {
+            var needle = document.getElementById("filter").value.toLowerCase();
+            var type = document.getElementById("type-filter").value;
+            state.filtered = [];
+            for (var i = 0; i < state.findings.length; i++) {
+                if ((!type || state.findings[i][0] === type) && (!needle || state.search[i].indexOf(needle) !== -1)) {
+                    state.filtered.push(i);
+                }
+            }
+            state.page = 0;
+            showPage();
+        }
+        
+        function showExecutions(executions) {
+            var table = document.getElementById("executions");
+            executions.forEach(function (execution) {
+                var row = table.insertRow();
+                [execution[0], execution[1], execution[2] ? "✓" : "✗", execution[3]].forEach(function (value) {
+                    row.insertCell().textContent = value;
+                });
+            });
+        }
+        
+        var scheduled = false;
+        viewport.addEventListener("scroll", function () {
+            if (!scheduled) {
+                scheduled = true;
+                requestAnimationFrame(function () { scheduled = false; draw(); });
+            }
+        });
+        
+        var timer = null;
+        document.getElementById("filter").addEventListener("input", function () {
+            clearTimeout(timer);
+            timer = setTimeout(applyFilter, 150);
+        });
+        document.getElementById("type-filter").addEventListener("change", applyFilter);
+        document.getElementById("page-size").addEventListener("change", function (event) {
+            state.pageSize = parseInt(event.target.value, 10);
+            state.page = 0;
+            showPage();
+        });
+        document.getElementById("prev").addEventListener("click", function () {
+            if (state.page > 0) { state.page--; showPage(); }
+        });
+        document.getElementById("next").addEventListener("click", function () {
+            if (state.page < pageCount() - 1) { state.page++; showPage(); }
+        });
+        
+        if (typeof DecompressionStream === "undefined") {
+            status.textContent = "This browser cannot read the embedded findings; use the JSON or CSV report.";
+            return;
+        }
+        decode(document.getElementById("report-data").textContent.trim()).then(function (data) {
+            state.findings = data.findings;
+            state.search = data.findings.map(function (finding) {
+                return (finding[0] + "\\n" + finding[1] + "\\n" + finding[2] + "\\n" + finding[3]).toLowerCase();
+            });
+            document.getElementById("vulnerability-count").textContent = data.findings.length;
+            var types = Array.from(new Set(data.findings.map(function (finding) { return finding[0]; }))).sort();
+            var select = document.getElementById("type-filter");
+            types.forEach(function (type) { select.add(new Option(type, type)); });
+            showExecutions(data.executions);
+            applyFilter();
+        }).catch(function (error) {
+            status.textContent = "Could not load findings: " + error;
+        });
+    })();
+    </script>
+</body>
+</html>
+"""
+
+class _EmbeddedData:
+    """Writes text into the page as gzip-compressed base64, a chunk at a time"""
+    
+    def __init__(self, out):
+        import base64
+        import zlib
+        self.out = out
+        self.encode = base64.b64encode
+        self.compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        self.pending = b""
+    
+    def write(self, text: str):
+        self._emit(self.compressor.compress(text.encode('utf-8')))
+    
+    def close(self):
+        self._emit(self.compressor.flush(), final=True)
+    
+    def _emit(self, data: bytes, final: bool = False):
+        # base64 chunks only concatenate cleanly on 3-byte boundaries
+        data = self.pending + data
+        cut = len(data) if final else len(data) - len(data) % 3
+        if cut:
+            self.out.write(self.encode(data[:cut]).decode('ascii'))
+        self.pending = data[cut:]
+
+def write_html(out, meta: Dict[str, Any], findings: Iterable[Dict[str, Any]],
+               executions: List[Dict[str, Any]]):
+    from html import escape
+    out.write(HTML_HEAD.format(
+        session_id=escape(meta["session_id"]),
+        start_time=escape(meta["start_time"]),
+        end_time=escape(meta["end_time"] or "In Progress"),
+        targets=len(meta["targets"]),
+        executions=len(executions)
+    ))
+    for target in meta["targets"]:
+        out.write(f"            <li>{escape(str(target))}</li>\n")
+    out.write(HTML_BODY)
+    
+    data = _EmbeddedData(out)
+    data.write('{"findings":[')
+    for count, row in enumerate(as_rows(findings), 1):
+        record = [row.type, row.target, row.parameter, row.payload, row.discovered_at, row.severity, row.occurrences]
+        data.write(("," if count > 1 else "") + json.dumps(record, default=str))
+        _flush_periodically(out, count)
+    data.write('],"executions":')
+    data.write(json.dumps([
+        [_text(execution.get('module'), 'Unknown'), _text(execution.get('target'), 'Unknown'),
+         bool((execution.get('result') or {}).get('success')), _text(execution.get('timestamp'), 'Unknown')]
+        for execution in executions
+    ]))
+    data.write('}')
+    data.close()
+    out.write(HTML_SCRIPT)
+
+# Format -> (writer, label, file extension)
+WRITERS = {
+    "json": (write_json, "JSON", "json"),
+    "jsonl": (write_jsonl, "JSONL", "jsonl"),
+    "csv": (write_csv, "CSV", "csv"),
+    "xml": (write_xml, "XML", "xml"),
+    "html": (write_html, "HTML", "html"),
+}
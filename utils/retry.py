@@ -0,0 +1,84 @@
+"""Retry backoff policy and per-host circuit breaker"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+class RetryPolicy:
+    def __init__(self, attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.attempts = max(0, int(attempts))
+        self.base_delay = float(base_delay)
+        self.max_delay = max_delay
+    
+    def delay(self, attempt: int) -> float:
+        """Exponential backoff with equal jitter so concurrent workers don't retry in lockstep"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures: Dict[str, int] = {}
+        self.opened_at: Dict[str, float] = {}
+        self.probing = set()
+        self._lock = threading.Lock()
+    
+    def state(self, host: str) -> str:
+        with self._lock:
+            return self._state(host)
+    
+    def _state(self, host: str) -> str:
+        if host not in self.opened_at:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at[host] < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+    
+    def allow(self, host: str) -> bool:
+        """Closed hosts pass; a half-open host lets exactly one probe request through"""
+        with self._lock:
+            state = self._state(host)
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and host not in self.probing:
+                self.probing.add(host)
+                return True
+            return False
+    
+    def retry_in(self, host: str) -> Optional[float]:
+        with self._lock:
+            if host not in self.opened_at:
+                return None
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at[host]))
+    
+    def record_success(self, host: str):
+        with self._lock:
+            self.failures.pop(host, None)
+            self.opened_at.pop(host, None)
+            self.probing.discard(host)
+    
+    def record_failure(self, host: str) -> Optional[int]:
+        """Count a failure; returns the consecutive failure count when this failure opens the circuit"""
+        with self._lock:
+            failures = self.failures[host] = self.failures.get(host, 0) + 1
+            if host in self.probing:
+                self.probing.discard(host)
+                self.opened_at[host] = time.monotonic()
+                return failures
+            if host not in self.opened_at and failures >= self.failure_threshold:
+                self.opened_at[host] = time.monotonic()
+                return failures
+            return None
+    
+    def release(self, host: str):
+        """Give back a half-open probe that ended without a verdict (interrupted, or an error that
+        says nothing about the host), so the next request can probe instead of being refused forever"""
+        with self._lock:
+            self.probing.discard(host)
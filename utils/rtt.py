@@ -0,0 +1,51 @@
+"""Per-host round-trip time estimation and timeout tuning"""
+
+import threading
+from collections import deque
+from typing import Dict, Deque
+
+class RTTEstimator:
+    def __init__(self, window: int = 64, min_samples: int = 5, percentile: float = 0.95,
+                 multiplier: float = 4.0, connect_floor: float = 0.25, response_floor: float = 1.0):
+        self.window = window
+        self.min_samples = min_samples
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.connect_floor = connect_floor
+        self.response_floor = response_floor
+        self.connect_samples: Dict[str, Deque[float]] = {}
+        self.response_samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+    
+    def record_connect(self, host: str, seconds: float):
+        self._record(self.connect_samples, host, seconds)
+    
+    def record_response(self, host: str, seconds: float):
+        self._record(self.response_samples, host, seconds)
+    
+    def connect_timeout(self, host: str, upper: float) -> float:
+        return self._timeout(self.connect_samples, host, upper, self.connect_floor)
+    
+    def response_timeout(self, host: str, upper: float) -> float:
+        return self._timeout(self.response_samples, host, upper, self.response_floor)
+    
+    def _record(self, samples: Dict[str, Deque[float]], host: str, seconds: float):
+        with self._lock:
+            if host not in samples:
+                samples[host] = deque(maxlen=self.window)
+            samples[host].append(seconds)
+    
+    def _timeout(self, samples: Dict[str, Deque[float]], host: str, upper: float, floor: float) -> float:
+        """Scale the rolling percentile of observed latency, never exceeding the user's timeout"""
+        with self._lock:
+            window = sorted(samples.get(host, ()))
+        if len(window) < self.min_samples:
+            return upper
+        estimate = window[int(self.percentile * (len(window) - 1))] * self.multiplier
+        return min(upper, max(floor, estimate))
+
+
+_estimator = RTTEstimator()
+
+def get_estimator() -> RTTEstimator:
+    return _estimator
@@ -1,36 +1,182 @@
 """Session management for Kotosploit"""
 
-import pickle
+import json
 import os
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from colorama import Fore, Style
+from utils.dedup import FindingSet
+
+JOURNAL_VERSION = 1
+SESSION_EXTENSION = ".ktj"
+# Pickled sessions written before the journal format; only read by an explicit convert_session()
+LEGACY_EXTENSION = ".kts"
+
+# Journal records that append to one of the session's lists
+LIST_RECORDS = {
+    "module": "modules_used",
+    "result": "results",
+    "note": "notes",
+}
+
+def _new_session(session_id: str = None, start_time: str = None) -> Dict[str, Any]:
+    now = datetime.now()
+    return {
+        "id": session_id or now.strftime("%Y%m%d_%H%M%S_%f"),
+        "start_time": start_time or now.isoformat(),
+        "targets": [],
+        "modules_used": [],
+        "options": {},
+        "results": [],
+        "findings": [],
+        "notes": []
+    }
+
+def session_filename(name: str) -> str:
+    """Saved session names always carry the journal extension, so listing and diffing find them"""
+    return name if name.endswith(SESSION_EXTENSION) else f"{name}{SESSION_EXTENSION}"
+
+def _apply(session: Dict[str, Any], findings: FindingSet, op: str, data: Any):
+    if op in ("session", "snapshot"):
+        session.update({key: value for key, value in data.items() if key != "version"})
+        if "findings" in data:
+            findings.clear()
+            for finding in data["findings"]:
+                findings.add(finding)
+            session["findings"] = findings.values()
+    elif op == "finding":
+        # Repeat hits on the same issue are merged into the first one, keeping their payloads
+        finding, new = findings.add(data)
+        if new:
+            session["findings"].append(finding)
+    elif op == "target":
+        if data not in session["targets"]:
+            session["targets"].append(data)
+    elif op == "option":
+        session["options"][data["key"]] = data["value"]
+    elif op in LIST_RECORDS:
+        session[LIST_RECORDS[op]].append(data)
+
+def _replay(path: str) -> Tuple[Dict[str, Any], FindingSet]:
+    """Session contents and their merged findings, rebuilt from a journal"""
+    session = _new_session()
+    findings = FindingSet()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A partial last line left by a crash
+                    continue
+                _apply(session, findings, record.get("op"), record.get("data"))
+    except OSError:
+        pass
+    return session, findings
+
+def _header(session: Dict[str, Any]) -> Dict[str, Any]:
+    return {"op": "session", "data": {"id": session["id"], "start_time": session["start_time"],
+                                      "version": JOURNAL_VERSION}}
+
+def _write_snapshot(path: str, session: Dict[str, Any]):
+    """Replace path atomically with a journal holding the header and one snapshot record"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(_header(session)) + "\n")
+        f.write(json.dumps({"op": "snapshot", "data": session}, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_session(path: str) -> Dict[str, Any]:
+    """Contents of a session journal, without making it the current session"""
+    return _replay(path)[0]
 
 class SessionManager:
+    """Session state backed by an append-only JSON Lines journal.
+    
+    Each target, module run, result, finding and note is appended as it happens, so a crash
+    loses nothing and recording never rewrites the file. save_session() compacts the journal
+    into a single snapshot record; load_session() reads only the header and replays the rest
+    the first time the session contents are needed.
+    """
+    
     def __init__(self, session_dir: str = "./sessions"):
         self.session_dir = session_dir
-        self.current_session = {
-            "id": datetime.now().strftime("%Y%m%d_%H%M%S"),
-            "start_time": datetime.now().isoformat(),
-            "targets": [],
-            "modules_used": [],
-            "options": {},
-            "results": [],
-            "notes": []
-        }
+        self._lock = threading.RLock()
+        self._journal = None
+        self._start(_new_session())
         
         if not os.path.exists(session_dir):
             os.makedirs(session_dir)
     
+    def _start(self, session: Dict[str, Any], path: str = None, loaded: bool = True):
+        self._close_journal()
+        self._session = session
+        self._findings = FindingSet()
+        self._loaded = loaded
+        self.journal_path = path or os.path.join(self.session_dir, f"session_{session['id']}{SESSION_EXTENSION}")
+    
+    @property
+    def session_id(self) -> str:
+        # Known from the header, so this never triggers a replay
+        return self._session["id"]
+    
+    @property
+    def current_session(self) -> Dict[str, Any]:
+        with self._lock:
+            if not self._loaded:
+                self._session, self._findings = _replay(self.journal_path)
+                self._loaded = True
+            return self._session
+    
+    def _append(self, op: str, data: Any):
+        record = json.dumps({"op": op, "data": data}, default=str)
+        with self._lock:
+            # The journal file is only created once there is something to record
+            if self._journal is None:
+                exists = os.path.exists(self.journal_path)
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+                if not exists:
+                    self._journal.write(json.dumps(_header(self._session)) + "\n")
+                elif not self._ends_with_newline(self.journal_path):
+                    # Terminate a record torn by a crash so the next one starts on its own line
+                    self._journal.write("\n")
+            self._journal.write(record + "\n")
+            self._journal.flush()
+            if self._loaded:
+                _apply(self._session, self._findings, op, json.loads(record)["data"])
+    
+    def _ends_with_newline(self, path: str) -> bool:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    def _close_journal(self):
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+    
     def save_session(self, session_name: str = None) -> str:
-        if not session_name:
-            session_name = f"session_{self.current_session['id']}.kts"
-        
-        filepath = os.path.join(self.session_dir, session_name)
+        """Compact the journal into one snapshot record, optionally under a new name"""
+        filepath = (os.path.join(self.session_dir, session_filename(session_name)) if session_name
+                    else self.journal_path)
         
         try:
-            with open(filepath, 'wb') as f:
-                pickle.dump(self.current_session, f)
+            with self._lock:
+                session = self.current_session
+                self._close_journal()
+                _write_snapshot(filepath, session)
+                # Naming the unnamed working journal moves it; sessions saved under a name are kept
+                if filepath != self.journal_path and os.path.basename(self.journal_path) == \
+                        f"session_{session['id']}{SESSION_EXTENSION}" and os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+                self.journal_path = filepath
             print(f"{Fore.GREEN}[+] Session saved: {filepath}{Style.RESET_ALL}")
             return filepath
         except Exception as e:
@@ -38,83 +184,122 @@ class SessionManager:
             return None
     
     def load_session(self, session_name: str) -> bool:
-        filepath = os.path.join(self.session_dir, session_name)
+        filepath = os.path.join(self.session_dir, session_filename(session_name))
+        legacy_path = self._legacy_path(session_name)
+        
+        if not os.path.exists(filepath) and os.path.exists(legacy_path):
+            print(f"{Fore.YELLOW}[*] {legacy_path} is a legacy pickle session and can't be loaded directly. "
+                  f"Convert it with 'session convert {session_name}' (only for files you trust: "
+                  f"converting unpickles it){Style.RESET_ALL}")
+            return False
         
         if not os.path.exists(filepath):
             print(f"{Fore.RED}[!] Session file not found: {filepath}{Style.RESET_ALL}")
             return False
         
         try:
-            with open(filepath, 'rb') as f:
-                self.current_session = pickle.load(f)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline())
+            if header.get("op") != "session":
+                raise ValueError("not a session journal")
+            data = header["data"]
+            # Records after the header are replayed on first access; new ones append to this file
+            self._start(_new_session(data["id"], data["start_time"]), filepath, loaded=False)
             print(f"{Fore.GREEN}[+] Session loaded: {filepath}{Style.RESET_ALL}")
             return True
         except Exception as e:
             print(f"{Fore.RED}[!] Error loading session: {e}{Style.RESET_ALL}")
             return False
     
+    def _legacy_path(self, session_name: str) -> str:
+        name = session_name[:-len(SESSION_EXTENSION)] if session_name.endswith(SESSION_EXTENSION) else session_name
+        return os.path.join(self.session_dir, name if name.endswith(LEGACY_EXTENSION) else f"{name}{LEGACY_EXTENSION}")
+    
+    def convert_session(self, session_name: str) -> Optional[str]:
+        """Rewrite a legacy pickle session as a journal next to it; the current session is unchanged"""
+        legacy_path = self._legacy_path(session_name)
+        filepath = legacy_path[:-len(LEGACY_EXTENSION)] + SESSION_EXTENSION
+        if not os.path.exists(legacy_path):
+            print(f"{Fore.RED}[!] Legacy session not found: {legacy_path}{Style.RESET_ALL}")
+            return None
+        
+        try:
+            import pickle
+            with open(legacy_path, 'rb') as f:
+                data = pickle.load(f)
+            session = _new_session(str(data.get("id") or ""), data.get("start_time"))
+            session.update({key: value for key, value in data.items() if key in session})
+            _write_snapshot(filepath, session)
+            print(f"{Fore.GREEN}[+] Session converted: {filepath}{Style.RESET_ALL}")
+            return filepath
+        except Exception as e:
+            print(f"{Fore.RED}[!] Error converting session: {e}{Style.RESET_ALL}")
+            return None
+    
     def list_sessions(self):
         sessions = []
-        for filename in os.listdir(self.session_dir):
-            if filename.endswith('.kts'):
+        for filename in sorted(os.listdir(self.session_dir)):
+            if filename.endswith((SESSION_EXTENSION, LEGACY_EXTENSION)):
                 filepath = os.path.join(self.session_dir, filename)
                 sessions.append({
                     "name": filename,
                     "path": filepath,
                     "size": os.path.getsize(filepath),
-                    "modified": datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat()
+                    "modified": datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat(),
+                    "legacy": filename.endswith(LEGACY_EXTENSION)
                 })
         return sessions
     
     def add_target(self, target: str):
-        if target not in self.current_session["targets"]:
-            self.current_session["targets"].append(target)
+        with self._lock:
+            if self._loaded and target in self._session["targets"]:
+                return
+            self._append("target", target)
     
     def add_module_usage(self, module: str, options: Dict[str, Any]):
-        self.current_session["modules_used"].append({
+        self._append("module", {
             "module": module,
             "options": options,
             "timestamp": datetime.now().isoformat()
         })
     
     def add_result(self, module: str, result: Dict[str, Any]):
-        self.current_session["results"].append({
+        self._append("result", {
             "module": module,
             "result": result,
             "timestamp": datetime.now().isoformat()
         })
     
+    def add_finding(self, finding: Dict[str, Any]):
+        self._append("finding", finding)
+    
     def add_note(self, note: str):
-        self.current_session["notes"].append({
+        self._append("note", {
             "note": note,
             "timestamp": datetime.now().isoformat()
         })
     
     def set_option(self, key: str, value: Any):
-        self.current_session["options"][key] = value
+        self._append("option", {"key": key, "value": value})
     
     def get_option(self, key: str, default: Any = None) -> Any:
         return self.current_session["options"].get(key, default)
     
     def clear_session(self):
-        self.current_session = {
-            "id": datetime.now().strftime("%Y%m%d_%H%M%S"),
-            "start_time": datetime.now().isoformat(),
-            "targets": [],
-            "modules_used": [],
-            "options": {},
-            "results": [],
-            "notes": []
-        }
+        # The old journal stays on disk; recording continues in a new one
+        self._start(_new_session())
         print(f"{Fore.GREEN}[+] Session cleared{Style.RESET_ALL}")
     
     def show_session_info(self):
+        session = self.current_session
         print(f"\n{Fore.YELLOW}Current Session Information{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Session ID: {self.current_session['id']}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Start Time: {self.current_session['start_time']}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Targets: {len(self.current_session['targets'])}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Modules Used: {len(self.current_session['modules_used'])}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Results Recorded: {len(self.current_session['results'])}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Notes: {len(self.current_session['notes'])}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Session ID: {session['id']}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Start Time: {session['start_time']}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Journal: {self.journal_path}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Targets: {len(session['targets'])}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Modules Used: {len(session['modules_used'])}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Results Recorded: {len(session['results'])}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Findings: {len(session['findings'])}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Notes: {len(session['notes'])}{Style.RESET_ALL}")
         print(f"{Fore.WHITE}{'='*60}{Style.RESET_ALL}\n")
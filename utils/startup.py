@@ -0,0 +1,88 @@
+"""Startup cost report built on python -X importtime"""
+
+import os
+import re
+import subprocess
+import sys
+from typing import Any, Dict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+CONSOLE_STARTUP = (
+    "from core.console import KotosploitConsole\n"
+    "KotosploitConsole()\n"
+)
+
+MODULE_STARTUP = (
+    "from core.module_loader import ModuleLoader\n"
+    "ModuleLoader().get_module({module_path!r})\n"
+)
+
+def _run_importtime(code: str, cwd: str = None):
+    # Run from the caller's directory, as the console would be, so its cache and sessions land there
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd or os.getcwd(), env=env, capture_output=True, text=True
+    )
+    elapsed_ms = None
+    imports = []
+    for line in proc.stderr.splitlines():
+        if line.startswith("startup: "):
+            elapsed_ms = float(line.split()[1])
+            continue
+        match = IMPORTTIME_LINE.match(line)
+        if match and not match.group(3):
+            self_us, cumulative_us, _, name = match.groups()
+            imports.append((name, int(cumulative_us) / 1000, int(self_us) / 1000))
+    return elapsed_ms, imports, proc
+
+def measure_startup(module_path: str = None, top: int = 10, cwd: str = None) -> Dict[str, Any]:
+    """Time a cold start of the console (or of loading one module) in a fresh interpreter.
+    
+    The interpreter runs in cwd (the current directory by default). Only top-level imports are
+    listed; each one's cumulative time includes what it pulled in.
+    """
+    code = MODULE_STARTUP.format(module_path=module_path) if module_path else CONSOLE_STARTUP
+    timed = (
+        "import time as _t\n"
+        "_start = _t.perf_counter()\n"
+        f"{code}"
+        "import sys as _s\n"
+        "_s.stderr.write(f'startup: {(_t.perf_counter() - _start) * 1000:.3f}\\n')\n"
+    )
+    # Modules the bare interpreter imports anyway (site, encodings, ...) are not counted
+    baseline = {name for name, _, _ in _run_importtime("pass", cwd)[1]}
+    elapsed_ms, imports, proc = _run_importtime(timed, cwd)
+    imports = [item for item in imports if item[0] not in baseline]
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return {
+        "target": module_path or "console",
+        "success": proc.returncode == 0 and elapsed_ms is not None,
+        "elapsed_ms": elapsed_ms,
+        "import_ms": round(sum(item[1] for item in imports), 3),
+        "top_imports": imports[:top],
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode else None
+    }
+
+def check_budget(budget_ms: float = None) -> int:
+    """Measure the console and every module against the startup budget; returns an exit code"""
+    from core.module_loader import ModuleLoader
+    from utils.config import Config
+    
+    budget_ms = budget_ms or Config().get("general.startup_budget_ms", 100)
+    failures = 0
+    for target in [None] + sorted(ModuleLoader().list_modules()):
+        report = measure_startup(target, top=3)
+        if not report["success"]:
+            failures += 1
+            print(f"FAIL  {report['target']:<28} {report['error']}")
+            continue
+        over = report["elapsed_ms"] > budget_ms
+        failures += over
+        heaviest = ", ".join(f"{name} {cumulative:.1f}ms" for name, cumulative, _ in report["top_imports"])
+        print(f"{'OVER' if over else 'OK':<5} {report['target']:<28} {report['elapsed_ms']:>7.1f} ms  ({heaviest})")
+    print(f"budget {budget_ms} ms: {failures} over budget")
+    return 1 if failures else 0
@@ -0,0 +1,119 @@
+"""Minimal DER certificate reader for certificates the ssl module won't decode (unverified peers)"""
+
+import ipaddress
+from typing import Any, Dict, List, Tuple
+
+# OpenSSL's long names, as getpeercert() reports them; anything else keeps its dotted OID
+NAME_ATTRIBUTES = {
+    "2.5.4.3": "commonName",
+    "2.5.4.4": "surname",
+    "2.5.4.5": "serialNumber",
+    "2.5.4.6": "countryName",
+    "2.5.4.7": "localityName",
+    "2.5.4.8": "stateOrProvinceName",
+    "2.5.4.9": "streetAddress",
+    "2.5.4.10": "organizationName",
+    "2.5.4.11": "organizationalUnitName",
+    "2.5.4.12": "title",
+    "2.5.4.15": "businessCategory",
+    "2.5.4.17": "postalCode",
+    "2.5.4.42": "givenName",
+    "2.5.4.97": "organizationIdentifier",
+    "0.9.2342.19200300.100.1.25": "domainComponent",
+    "1.2.840.113549.1.9.1": "emailAddress",
+}
+SUBJECT_ALT_NAME = "2.5.29.17"
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+def _element(data: bytes, pos: int) -> Tuple[int, int, int]:
+    """(tag, content start, content end) of the DER element at pos"""
+    tag = data[pos]
+    length = data[pos + 1]
+    start = pos + 2
+    if length & 0x80:
+        count = length & 0x7f
+        length = int.from_bytes(data[start:start + count], "big")
+        start += count
+    return tag, start, start + length
+
+def _children(data: bytes, start: int, end: int) -> List[Tuple[int, int, int]]:
+    items = []
+    while start < end:
+        item = _element(data, start)
+        items.append(item)
+        start = item[2]
+    return items
+
+def _oid(value: bytes) -> str:
+    parts = [value[0] // 40, value[0] % 40]
+    number = 0
+    for byte in value[1:]:
+        number = (number << 7) | (byte & 0x7f)
+        if not byte & 0x80:
+            parts.append(number)
+            number = 0
+    return ".".join(map(str, parts))
+
+def _string(tag: int, value: bytes) -> str:
+    if tag == 0x1e:
+        return value.decode("utf-16-be", "replace")
+    if tag == 0x14:
+        return value.decode("latin-1")
+    return value.decode("utf-8", "replace")
+
+def _name(data: bytes, start: int, end: int) -> tuple:
+    """A Name in getpeercert()'s shape: one tuple of (attribute, value) pairs per RDN"""
+    rdns = []
+    for _, set_start, set_end in _children(data, start, end):
+        pairs = []
+        for _, pair_start, pair_end in _children(data, set_start, set_end):
+            (_, oid_start, oid_end), (tag, value_start, value_end) = _children(data, pair_start, pair_end)[:2]
+            oid = _oid(data[oid_start:oid_end])
+            pairs.append((NAME_ATTRIBUTES.get(oid, oid), _string(tag, data[value_start:value_end])))
+        rdns.append(tuple(pairs))
+    return tuple(rdns)
+
+def _time(tag: int, value: bytes) -> str:
+    """UTCTime or GeneralizedTime in the format ssl.cert_time_to_seconds() reads"""
+    text = value.decode("ascii")
+    if tag == 0x17:
+        year = int(text[:2])
+        text = f"{2000 + year if year < 50 else 1900 + year}{text[2:]}"
+    return f"{MONTHS[int(text[4:6]) - 1]} {int(text[6:8]):2d} {text[8:10]}:{text[10:12]}:{text[12:14]} {text[:4]} GMT"
+
+def _alt_names(data: bytes, start: int, end: int) -> tuple:
+    names = []
+    _, seq_start, seq_end = _element(data, start)
+    for tag, value_start, value_end in _children(data, seq_start, seq_end):
+        value = data[value_start:value_end]
+        if tag == 0x82:
+            names.append(("DNS", value.decode("ascii", "replace")))
+        elif tag == 0x87 and len(value) in (4, 16):
+            names.append(("IP Address", str(ipaddress.ip_address(value))))
+    return tuple(names)
+
+def parse_certificate(der: bytes) -> Dict[str, Any]:
+    """Subject, issuer, validity and DNS/IP alt names of a DER certificate, keyed like getpeercert()"""
+    _, cert_start, cert_end = _element(der, 0)
+    _, tbs_start, tbs_end = _element(der, cert_start)
+    fields = _children(der, tbs_start, tbs_end)
+    if fields[0][0] == 0xa0:
+        # Explicit version; v1 certificates leave it out
+        fields = fields[1:]
+    _, issuer, validity, subject = fields[1:5]
+    not_before, not_after = _children(der, validity[1], validity[2])[:2]
+    cert = {
+        "subject": _name(der, subject[1], subject[2]),
+        "issuer": _name(der, issuer[1], issuer[2]),
+        "notBefore": _time(not_before[0], der[not_before[1]:not_before[2]]),
+        "notAfter": _time(not_after[0], der[not_after[1]:not_after[2]]),
+    }
+    for tag, start, end in fields[6:]:
+        if tag != 0xa3:
+            continue
+        _, ext_start, ext_end = _element(der, start)
+        for _, item_start, item_end in _children(der, ext_start, ext_end):
+            parts = _children(der, item_start, item_end)
+            if _oid(der[parts[0][1]:parts[0][2]]) == SUBJECT_ALT_NAME:
+                cert["subjectAltName"] = _alt_names(der, parts[-1][1], parts[-1][2])
+    return cert